@@ -0,0 +1,67 @@
+"""Compare converting a book to Zip through ``ArchiveReader`` in write mode and with ``libacbf.convert()``.
+
+Run from the root of the repository::
+
+    python benchmarks/convert.py [path/to/book]
+
+Without a path a 7Zip book is made from the sample images in a temporary directory.
+"""
+import sys
+import shutil
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf import ACBFBook, convert  # noqa: E402
+from libacbf.archivereader import ArchiveReader  # noqa: E402
+
+
+def make_book(path: Path) -> Path:
+    samples = Path(__file__).parent.parent / "tests/samples"
+    book_path = path / "book.cb7"
+    with ACBFBook(book_path, 'w', "SevenZip") as book:
+        for image in sorted(samples.glob("page*.jpg")):
+            book.data.add_data(image)
+            book.body.append_page(image.name)
+    return book_path
+
+
+def with_archive_reader(src: Path, dst: Path):
+    # Read every file into memory and write them through an ArchiveReader in write mode, which works in a temporary
+    # directory and packs it on close
+    with ArchiveReader(src) as source:
+        files = {x: source.read(x) for x in source.list_files()}
+    with ZipFile(dst, 'w'):
+        pass
+    with ArchiveReader(dst, 'w') as archive:
+        for name, contents in files.items():
+            archive.write(contents, name)
+
+
+def measure(function, src: Path, dst: Path) -> str:
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(src, dst)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return f"{elapsed * 1000:8.1f} ms, peak {peak / 2 ** 20:7.2f} MiB"
+
+
+def main():
+    with TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        src = Path(sys.argv[1]) if len(sys.argv) > 1 else make_book(tmp)
+        shutil.copy(src, tmp / ("source" + src.suffix))
+        src = tmp / ("source" + src.suffix)
+
+        print(f"ArchiveReader write mode {measure(with_archive_reader, src, tmp / 'book.cbz')}")
+        print(f"convert()                {measure(convert, src, tmp / 'converted.cbz')}")
+
+
+if __name__ == "__main__":
+    main()
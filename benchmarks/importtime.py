@@ -0,0 +1,50 @@
+"""Measure the cost of ``import libacbf`` with ``python -X importtime``.
+
+Backends (py7zr, rarfile, magic, requests, langcodes, dateutil) are imported on first use, so they should not show up
+here. Run from the root of the repository::
+
+    python benchmarks/importtime.py [runs]
+"""
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+root = Path(__file__).parent.parent
+
+backends = ("py7zr", "rarfile", "magic", "requests", "langcodes", "dateutil", "distutils")
+
+
+def import_time():
+    """Returns the cumulative import times in microseconds of ``libacbf`` and all modules it imports.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import libacbf"],
+                          cwd=root, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match is not None:
+            times[match.group(3)] = int(match.group(1))
+            # Children are listed before their parent. Drop modules imported by site and others before libacbf.
+            if len(match.group(2)) == 1 and match.group(3) != "libacbf":
+                times = {}
+    return times
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = [import_time() for _ in range(runs)]
+    best = min(results, key=lambda x: x["libacbf"])
+
+    print(f"import libacbf: {best['libacbf'] / 1000:.1f} ms (best of {runs})")
+    for name in sorted(best, key=best.get, reverse=True)[:10]:
+        print(f"  {name:<40} {best[name] / 1000:7.1f} ms")
+
+    loaded = [x for x in backends if x in best]
+    if loaded:
+        print(f"Backends imported eagerly: {', '.join(loaded)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare reading every page of a book with and without the shared language tag cache.
+
+Run from the root of the repository::
+
+    python benchmarks/langtags.py [path/to/book.cbz]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf import ACBFBook, langtags  # noqa: E402
+
+
+def read_book(path):
+    with ACBFBook(path) as book:
+        for page in book.body.pages:
+            page.text_layers
+        book.book_info.languages
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "tests/samples/Doctorow, Cory - Craphound-1.1.acbf"
+    number = 10
+
+    langtags.set_backend(langtags.default_backend, maxsize=0)
+    uncached = timeit.timeit(lambda: read_book(path), number=number)
+
+    langtags.set_backend(langtags.default_backend)
+    cached = timeit.timeit(lambda: read_book(path), number=number)
+    print(f"uncached {uncached / number * 1000:7.2f} ms, cached {cached / number * 1000:7.2f} ms "
+          f"({uncached / cached:.2f}x) {langtags.cache_info()}")
+
+    langtags.set_backend(None)
+    disabled = timeit.timeit(lambda: read_book(path), number=number)
+    print(f"disabled {disabled / number * 1000:7.2f} ms")
+    langtags.set_backend(langtags.default_backend)
+
+
+if __name__ == "__main__":
+    main()
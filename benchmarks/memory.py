@@ -0,0 +1,59 @@
+"""Measure the memory used by the page models of a book.
+
+Run from the root of the repository::
+
+    python benchmarks/memory.py [path/to/book]
+
+Defaults to the sample book in ``tests/samples``.
+
+Baseline from before the page, metadata and data models used ``__slots__``. It was measured by running this script
+unchanged against a checkout of the commit before that change, on the sample book with CPython 3.11::
+
+    23 pages, 151 frames, 546 text areas
+    before: Total: 398.5 KiB, per page: 17.33 KiB
+    after:  Total: 335.3 KiB, per page: 14.58 KiB
+
+Most of what remains is the text of the text areas.
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf import ACBFBook  # noqa: E402
+
+
+def load_pages(book: ACBFBook):
+    """Materialize every page with its frames, jumps and text layers.
+    """
+    pages = list(book.body.pages)
+    for page in pages:
+        page.frames, page.jumps, page.text_layers
+    return pages
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else \
+        Path(__file__).parent.parent / "tests/samples/Doctorow, Cory - Craphound-1.1.acbf"
+
+    with ACBFBook(path) as book:
+        book.book_info
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        pages = load_pages(book)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        size = sum(x.size_diff for x in after.compare_to(before, "filename"))
+
+        frames = sum(len(x.frames) for x in pages)
+        areas = sum(len(a.text_areas) for x in pages for a in x.text_layers.values())
+        print(f"{len(pages)} pages, {frames} frames, {areas} text areas")
+        print(f"Total: {size / 1024:.1f} KiB, per page: {size / len(pages) / 1024:.2f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare reading every page image with ``Page.image`` and with ``ACBFBook.iter_page_images()``.
+
+Run from the root of the repository::
+
+    python benchmarks/page_images.py [path/to/book]
+
+Without a path a 7Zip book is made from the sample images in a temporary directory.
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf import ACBFBook  # noqa: E402
+
+
+def make_book(path: Path) -> Path:
+    samples = Path(__file__).parent.parent / "tests/samples"
+    book_path = path / "book.cb7"
+    with ACBFBook(book_path, 'w', "SevenZip") as book:
+        for image in sorted(samples.glob("page*.jpg")):
+            book.data.add_data(image)
+            book.body.append_page(image.name)
+    return book_path
+
+
+def measure(path: Path, read) -> str:
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ACBFBook(path) as book:
+        size = read(book)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return f"{elapsed * 1000:8.1f} ms, peak {peak / 2 ** 20:7.2f} MiB, {size / 2 ** 20:.2f} MiB read"
+
+
+def page_image(book: ACBFBook) -> int:
+    return sum(len(x.image.data) for x in book.body.pages)
+
+
+def iter_images(order: str, prefetch: int):
+    def read(book: ACBFBook) -> int:
+        return sum(len(x.data) for _, x in book.iter_page_images(order, prefetch))
+    return read
+
+
+def main():
+    with TemporaryDirectory() as tmp:
+        path = Path(sys.argv[1]) if len(sys.argv) > 1 else make_book(Path(tmp))
+
+        print(f"Page.image                       {measure(path, page_image)}")
+        for order, prefetch in (("reading", 0), ("archive", 0), ("archive", 2)):
+            print(f"iter_page_images({order!r:>9}, {prefetch}) {measure(path, iter_images(order, prefetch))}")
+
+
+if __name__ == "__main__":
+    main()
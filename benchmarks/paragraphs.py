@@ -0,0 +1,61 @@
+"""Compare :func:`libacbf.helpers.tree_to_para` and :func:`libacbf.helpers.para_to_tree` with the previous regular
+expression implementations on the text areas of a book.
+
+Run from the root of the repository::
+
+    python benchmarks/paragraphs.py [path/to/book.acbf]
+
+Defaults to the sample book in ``tests/samples``.
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf.helpers import para_to_tree, tree_to_para  # noqa: E402
+
+
+def legacy_tree_to_para(p_root, nsmap):
+    pa = []
+    for p in p_root.findall("p", namespaces=nsmap):
+        p_text = etree.tostring(p, encoding="utf-8").decode("utf-8").strip()
+        text = re.sub(r'</?p[^>]*>', '', p_text)
+        pa.append(text)
+    return '\n'.join(pa)
+
+
+def legacy_para_to_tree(paragraph, nsmap):
+    ns = nsmap[None]
+    p_elements = []
+    for p in re.split(r'\n', paragraph):
+        p = f"<p>{p}</p>"
+        p_root = etree.fromstring(p)
+        for i in p_root.iter():
+            i.tag = f"{{{ns}}}" + i.tag
+        p_elements.append(p_root)
+    return p_elements
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else \
+        Path(__file__).parent.parent / "tests/samples/Doctorow, Cory - Craphound-1.1.acbf"
+    root = etree.parse(str(path)).getroot()
+    nsmap = root.nsmap
+    areas = list(root.iter(f"{{{nsmap[None]}}}text-area"))
+    texts = [tree_to_para(x, nsmap) for x in areas]
+
+    number = 20
+    for name, legacy, current, items in (("tree_to_para", legacy_tree_to_para, tree_to_para, areas),
+                                         ("para_to_tree", legacy_para_to_tree, para_to_tree, texts)):
+        old = min(timeit.repeat(lambda: [legacy(x, nsmap) for x in items], number=number, repeat=3))
+        new = min(timeit.repeat(lambda: [current(x, nsmap) for x in items], number=number, repeat=3))
+        print(f"{name} ({len(items)} text areas): legacy {old / number * 1000:7.2f} ms, "
+              f"current {new / number * 1000:7.2f} ms ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Compare :func:`libacbf.helpers.pts_to_vec` with the previous list of tuples implementation.
+
+Run from the root of the repository::
+
+    python benchmarks/points.py
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf.helpers import pts_to_vec  # noqa: E402
+
+
+def legacy_pts_to_vec(pts_str: str):
+    pts = []
+    pts_l = re.split(" ", pts_str)
+    for pt in pts_l:
+        ls = map(int, re.split(",", pt))
+        pts.append(tuple(ls))
+    return pts
+
+
+def main():
+    number = 20000
+    for count in (4, 8, 32, 128):
+        pts_str = ' '.join(f"{i * 13},{i * 7}" for i in range(count))
+        assert pts_to_vec(pts_str) == legacy_pts_to_vec(pts_str)
+
+        old = timeit.timeit(lambda: legacy_pts_to_vec(pts_str), number=number)
+        new = timeit.timeit(lambda: pts_to_vec(pts_str), number=number)
+        print(f"{count:>4} points: legacy {old / number * 1e6:7.2f} us, "
+              f"pts_to_vec {new / number * 1e6:7.2f} us ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
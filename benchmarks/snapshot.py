@@ -0,0 +1,51 @@
+"""Compare opening a book and reading all of its pages normally and from a snapshot.
+
+Run from the root of the repository::
+
+    python benchmarks/snapshot.py [path/to/book]
+
+Uses the sample book if no path is given.
+"""
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf import ACBFBook  # noqa: E402
+from libacbf.snapshot import SnapshotCache  # noqa: E402
+
+
+def read(book: ACBFBook) -> int:
+    areas = 0
+    for page in book.body.pages:
+        areas += sum(len(x.text_areas) for x in page.text_layers.values())
+        areas += len(page.frames)
+    book.close()
+    return areas
+
+
+def measure(open_book, runs: int = 20) -> str:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        read(open_book())
+        times.append(time.perf_counter() - start)
+    return f"best {min(times) * 1000:7.2f} ms, mean {sum(times) / runs * 1000:7.2f} ms"
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else \
+        Path(__file__).parent.parent / "tests/samples/Doctorow, Cory - Craphound-1.1.acbf"
+
+    with TemporaryDirectory() as tmp:
+        cache = SnapshotCache(tmp)
+        read(cache.open(path))
+
+        print(f"ACBFBook()            {measure(lambda: ACBFBook(path))}")
+        print(f"SnapshotCache.load()  {measure(lambda: cache.load(path))}")
+
+
+if __name__ == "__main__":
+    main()
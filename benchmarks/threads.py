@@ -0,0 +1,64 @@
+"""Measure how reading every file of one book from a shared ``ArchiveReader`` scales with the number of threads.
+
+Run from the root of the repository::
+
+    python benchmarks/threads.py [path/to/book]
+
+Without a path, Zip, 7Zip and Tar books with compressible pages are made in a temporary directory.
+"""
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile, ZIP_DEFLATED
+import tarfile as tar
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from libacbf.archivereader import ArchiveReader  # noqa: E402
+
+
+def make_books(path: Path):
+    # Uncompressed bitmaps so that decompression is the bulk of the work
+    files = {f"page{i:03}.bmp": bytes(range(256)) * (i + 4096) for i in range(24)}
+
+    with ZipFile(path / "book.cbz", 'w', ZIP_DEFLATED) as arc:
+        for name, contents in files.items():
+            arc.writestr(name, contents)
+
+    import py7zr
+    with py7zr.SevenZipFile(path / "book.cb7", 'w') as arc:
+        for name, contents in files.items():
+            arc.writestr(contents, name)
+
+    with tar.open(path / "book.cbt", "w:gz") as arc:
+        for name, contents in files.items():
+            info = tar.TarInfo(name)
+            info.size = len(contents)
+            arc.addfile(info, BytesIO(contents))
+
+    return [path / "book.cbz", path / "book.cb7", path / "book.cbt"]
+
+
+def measure(path: Path, threads: int) -> str:
+    with ArchiveReader(path) as archive:
+        names = sorted(archive.list_files())
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            size = sum(len(x) for x in executor.map(archive.read, names))
+        elapsed = time.perf_counter() - start
+    return f"{elapsed * 1000:8.1f} ms, {size / 2 ** 20 / elapsed:8.1f} MiB/s"
+
+
+def main():
+    with TemporaryDirectory() as tmp:
+        books = [Path(sys.argv[1])] if len(sys.argv) > 1 else make_books(Path(tmp))
+        for book in books:
+            for threads in (1, 2, 4, 8):
+                print(f"{book.name} {threads} threads {measure(book, threads)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure the throughput of ``ArchiveReader.verify()`` against reading every file with ``read()``.
+
+Run from the root of the repository::
+
+    python benchmarks/verify.py [path/to/book]
+
+Without a path, Zip, 7Zip and Tar books with compressible pages are made in a temporary directory.
+"""
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from threads import make_books  # noqa: E402
+from libacbf.archivereader import ArchiveReader  # noqa: E402
+
+
+def read_all(archive: ArchiveReader):
+    for name in archive.list_files():
+        archive.read(name)
+
+
+def measure(path: Path, function) -> str:
+    with ArchiveReader(path) as archive:
+        size = sum(x.size for x in archive.list_members())
+        start = time.perf_counter()
+        function(archive)
+        elapsed = time.perf_counter() - start
+    return f"{elapsed * 1000:8.1f} ms, {size / 2 ** 20 / elapsed:8.1f} MiB/s"
+
+
+def main():
+    with TemporaryDirectory() as tmp:
+        books = [Path(sys.argv[1])] if len(sys.argv) > 1 else make_books(Path(tmp))
+        for book in books:
+            print(f"{book.name} {'read()':<10} {measure(book, read_all)}")
+            for workers in (1, 4):
+                print(f"{book.name} {f'verify({workers})':<10} {measure(book, lambda x: x.verify(workers))}")
+
+
+if __name__ == "__main__":
+    main()
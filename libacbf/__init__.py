@@ -1 +1,2 @@
-from .libacbf import ACBFBook, get_book_template
+from .libacbf import ACBFBook, get_book_template, get_cover
+from .transcode import convert
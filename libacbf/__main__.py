@@ -0,0 +1,5 @@
+import sys
+
+from libacbf.cli import main
+
+sys.exit(main())
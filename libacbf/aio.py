@@ -0,0 +1,192 @@
+"""An asyncio interface to books.
+
+Opening, reading images and closing a book are blocking operations. :class:`AsyncACBFBook` runs them in an executor so
+the event loop is not blocked. Images referenced by URL are downloaded with ``aiohttp`` if it is installed, which can be
+done with ``pip install libacbf[aio]``. Otherwise they are downloaded with ``requests`` in the executor.
+
+Examples
+--------
+::
+
+    from libacbf.aio import AsyncACBFBook
+
+    async def read(path):
+        async with await AsyncACBFBook.open(path) as book:
+            print(book.book_info.book_title)
+
+            cover = await book.coverpage.aimage()
+            async for page in book:
+                image = await page.aimage()
+
+            # Load several pages at the same time
+            images = await asyncio.gather(*(x.aimage() for x in await book.pages()))
+
+The executor can be any ``concurrent.futures.Executor`` that runs in the same process such as a
+``ThreadPoolExecutor``. The default executor of the event loop is used if none is given.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from functools import lru_cache, partial
+from pathlib import Path
+from concurrent.futures import Executor
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, List, Literal, Optional, TypeVar, Union
+
+import libacbf.constants as consts
+from libacbf.libacbf import ACBFBook
+from libacbf.bookdata import BookData
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from libacbf.body import Page
+
+T = TypeVar("T")
+
+
+class AsyncPage:
+    """Wraps a :class:`Page <libacbf.body.Page>` of an :class:`AsyncACBFBook`. All attributes of the page can be used
+    directly.
+
+    Attributes
+    ----------
+    page : Page
+        The wrapped page.
+    """
+
+    def __init__(self, page: Page, book: AsyncACBFBook):
+        self.page: Page = page
+        self._abook = book
+
+    def __getattr__(self, name: str):
+        return getattr(self.page, name)
+
+    def __repr__(self):
+        return f"<libacbf.aio.AsyncPage href={self.page.image_ref}>"
+
+    async def aimage(self) -> BookData:
+        """Same as :attr:`Page.image <libacbf.body.Page.image>` without blocking the event loop. The image is cached in
+        the page like :attr:`Page.image <libacbf.body.Page.image>`.
+        """
+        page = self.page
+        if page._image is not None:
+            return page._image
+
+        book = self._abook
+        if page.ref_type == consts.ImageRefType.URL and _has_aiohttp():
+            contents = await book._download(page.image_ref)
+            image = await book.run(page._read_image, contents)
+        else:
+            image = await book.run(page._read_image)
+
+        page._image = image
+        return image
+
+
+class AsyncACBFBook:
+    """An :class:`ACBFBook <libacbf.ACBFBook>` that can be used from asyncio code. Create it with :meth:`open()`.
+
+    Sections of the book (``book_info``, ``body`` etc.) and other attributes of the book can be used directly. Pages
+    are returned as :class:`AsyncPage` objects by :meth:`pages()`, :attr:`coverpage` and ``async for``.
+
+    Attributes
+    ----------
+    book : ACBFBook
+        The wrapped book.
+
+    executor : concurrent.futures.Executor | None
+        Executor that blocking operations run in. ``None`` means the default executor of the event loop.
+
+    session : aiohttp.ClientSession | None
+        Session used to download images referenced by URL. A new session is made for each download if ``None``.
+    """
+
+    def __init__(self, book: ACBFBook, executor: Optional[Executor] = None, session: Optional[ClientSession] = None):
+        self.book: ACBFBook = book
+        self.executor: Optional[Executor] = executor
+        self.session: Optional[ClientSession] = session
+
+    @classmethod
+    async def open(cls, file: Union[str, Path, IO], mode: Literal['r', 'w', 'a', 'x'] = 'r',
+                   archive_type: Optional[str] = "Zip", languages: Optional[Iterable[str]] = None,
+                   metadata_only: bool = False, executor: Optional[Executor] = None,
+                   session: Optional[ClientSession] = None) -> AsyncACBFBook:
+        """Open a book in an executor. Opening parses and validates the XML, and in write mode extracts the archive.
+
+        Parameters
+        ----------
+        file, mode, archive_type, languages, metadata_only
+            Same as :class:`ACBFBook <libacbf.ACBFBook>`.
+
+        executor : concurrent.futures.Executor, optional
+            Executor to run blocking operations of this book in. Uses the default executor of the event loop if not
+            given.
+
+        session : aiohttp.ClientSession, optional
+            Session to download images referenced by URL with.
+        """
+        loop = asyncio.get_running_loop()
+        book = await loop.run_in_executor(executor, partial(ACBFBook, file, mode, archive_type, languages,
+                                                            metadata_only))
+        return cls(book, executor, session)
+
+    def __getattr__(self, name: str):
+        return getattr(self.book, name)
+
+    def __repr__(self):
+        return repr(self.book).replace("libacbf.ACBFBook", "libacbf.aio.AsyncACBFBook")
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function in the executor of the book and wait for the result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(function, *args))
+
+    @property
+    def coverpage(self) -> AsyncPage:
+        """The :attr:`cover page <libacbf.libacbf.BookInfo.coverpage>` of the book.
+        """
+        return AsyncPage(self.book.book_info.coverpage, self)
+
+    async def pages(self) -> List[AsyncPage]:
+        """Returns the pages of the book. The body of the book is read in the executor the first time.
+        """
+        pages = await self.run(lambda: self.book.body.pages[:])
+        return [AsyncPage(x, self) for x in pages]
+
+    async def __aiter__(self) -> AsyncIterator[AsyncPage]:
+        for page in await self.pages():
+            yield page
+
+    async def _download(self, url: str) -> bytes:
+        if self.session is not None:
+            return await _get(self.session, url)
+
+        from aiohttp import ClientSession
+        async with ClientSession() as session:
+            return await _get(session, url)
+
+    async def close(self):
+        """Saves and closes the book in the executor. See :meth:`ACBFBook.close() <libacbf.ACBFBook.close>`.
+        """
+        await self.run(self.book.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await self.run(self.book.__exit__, exception_type, exception_value, traceback)
+
+
+async def _get(session: ClientSession, url: str) -> bytes:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+@lru_cache(None)
+def _has_aiohttp() -> bool:
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        return False
+    return True
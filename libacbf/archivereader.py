@@ -1,17 +1,47 @@
+from __future__ import annotations
 import os
+import sys
 import shutil
-from io import UnsupportedOperation
+import hashlib
+import weakref
+import threading
+from functools import lru_cache, partial
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full
+from io import BytesIO, UnsupportedOperation
 from pathlib import Path
-from typing import Set, Optional, Union, Literal, BinaryIO
+from weakref import WeakKeyDictionary
+from typing import TYPE_CHECKING, IO, Dict, Iterable, Iterator, List, NamedTuple, Set, Optional, Tuple, Union, \
+    Literal, BinaryIO
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile, is_zipfile
-from py7zr import SevenZipFile, is_7zfile
-from rarfile import RarFile, is_rarfile
 import tarfile as tar
 
+if TYPE_CHECKING:
+    from py7zr import SevenZipFile
+    from rarfile import RarFile
+
 from libacbf.constants import ArchiveTypes
 from libacbf.exceptions import EditRARArchiveError, UnsupportedArchive
 
+# py7zr and rarfile are only imported once an archive of their type is found
+_7z_signature = b"7z\xbc\xaf\x27\x1c"
+_rar_signatures = (b"Rar!\x1a\x07\x00", b"Rar!\x1a\x07\x01\x00")
+
+
+def _read_signature(file: Union[str, Path, BinaryIO], size: int = 8) -> bytes:
+    """Returns the first ``size`` bytes of a file or an empty bytes object if it cannot be read.
+    """
+    try:
+        if hasattr(file, "read"):
+            file.seek(0)
+            return file.read(size)
+        with open(file, "rb") as f:
+            return f.read(size)
+    except OSError:
+        return b''
+
 
 def get_archive_type(file: Union[str, Path, BinaryIO]) -> ArchiveTypes:
     """Get the type of archive.
@@ -31,27 +61,224 @@ def get_archive_type(file: Union[str, Path, BinaryIO]) -> ArchiveTypes:
     UnsupportedArchive
         Raised if file is not of a supported archive type.
     """
+    # An object cannot be an instance of a backend that was never imported
+    py7zr = sys.modules.get("py7zr")
+    rarfile = sys.modules.get("rarfile")
     if isinstance(file, ZipFile):
         return ArchiveTypes.Zip
-    elif isinstance(file, SevenZipFile):
+    elif py7zr is not None and isinstance(file, py7zr.SevenZipFile):
         return ArchiveTypes.SevenZip
     elif isinstance(file, tar.TarFile):
         return ArchiveTypes.Tar
-    elif isinstance(file, RarFile):
+    elif rarfile is not None and isinstance(file, rarfile.RarFile):
         return ArchiveTypes.Rar
 
-    if is_7zfile(file):
+    def rewind():
+        # The checks read from the current position of file objects
+        if hasattr(file, "seek"):
+            file.seek(0)
+        return file
+
+    signature = _read_signature(file)
+    if signature.startswith(_7z_signature):
         return ArchiveTypes.SevenZip
-    elif is_zipfile(file):
+    elif is_zipfile(rewind()):
         return ArchiveTypes.Zip
-    elif is_rarfile(file):
+    elif signature.startswith(_rar_signatures):
         return ArchiveTypes.Rar
-    elif tar.is_tarfile(file):
+    elif tar.is_tarfile(rewind()):
         return ArchiveTypes.Tar
     else:
         raise UnsupportedArchive
 
 
+class MemberInfo(NamedTuple):
+    """Information about a file in an archive. Returned by :meth:`ArchiveReader.list_members()`.
+
+    Attributes
+    ----------
+    name : str
+        Path of the file relative to root of archive.
+
+    size : int
+        Uncompressed size in bytes.
+
+    compressed_size : int | None
+        Compressed size in bytes. ``None`` if the archive does not store it.
+
+    crc : int | None
+        CRC32 of the uncompressed file. ``None`` for Tar archives and archives opened in write mode.
+
+    offset : int | None
+        Position of the file's header in the archive. ``None`` for 7Zip archives and archives opened in write mode.
+    """
+    name: str
+    size: int
+    compressed_size: Optional[int]
+    crc: Optional[int]
+    offset: Optional[int]
+
+
+class MemberFailure(NamedTuple):
+    """A file that failed :meth:`ArchiveReader.verify()`.
+    """
+    name: Optional[str]
+    """Path of the file or ``None`` if the archive as a whole could not be checked."""
+    error_type: str
+    """Name of the exception class such as ``"BadZipFile"``."""
+    error: str
+
+
+def _read_7z(archive: SevenZipFile, target: str) -> bytes:
+    """Read a single file from a 7Zip archive. py7zr 1.0 removed ``SevenZipFile.read()`` in favour of extracting into
+    a writer factory.
+    """
+    archive.reset()
+    if hasattr(archive, "read"):
+        with archive.read([target])[target] as file:
+            return file.read()
+
+    from py7zr.io import BytesIOFactory
+    factory = BytesIOFactory(archive.getinfo(target).uncompressed)
+    archive.extract(targets=[target], factory=factory)
+    file = factory.get(target)
+    file.seek(0)
+    return file.read()
+
+
+class _Stopped(Exception):
+    """Raised inside a 7Zip extraction to abort it when the reader is closed early.
+    """
+
+
+@lru_cache(None)
+def _7z_can_stream() -> bool:
+    """Whether py7zr can extract into a writer factory and closes each file of the factory once it is decompressed.
+    Older versions only rewind the files so :func:`_iter_7z` would not know when a file is finished.
+    """
+    try:
+        from py7zr.io import MemIO, WriterFactory  # noqa: F401
+    except ImportError:
+        return False
+
+    stream = _7zStream()
+    file = MemIO("probe", stream).open()
+    file.write(b"probe")
+    file.close()
+    return not stream.queue.empty()
+
+
+class _7zStream:
+    """Writer factory of a 7Zip extraction that passes each decompressed file to the consumer through a queue. At most
+    one finished file waits in the queue.
+    """
+
+    def __init__(self):
+        self.queue: Queue = Queue(maxsize=1)
+        self.stop = threading.Event()
+
+    def create(self, filename: str) -> _7zWriter:
+        return _7zWriter(filename, self)
+
+    def put(self, item):
+        while True:
+            if self.stop.is_set():
+                raise _Stopped
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except Full:
+                pass
+
+    def extract(self, archive: SevenZipFile, targets: Set[str]):
+        try:
+            archive.reset()
+            archive.extract(targets=list(targets), factory=self)
+            self.put(_7z_done)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            try:
+                self.put(e)
+            except _Stopped:
+                pass
+
+
+class _7zWriter:
+    """A file of a 7Zip extraction. Its contents are put in the queue when py7zr closes it.
+    """
+
+    def __init__(self, filename: str, stream: _7zStream):
+        self.filename = filename
+        self.stream = stream
+        self.buffer = BytesIO()
+        self.sent = False
+
+    def write(self, s):
+        if self.stream.stop.is_set():
+            raise _Stopped
+        return self.buffer.write(s)
+
+    def read(self, size=None):
+        return self.buffer.read(size)
+
+    def seek(self, offset, whence=0):
+        return self.buffer.seek(offset, whence)
+
+    def flush(self):
+        pass
+
+    def size(self):
+        return self.buffer.getbuffer().nbytes
+
+    def close(self):
+        if not self.sent:
+            self.sent = True
+            contents = self.buffer.getvalue()
+            self.buffer = BytesIO()
+            self.stream.put((self.filename, contents))
+
+
+_7z_done = object()
+
+
+def _iter_7z(archive: SevenZipFile, targets: Set[str]) -> Iterator[Tuple[str, bytes]]:
+    """Extract files from a 7Zip archive in a single pass in a background thread and yield them as each one is
+    decompressed. Needs :func:`_7z_can_stream`.
+    """
+    stream = _7zStream()
+    thread = threading.Thread(target=stream.extract, args=(archive, targets), daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = stream.queue.get()
+            if item is _7z_done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stream.stop.set()
+        thread.join()
+
+
+def _open_archive(file: Union[Path, BinaryIO], type: ArchiveTypes
+                  ) -> Union[ZipFile, SevenZipFile, tar.TarFile, RarFile]:
+    if type == ArchiveTypes.Zip:
+        return ZipFile(file, 'r')
+    elif type == ArchiveTypes.SevenZip:
+        from py7zr import SevenZipFile
+        return SevenZipFile(file, 'r')
+    elif type == ArchiveTypes.Tar:
+        if isinstance(file, Path):
+            return tar.open(file, mode='r')
+        else:
+            return tar.open(fileobj=file, mode='r')
+    elif type == ArchiveTypes.Rar:
+        from rarfile import RarFile
+        return RarFile(file)
+
+
 class ArchiveReader:
     """This can read and write Zip, 7Zip and Tar archives. Rar archives are read-only.
 
@@ -60,6 +287,10 @@ class ArchiveReader:
     Writing and creating archives uses the default options for each type. You cannot use this module to change
     compression levels or other options.
 
+    Reading methods can be called from several threads at once. Zip archives are shared by all threads. Each thread
+    other than the one that opened a 7Zip, Tar or Rar archive on disk opens its own instance of the archive, which is
+    closed when the thread ends or with the reader. Archives in file objects are read by one thread at a time.
+
     Parameters
     ----------
     file : str | pathlib.Path | BinaryIO
@@ -94,6 +325,7 @@ class ArchiveReader:
     def __init__(self, file: Union[str, Path, BinaryIO], mode: Literal['r', 'w'] = 'r'):
         self._extract = None
         self._arc_path = None
+        self._members: Optional[Dict[str, MemberInfo]] = None
         self._source = file
         self.mode: Literal['r', 'w'] = mode
         self.type: ArchiveTypes = get_archive_type(file)
@@ -108,19 +340,16 @@ class ArchiveReader:
             if self.type == ArchiveTypes.Rar:
                 raise EditRARArchiveError
 
-        arc = None
-        if self.type == ArchiveTypes.Zip:
-            arc = ZipFile(file, 'r')
-        elif self.type == ArchiveTypes.SevenZip:
-            arc = SevenZipFile(file, 'r')
-        elif self.type == ArchiveTypes.Tar:
-            if isinstance(file, (str, Path)):
-                arc = tar.open(file, mode='r')
-            else:
-                arc = tar.open(fileobj=file, mode='r')
-        elif self.type == ArchiveTypes.Rar:
-            arc = RarFile(file)
+        # Tar, 7Zip and Rar archives keep a single read position. Other threads that read from an archive on disk get
+        # their own instance and archives in file objects are read by one thread at a time.
+        self._path: Optional[Path] = file if isinstance(file, Path) else None
+        self._owner: int = threading.get_ident()
+        self._handles: WeakKeyDictionary[threading.Thread, Tuple[Union[SevenZipFile, tar.TarFile, RarFile],
+                                                                 weakref.finalize]] = WeakKeyDictionary()
+        self._lock = threading.RLock()
+        self._tar_members: Optional[Dict[str, tar.TarInfo]] = None
 
+        arc = _open_archive(file, self.type)
         self.archive: Union[ZipFile, SevenZipFile, tar.TarFile, RarFile] = arc
 
         if mode == 'w':
@@ -164,22 +393,23 @@ class ArchiveReader:
                     acbf_file = i.relative_to(self._arc_path)
                     break
         else:
-            if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
-                for i in self.archive.infolist():
-                    if not i.is_dir() and '/' not in i.filename and i.filename.endswith(".acbf"):
-                        acbf_file = i.filename
-                        break
-            elif self.type == ArchiveTypes.SevenZip:
-                self.archive.reset()
-                for i in self.archive.list():
-                    if not i.is_directory and '/' not in i.filename and i.filename.endswith(".acbf"):
-                        acbf_file = i.filename
-                        break
-            elif self.type == ArchiveTypes.Tar:
-                for i in self.archive.getmembers():
-                    if i.isfile() and '/' not in i.name and i.name.endswith(".acbf"):
-                        acbf_file = i.name
-                        break
+            with self._thread_archive() as archive:
+                if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
+                    for i in archive.infolist():
+                        if not i.is_dir() and '/' not in i.filename and i.filename.endswith(".acbf"):
+                            acbf_file = i.filename
+                            break
+                elif self.type == ArchiveTypes.SevenZip:
+                    archive.reset()
+                    for i in archive.list():
+                        if not i.is_directory and '/' not in i.filename and i.filename.endswith(".acbf"):
+                            acbf_file = i.filename
+                            break
+                elif self.type == ArchiveTypes.Tar:
+                    for i in archive.getmembers():
+                        if i.isfile() and '/' not in i.name and i.name.endswith(".acbf"):
+                            acbf_file = i.name
+                            break
 
         return acbf_file
 
@@ -188,28 +418,158 @@ class ArchiveReader:
         """
         if self._arc_path is not None:
             return {str(x.relative_to(self._arc_path)) for x in self._arc_path.rglob('*') if x.is_file()}
-        else:
+        with self._thread_archive() as archive:
             if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
-                return {x.filename for x in self.archive.infolist() if not x.is_dir()}
+                return {x.filename for x in archive.infolist() if not x.is_dir()}
             elif self.type == ArchiveTypes.Tar:
-                return {x.name for x in self.archive.getmembers() if x.isfile()}
+                return {x.name for x in archive.getmembers() if x.isfile()}
             elif self.type == ArchiveTypes.SevenZip:
-                self.archive.reset()
-                return {x.filename for x in self.archive.list() if not x.is_directory}
+                archive.reset()
+                return {x.filename for x in archive.list() if not x.is_directory}
+
+    def list_members(self) -> List[MemberInfo]:
+        """Returns size, CRC and offset information of all the files in the archive. The information comes from the
+        archive's index so no file is decompressed.
+
+        Returns
+        -------
+        List[MemberInfo]
+            A list of :class:`MemberInfo` in the order of the archive.
+        """
+        if self._arc_path is not None:
+            return [MemberInfo(str(x.relative_to(self._arc_path)), x.stat().st_size, None, None, None)
+                    for x in self._arc_path.rglob('*') if x.is_file()]
+
+        if self._members is None:
+            members = []
+            with self._thread_archive() as archive:
+                if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
+                    for i in archive.infolist():
+                        if not i.is_dir():
+                            members.append(MemberInfo(i.filename, i.file_size, i.compress_size, i.CRC,
+                                                      getattr(i, "header_offset", None)))
+                elif self.type == ArchiveTypes.Tar:
+                    for i in archive.getmembers():
+                        if i.isfile():
+                            members.append(MemberInfo(i.name, i.size, None, None, i.offset))
+                elif self.type == ArchiveTypes.SevenZip:
+                    archive.reset()
+                    for i in archive.list():
+                        if not i.is_directory:
+                            members.append(MemberInfo(i.filename, i.uncompressed, i.compressed, i.crc32, None))
+            self._members = {x.name: x for x in members}
+
+        return list(self._members.values())
+
+    def get_member(self, target: str) -> MemberInfo:
+        """Returns the :class:`MemberInfo` of a file in the archive.
+
+        Parameters
+        ----------
+        target : str
+            Path relative to root of archive.
+
+        Raises
+        ------
+        KeyError
+            Raised if the file is not in the archive.
+        """
+        if self._arc_path is not None:
+            path = self._arc_path / target
+            if not path.is_file():
+                raise KeyError(target)
+            return MemberInfo(target, path.stat().st_size, None, None, None)
+
+        if self._members is None:
+            self.list_members()
+        return self._members[target]
+
+    def fingerprint(self, exclude: Iterable[str] = ()) -> str:
+        """Returns an ID of the contents of the archive made from the names, sizes and CRC32 values of its files. The
+        information comes from the archive's index so no file is decompressed. The ID does not depend on the order of
+        the files or the archive type, so copies and archives packed again with the same files have the same ID.
+
+        Tar archives do not store CRC32 values so the position and modification time of each file are used instead.
+        Their ID changes if the archive is packed again even if the files are the same.
+
+        Parameters
+        ----------
+        exclude : Iterable[str], optional
+            Names of files to leave out.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            Raised if the archive is opened in write mode.
+        """
+        if self.mode != 'r':
+            raise UnsupportedOperation("Fingerprint of archive in write mode is not available.")
+
+        exclude = set(exclude)
+        fingerprint = hashlib.sha256()
+        for member in sorted(self.list_members(), key=lambda x: x.name):
+            if member.name in exclude:
+                continue
+            if member.crc is not None:
+                entry = f"{member.name}\0{member.size}\0{member.crc}"
+            elif self.type == ArchiveTypes.Tar:
+                entry = f"{member.name}\0{member.size}\0{member.offset}\0{self._tar_member(member.name).mtime}"
+            else:
+                entry = f"{member.name}\0{member.size}"  # Empty files in 7Zip archives have no CRC32
+            fingerprint.update(entry.encode("utf-8", "surrogateescape") + b"\n")
+        return fingerprint.hexdigest()
 
     def list_dirs(self) -> Set[str]:
         """Returns a list of all the directories in the archive.
         """
         if self._arc_path is not None:
             return {str(x.relative_to(self._arc_path)) for x in self._arc_path.rglob('*') if x.is_dir()}
-        else:
+        with self._thread_archive() as archive:
             if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
-                return {x.filename for x in self.archive.infolist() if x.is_dir()}
+                return {x.filename for x in archive.infolist() if x.is_dir()}
             elif self.type == ArchiveTypes.Tar:
-                return {x.name for x in self.archive.getmembers() if x.isdir()}
+                return {x.name for x in archive.getmembers() if x.isdir()}
             elif self.type == ArchiveTypes.SevenZip:
-                self.archive.reset()
-                return {x.filename for x in self.archive.list() if x.is_directory}
+                archive.reset()
+                return {x.filename for x in archive.list() if x.is_directory}
+
+    @contextmanager
+    def _thread_archive(self) -> Iterator[Union[ZipFile, SevenZipFile, tar.TarFile, RarFile]]:
+        """Yields the instance of the archive that the current thread should use. The shared instance is only used by
+        the thread that opened the reader, except for Zip archives and archives in file objects.
+        """
+        if self.type == ArchiveTypes.Zip:
+            # ZipFile locks its file for each read and decompresses outside the lock
+            yield self.archive
+        elif self._path is None:
+            with self._lock:
+                yield self.archive
+        elif threading.get_ident() == self._owner:
+            yield self.archive
+        else:
+            thread = threading.current_thread()
+            with self._lock:
+                handle = self._handles.get(thread)
+                if handle is None:
+                    archive = _open_archive(self._path, self.type)
+                    # Closed when the thread object is freed after the thread ends
+                    handle = (archive, weakref.finalize(thread, archive.close))
+                    self._handles[thread] = handle
+            yield handle[0]
+
+    def _tar_member(self, target: str) -> tar.TarInfo:
+        """Returns the member of a Tar archive from an index shared by all threads. Instances opened by other threads
+        can read the member directly from its offset without reading the index again.
+        """
+        members = self._tar_members
+        if members is None:
+            with self._thread_archive() as archive:
+                members = {x.name: x for x in archive.getmembers()}
+            self._tar_members = members
+        try:
+            return members[target]
+        except KeyError:
+            raise KeyError(f"filename {target!r} not found") from None
 
     def read(self, target: str) -> Optional[bytes]:
         """Get file as bytes from archive.
@@ -230,18 +590,173 @@ class ArchiveReader:
             with open(self._arc_path / target, 'rb') as file:
                 contents = file.read()
         else:
-            if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
-                with self.archive.open(target, 'r') as file:
-                    contents = file.read()
+            with self._thread_archive() as archive:
+                if self.type in (ArchiveTypes.Zip, ArchiveTypes.Rar):
+                    with archive.open(target, 'r') as file:
+                        contents = file.read()
+                elif self.type == ArchiveTypes.SevenZip:
+                    contents = _read_7z(archive, target)
+                elif self.type == ArchiveTypes.Tar:
+                    with archive.extractfile(self._tar_member(target)) as file:
+                        contents = file.read()
+
+        return contents
+
+    def iter_read(self, targets: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+        """Read files from the archive in the order they are stored in. This is much faster than :meth:`read()` for
+        7Zip archives and compressed Tar archives. 7Zip archives on disk are decompressed in a single pass by a
+        background thread that stays one file ahead, so up to three decompressed files are in memory at a time: the one
+        that was yielded, one that is waiting and one that is being decompressed. Other archives are read one file at a
+        time.
+
+        Parameters
+        ----------
+        targets : Iterable[str]
+            Paths relative to root of archive. Each file is read once.
+
+        Returns
+        -------
+        Iterator[Tuple[str, bytes]]
+            Names and contents of the files in archive order.
+
+        Raises
+        ------
+        KeyError
+            Raised if a file is not in the archive.
+        """
+        targets = set(targets)
+        members = {x.name: i for i, x in enumerate(self.list_members())}
+        for i in targets:
+            if i not in members:
+                raise KeyError(i)
+
+        if self._arc_path is None and self._path is not None and self.type == ArchiveTypes.SevenZip \
+                and _7z_can_stream():
+            # The archive is extracted by a background thread so it gets an instance of its own. Archives in file
+            # objects are read one file at a time so that the shared instance is not locked between files.
+            archive = _open_archive(self._path, self.type)
+            try:
+                yield from _iter_7z(archive, targets)
+            finally:
+                archive.close()
+            return
+
+        for i in sorted(targets, key=members.get):
+            yield i, self.read(i)
+
+    def open(self, target: str) -> IO[bytes]:
+        """Open a file in the archive for reading. Zip, Rar and Tar members are decompressed while they are read so
+        parsers can stop early without decompressing the whole file. 7Zip members are decompressed into memory first.
+
+        Parameters
+        ----------
+        target : str
+            Path relative to root of archive.
+
+        Returns
+        -------
+        IO[bytes]
+            Binary file object. Close it when done or use it in a with statement.
+        """
+        if self._arc_path is not None:
+            return open(self._arc_path / target, 'rb')
+
+        if self.type == ArchiveTypes.Zip:
+            return self.archive.open(target, 'r')
+
+        with self._thread_archive() as archive:
+            if self.type == ArchiveTypes.Rar:
+                file = archive.open(target, 'r')
             elif self.type == ArchiveTypes.SevenZip:
-                self.archive.reset()
-                with self.archive.read([target])[target] as file:
-                    contents = file.read()
+                return BytesIO(_read_7z(archive, target))
             elif self.type == ArchiveTypes.Tar:
-                with self.archive.extractfile(target) as file:
-                    contents = file.read()
+                file = archive.extractfile(self._tar_member(target))
 
-        return contents
+        if self._path is None:
+            # Reads from the returned file move the position of the shared file object
+            with self._lock, file:
+                return BytesIO(file.read())
+        return file
+
+    def verify(self, workers: int = 1, chunk_size: int = 2 ** 20) -> List[MemberFailure]:
+        """Decompress every file in the archive to check that it is not damaged. Zip files are checked against their
+        CRC32 and Tar files against their size. 7Zip archives are checked with py7zr's ``testzip()`` which decompresses
+        the archive once and stops at the first file that does not match its CRC32. Rar archives are checked with
+        rarfile's ``testrar()`` which stops at the first damaged file. Its failure has no file name.
+
+        Parameters
+        ----------
+        workers : int, default=1
+            Number of threads that decompress files at the same time. 7Zip and Rar archives are always checked by one
+            thread.
+
+        chunk_size : int, default=1 MiB
+            Number of bytes each thread reads at a time. Files are not kept in memory.
+
+        Returns
+        -------
+        List[MemberFailure]
+            The damaged files in the order of the archive. Empty if the archive is fine.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            Raised if the archive is opened in write mode.
+        """
+        if self.mode != 'r':
+            raise UnsupportedOperation("Archive in write mode cannot be verified.")
+
+        if self.type == ArchiveTypes.SevenZip:
+            return self._verify_7z()
+        if self.type == ArchiveTypes.Rar:
+            return self._verify_rar()
+
+        members = self.list_members()
+        check = partial(self._verify_member, chunk_size=chunk_size)
+        if workers <= 1 or len(members) <= 1:
+            results = [check(x) for x in members]
+        else:
+            with ThreadPoolExecutor(min(workers, len(members))) as executor:
+                results = list(executor.map(check, members))
+        return [x for x in results if x is not None]
+
+    def _verify_member(self, member: MemberInfo, chunk_size: int) -> Optional[MemberFailure]:
+        # ZipFile raises an error at the end of a file that does not match its CRC32
+        size = 0
+        try:
+            with self.open(member.name) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+            if size != member.size:
+                raise EOFError(f"Read {size} of {member.size} bytes.")
+        except Exception as e:
+            return MemberFailure(member.name, type(e).__name__, str(e))
+        return None
+
+    def _verify_7z(self) -> List[MemberFailure]:
+        with self._thread_archive() as archive:
+            archive.reset()
+            try:
+                name = archive.testzip()
+            except Exception as e:
+                return [MemberFailure(None, type(e).__name__, str(e))]
+            finally:
+                archive.reset()
+        if name is not None:
+            return [MemberFailure(name, "CrcError", "CRC32 does not match.")]
+        return []
+
+    def _verify_rar(self) -> List[MemberFailure]:
+        # Solid archives are decompressed once instead of up to each file
+        with self._thread_archive() as archive:
+            try:
+                archive.testrar()
+            except Exception as e:
+                return [MemberFailure(None, type(e).__name__, str(e))]
+        return []
 
     def write(self, target: Union[str, Path, bytes], arcname: Optional[str] = None):
         """Write file to archive.
@@ -320,10 +835,17 @@ class ArchiveReader:
                 except FileNotFoundError:
                     pass
 
+    def _close_handles(self):
+        with self._lock:
+            for _, finalizer in list(self._handles.values()):
+                finalizer()
+            self._handles.clear()
+
     def close(self):
         """Close archive file. Save changes if writeable.
         """
         self.archive.close()
+        self._close_handles()
 
         if self.mode != 'r':
             if self.type == ArchiveTypes.Zip:
@@ -332,6 +854,7 @@ class ArchiveReader:
                         arc.write(self._arc_path / i, i)
 
             elif self.type == ArchiveTypes.SevenZip:
+                from py7zr import SevenZipFile
                 with SevenZipFile(self._source, 'w') as arc:
                     for i in self.list_files():
                         arc.write(self._arc_path / i, i)
@@ -352,5 +875,6 @@ class ArchiveReader:
             if self._extract is not None:
                 self._extract.cleanup()
             self.archive.close()
+            self._close_handles()
         else:
             self.close()
@@ -0,0 +1,308 @@
+"""Read the metadata of many books and check archives for damage in parallel.
+
+Parsing runs under the GIL so :func:`scan` spreads books over a process pool. Workers send back
+:class:`BookRecord <libacbf.catalog.BookRecord>` tuples instead of open books. Books that cannot be read are collected
+as :class:`ScanFailure` and do not stop the batch. :func:`verify` decompresses every file of many books in a process
+pool with :meth:`ArchiveReader.verify() <libacbf.archivereader.ArchiveReader.verify>`. Both are built on
+:func:`iter_pool`, which runs any picklable function over many books.
+
+Examples
+--------
+::
+
+    from libacbf import batch
+
+    def progress(done, total):
+        print(f"{done}/{total}")
+
+    result = batch.scan(["path/to/comics"], workers=8, fields=["book_title", "authors"], progress=progress)
+    for record in result.records:
+        print(record.path, record.book_title)
+    for failure in result.failures:
+        print(failure.path, failure.error)
+
+    for result in batch.verify(["path/to/comics"], workers=8):
+        for failure in result.failures:
+            print(result.path, failure.name, failure.error)
+"""
+
+from __future__ import annotations
+
+import os
+import glob
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TypeVar, Union
+
+from libacbf.catalog import EXTENSIONS, BookRecord, iter_books
+from libacbf.archivereader import ArchiveReader, MemberFailure
+
+T = TypeVar('T')
+
+
+class ScanFailure(NamedTuple):
+    """A book that could not be read.
+    """
+    path: str
+    error_type: str
+    """Name of the exception class such as ``"InvalidBook"``."""
+    error: str
+
+
+class BatchResult(NamedTuple):
+    """Returned by :func:`scan`.
+    """
+    records: List[BookRecord]
+    """Records in the order the paths were given."""
+    failures: List[ScanFailure]
+
+
+class VerifyResult(NamedTuple):
+    """Returned by :func:`verify` for each book.
+    """
+    path: str
+    failures: List[MemberFailure]
+    """Damaged files of the book. Empty if the book is fine. A failure without a name means that the archive could not
+    be opened."""
+
+
+def scan_book(path: str, fields: Optional[Iterable[str]] = None, validate: bool = False
+              ) -> Union[BookRecord, ScanFailure]:
+    """Reads the record of one book. This is what :func:`scan` runs for each book.
+
+    Parameters
+    ----------
+    path : str
+        Path to the book.
+
+    fields, validate
+        See :func:`scan`. ``path`` is always kept.
+
+    Returns
+    -------
+    BookRecord | ScanFailure
+        The record or the error if the book could not be read.
+    """
+    from libacbf import ACBFBook
+
+    try:
+        if validate:
+            with ACBFBook(path, use_index=False) as book:
+                record = BookRecord.from_book(path, book.book_info, book.publisher_info, book.document_info)
+        else:
+            record = BookRecord.from_book(path, *ACBFBook.read_metadata(path))
+    except Exception as e:
+        return ScanFailure(path, type(e).__name__, str(e))
+
+    if fields is not None:
+        fields = set(fields)
+        record = record._replace(**{x: None for x in BookRecord._fields if x not in fields and x != "path"})
+    return record
+
+
+def _call_chunk(function: Callable[..., T], items: Sequence, args: tuple) -> List[T]:
+    return [function(x, *args) for x in items]
+
+
+def iter_pool(function: Callable[..., T], items: Iterable, workers: Optional[int] = None, args: tuple = (),
+              chunksize: int = 1) -> Iterator[T]:
+    """Calls ``function(item, *args)`` for each item in a process pool and yields the results as they finish.
+    Calls that have not started are cancelled if the iterator is closed early, for example by ``KeyboardInterrupt``.
+
+    Parameters
+    ----------
+    function : Callable
+        A function defined at the top level of a module so that it can be sent to other processes. It should return
+        errors instead of raising them, like :func:`scan_book` and :func:`verify_book`.
+
+    items : Iterable
+        Arguments to call ``function`` with, usually paths of books.
+
+    workers : int | None, default=None
+        Number of processes. Uses ``os.cpu_count()`` if ``None``. Runs in the current process if ``1`` or if there
+        is only one item.
+
+    args : tuple, optional
+        Other arguments passed to every call.
+
+    chunksize : int, default=1
+        Number of items sent to a worker at a time.
+    """
+    items = list(items)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield function(item, *args)
+        return
+
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+    with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+        futures = [executor.submit(_call_chunk, function, x, args) for x in chunks]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def expand_paths(paths: Iterable[Union[str, Path]], extensions: Iterable[str] = EXTENSIONS) -> List[str]:
+    """Returns the absolute paths of the books matched by files, directories and glob patterns. Directories are
+    searched recursively for files with one of the ``extensions``. Patterns are only expanded if no file with that name
+    exists and ``**`` matches any number of directories. Each book is only returned once.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if a path does not exist and matches nothing as a pattern.
+    """
+    books = []
+    for path in paths:
+        if os.path.exists(path):
+            matches = [path]
+        else:
+            matches = sorted(glob.glob(str(path), recursive=True))
+            if not matches:
+                raise FileNotFoundError(str(path))
+        books.extend(iter_books(matches, extensions))
+    return list(dict.fromkeys(books))
+
+
+def iter_scan(paths: Iterable[Union[str, Path]], workers: Optional[int] = None, fields: Optional[Iterable[str]] = None,
+              chunksize: int = 16, validate: bool = False, extensions: Iterable[str] = EXTENSIONS
+              ) -> Iterator[Union[BookRecord, ScanFailure]]:
+    """Same as :func:`scan` but yields records and failures as chunks finish instead of collecting them.
+    """
+    return _iter_scan(expand_paths(paths, extensions), workers, fields, chunksize, validate)
+
+
+def _iter_scan(paths: List[str], workers: Optional[int], fields: Optional[Iterable[str]], chunksize: int,
+               validate: bool) -> Iterator[Union[BookRecord, ScanFailure]]:
+    if fields is not None:
+        fields = frozenset(fields)
+        unknown = fields - set(BookRecord._fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return iter_pool(scan_book, paths, workers, (fields, validate), chunksize)
+
+
+def scan(paths: Iterable[Union[str, Path]], workers: Optional[int] = None, fields: Optional[Iterable[str]] = None,
+         progress: Optional[Callable[[int, int], None]] = None, chunksize: int = 16, validate: bool = False,
+         extensions: Iterable[str] = EXTENSIONS) -> BatchResult:
+    """Read the metadata of many books using a process pool.
+
+    Parameters
+    ----------
+    paths : Iterable[str | pathlib.Path]
+        Books and directories to search recursively for books.
+
+    workers : int | None, default=None
+        Number of processes. Uses ``os.cpu_count()`` if ``None``. Runs in the current process if ``1``.
+
+    fields : Iterable[str] | None, default=None
+        Names of the :class:`BookRecord <libacbf.catalog.BookRecord>` fields to keep. Other fields are ``None`` which
+        makes the records smaller to send between processes. Keeps all fields if ``None``.
+
+    progress : Callable[[int, int], None], optional
+        Called with the number of books done and the total number of books as books finish.
+
+    chunksize : int, default=16
+        Number of books sent to a worker at a time.
+
+    validate : bool, default=False
+        Open and validate the whole book instead of reading only its metadata. Books that do not match the ACBF schema
+        are reported as failures. Much slower.
+
+    extensions : Iterable[str], default=EXTENSIONS
+        File extensions of books in directories. Case insensitive.
+
+    Returns
+    -------
+    BatchResult
+        Records of the books that were read and the books that failed.
+    """
+    paths = expand_paths(paths, extensions)
+    order = {x: i for i, x in enumerate(paths)}
+
+    records = []
+    failures = []
+    for done, item in enumerate(_iter_scan(paths, workers, fields, chunksize, validate), 1):
+        if isinstance(item, ScanFailure):
+            failures.append(item)
+        else:
+            records.append(item)
+        if progress is not None:
+            progress(done, len(paths))
+
+    records.sort(key=lambda x: order[x.path])
+    failures.sort(key=lambda x: order[x.path])
+    return BatchResult(records, failures)
+
+
+def verify_book(path: str, threads: int = 1, chunk_size: int = 2 ** 20) -> VerifyResult:
+    """Checks one book for damaged files. This is what :func:`verify` runs for each book. See :func:`verify` for the
+    parameters.
+    """
+    if path.lower().endswith(".acbf"):
+        return VerifyResult(path, [])  # Not an archive
+
+    try:
+        with ArchiveReader(path) as archive:
+            failures = archive.verify(threads, chunk_size)
+    except Exception as e:
+        failures = [MemberFailure(None, type(e).__name__, str(e))]
+    return VerifyResult(path, failures)
+
+
+def iter_verify(paths: Iterable[Union[str, Path]], workers: Optional[int] = None, threads: int = 1,
+                chunk_size: int = 2 ** 20, extensions: Iterable[str] = EXTENSIONS) -> Iterator[VerifyResult]:
+    """Same as :func:`verify` but yields results as books finish instead of collecting them.
+    """
+    return iter_pool(verify_book, expand_paths(paths, extensions), workers, (threads, chunk_size))
+
+
+def verify(paths: Iterable[Union[str, Path]], workers: Optional[int] = None, threads: int = 1,
+           progress: Optional[Callable[[int, int], None]] = None, chunk_size: int = 2 ** 20,
+           extensions: Iterable[str] = EXTENSIONS) -> List[VerifyResult]:
+    """Check many books for damaged files using a process pool. Plain ACBF files are not archives and always pass.
+
+    Parameters
+    ----------
+    paths : Iterable[str | pathlib.Path]
+        Books and directories to search recursively for books.
+
+    workers : int | None, default=None
+        Number of books checked at the same time, each in its own process. Uses ``os.cpu_count()`` if ``None``. Runs
+        in the current process if ``1``.
+
+    threads : int, default=1
+        Number of threads each process uses to check the files of a book. See
+        :meth:`ArchiveReader.verify() <libacbf.archivereader.ArchiveReader.verify>`.
+
+    progress : Callable[[int, int], None], optional
+        Called with the number of books done and the total number of books as books finish.
+
+    chunk_size : int, default=1 MiB
+        Number of bytes each thread reads at a time.
+
+    extensions : Iterable[str], default=EXTENSIONS
+        File extensions of books in directories. Case insensitive.
+
+    Returns
+    -------
+    List[VerifyResult]
+        A result for every book in the order the paths were given.
+    """
+    paths = expand_paths(paths, extensions)
+    order = {x: i for i, x in enumerate(paths)}
+
+    results = []
+    for done, result in enumerate(iter_pool(verify_book, paths, workers, (threads, chunk_size)), 1):
+        results.append(result)
+        if progress is not None:
+            progress(done, len(paths))
+
+    results.sort(key=lambda x: order[x.path])
+    return results
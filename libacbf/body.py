@@ -1,17 +1,25 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, List, Dict, Set, Tuple, Optional, Union, Iterable, Iterator
+from collections.abc import MutableSequence
 import os
 import re
-import magic
-import requests
+import sys
 from pathlib import Path
+from lxml import etree
 
 if TYPE_CHECKING:
     from libacbf import ACBFBook
+    from libacbf.index import IndexedPage
 import libacbf.helpers as helpers
 import libacbf.constants as consts
+import libacbf.langtags as langtags
 from libacbf.archivereader import ArchiveReader
 from libacbf.bookdata import BookData
+from libacbf.imagesize import get_image_size
+from libacbf.points import Points
+
+
+_NO_LAYERS: Dict = {}  # Shared by pages that have no skipped text layers. Never modified.
 
 
 class Page:
@@ -53,7 +61,9 @@ class Page:
         :attr:`Page.image_ref`.
 
     text_layers: Dict[str, TextLayer]
-        A dictionary with keys being the language of the text layer and values being :class:`TextLayer` objects.
+        A dictionary with keys being the language of the text layer and values being :class:`TextLayer` objects. Only
+        contains the languages allowed by the ``languages`` filter of :class:`ACBFBook <libacbf.ACBFBook>`. See
+        :meth:`list_text_layers()` and :meth:`load_text_layers()`.
 
     frames: List[Frame]
         A list of :class:`Frame` objects in order of appearance.
@@ -81,6 +91,9 @@ class Page:
         :class:`PageTransitions <libacbf.constants.PageTransitions>`.
     """
 
+    __slots__ = ("_book", "_arch_path", "_file_path", "_file_id", "_image", "_element", "_image_ref", "_text_layers",
+                 "_unloaded_layers", "_frames", "_jumps", "is_coverpage", "ref_type", "bgcolor", "transition", "title")
+
     def __init__(self, image_ref: str, book: ACBFBook, coverpage: bool = False):
         self._book = book  # Required to get embedded and archived images in `image` property
 
@@ -89,14 +102,18 @@ class Page:
         self._file_id = None
 
         self._image = None
+        # XML element that frames, jumps and text layers are loaded from on first access or position of the page in
+        # the body if it was created from the index of the book
+        self._element = None
 
         self.is_coverpage: bool = coverpage
         self.ref_type: consts.ImageRefType = None
         self.image_ref = image_ref  # Set property
 
-        self.text_layers: Dict[str, TextLayer] = {}
-        self.frames: List[Frame] = []
-        self.jumps: List[Jump] = []
+        self._text_layers: Dict[str, TextLayer] = {}
+        self._unloaded_layers: Dict[str, etree._Element] = _NO_LAYERS  # Text layers skipped by `languages` filter
+        self._frames: List[Frame] = []
+        self._jumps: List[Jump] = []
 
         # --- Optional ---
         if not coverpage:
@@ -148,12 +165,109 @@ class Page:
                     self.ref_type = consts.ImageRefType.SelfArchived
                 else:
                     self.ref_type = consts.ImageRefType.Local
-                    self._file_path = self._book.book_path.parent / self._file_path
+                    if self._book.book_path is not None:
+                        self._file_path = self._book.book_path.parent / self._file_path
 
             self._file_id = self._file_path.name
 
         self._image_ref: str = ref
 
+    @property
+    def text_layers(self) -> Dict[str, TextLayer]:
+        self._load()
+        return self._text_layers
+
+    @text_layers.setter
+    def text_layers(self, val: Dict[str, TextLayer]):
+        self._load()
+        self._text_layers = val
+
+    @property
+    def frames(self) -> List[Frame]:
+        self._load()
+        return self._frames
+
+    @frames.setter
+    def frames(self, val: List[Frame]):
+        self._load()
+        self._frames = val
+
+    @property
+    def jumps(self) -> List[Jump]:
+        self._load()
+        return self._jumps
+
+    @jumps.setter
+    def jumps(self, val: List[Jump]):
+        self._load()
+        self._jumps = val
+
+    def _load(self):
+        """Fill frames, jumps and text layers from the XML element of the page if they have not been read yet.
+        """
+        if self._element is None:
+            return
+
+        pg = self._element
+        self._element = None
+        if isinstance(pg, int):
+            pg = self._book._page_element(pg)
+        nsmap = self._book._nsmap
+
+        for fr in pg.findall("frame", namespaces=nsmap):
+            frame = Frame(helpers.pts_to_vec(fr.attrib["points"]))
+            if "bgcolor" in fr.keys():
+                frame.bgcolor = sys.intern(fr.attrib["bgcolor"])
+            self._frames.append(frame)
+
+        for jp in pg.findall("jump", namespaces=nsmap):
+            jump = Jump(int(jp.attrib["page"]), helpers.pts_to_vec(jp.attrib["points"]), self._book)
+            self._jumps.append(jump)
+
+        # Text Layers
+        languages = self._book._languages
+        for tl in pg.findall("text-layer", namespaces=nsmap):
+            lang = langtags.standardize_tag(tl.attrib["lang"])
+            if languages is None or lang in languages:
+                self._text_layers[lang] = _read_text_layer(tl, nsmap)
+            else:
+                if self._unloaded_layers is _NO_LAYERS:
+                    self._unloaded_layers = {}
+                self._unloaded_layers[lang] = tl
+
+    def list_text_layers(self) -> Set[str]:
+        """Languages of all the text layers on the page. This includes text layers that were not loaded because of
+        the ``languages`` filter of :class:`ACBFBook <libacbf.ACBFBook>`.
+
+        Returns
+        -------
+        Set[str]
+            A set of standard language codes.
+        """
+        self._load()
+        return set(self._text_layers.keys()) | set(self._unloaded_layers.keys())
+
+    def load_text_layers(self, *langs: str) -> Dict[str, TextLayer]:
+        """Load text layers that were skipped by the ``languages`` filter of :class:`ACBFBook <libacbf.ACBFBook>` into
+        :attr:`text_layers`.
+
+        Parameters
+        ----------
+        *langs : str
+            Languages of the text layers to load. Loads all remaining text layers if nothing is passed.
+
+        Returns
+        -------
+        Dict[str, TextLayer]
+            The same as :attr:`text_layers`.
+        """
+        self._load()
+        langs = [langtags.standardize_tag(x) for x in langs] if len(langs) > 0 else list(self._unloaded_layers)
+        for lang in langs:
+            if lang in self._unloaded_layers:
+                self._text_layers[lang] = _read_text_layer(self._unloaded_layers.pop(lang), self._book._nsmap)
+        return self._text_layers
+
     @property
     def image(self) -> BookData:
         """Gets the image data from the source.
@@ -164,15 +278,23 @@ class Page:
             A :class:`BookData <libacbf.bookdata.BookData>` object.
         """
         if self._image is None:
+            self._image = self._read_image()
+        return self._image
+
+    def _read_image(self, contents: Optional[bytes] = None) -> BookData:
+        """Reads the image from the source without keeping it in the page. ``contents`` can be passed if the file was
+        already read.
+        """
+        if contents is None:
             if self.ref_type == consts.ImageRefType.Embedded:
-                self._image = self._book.data[self._file_id]
-                return self._image
+                return self._book.data[self._file_id]
 
             elif self.ref_type == consts.ImageRefType.Archived:
                 with ArchiveReader(self._arch_path) as ext_archive:
                     contents = ext_archive.read(str(self._file_path))
 
             elif self.ref_type == consts.ImageRefType.URL:
+                import requests
                 response = requests.get(self.image_ref)
                 contents = response.content
 
@@ -183,10 +305,53 @@ class Page:
                     with open(str(self._file_path), "rb") as image:
                         contents = image.read()
 
-            contents_type = magic.from_buffer(contents, True)
-            self._image = BookData(self._file_id, contents_type, contents)
+        import magic
+        contents_type = magic.from_buffer(contents, True)
+        return BookData(self._file_id, contents_type, contents)
 
-        return self._image
+    @property
+    def image_size(self) -> Optional[Tuple[int, int]]:
+        """Width and height of the image in pixels. Only the header of the image is read, see
+        :mod:`libacbf.imagesize`. The size is cached per file so pages that use the same image only read it once.
+
+        Returns
+        -------
+        Tuple[int, int] | None
+            ``(width, height)`` or ``None`` if the image format is not recognised.
+        """
+        if self.ref_type in (consts.ImageRefType.SelfArchived, consts.ImageRefType.Local):
+            key = str(self._file_path)
+        else:
+            key = self.image_ref
+
+        sizes = self._book._image_sizes
+        if key not in sizes:
+            if self._image is not None:
+                sizes[key] = get_image_size(self._image.data)
+
+            elif self.ref_type == consts.ImageRefType.Embedded:
+                sizes[key] = get_image_size(self._book.data[self._file_id].data)
+
+            elif self.ref_type == consts.ImageRefType.Archived:
+                with ArchiveReader(self._arch_path) as ext_archive:
+                    with ext_archive.open(str(self._file_path)) as image:
+                        sizes[key] = get_image_size(image)
+
+            elif self.ref_type == consts.ImageRefType.URL:
+                import requests
+                with requests.get(self.image_ref, stream=True) as response:
+                    response.raw.decode_content = True
+                    sizes[key] = get_image_size(response.raw)
+
+            elif self.ref_type == consts.ImageRefType.SelfArchived:
+                with self._book.archive.open(str(self._file_path)) as image:
+                    sizes[key] = get_image_size(image)
+
+            elif self.ref_type == consts.ImageRefType.Local:
+                with open(str(self._file_path), "rb") as image:
+                    sizes[key] = get_image_size(image)
+
+        return sizes[key]
 
     @helpers.check_book
     def set_transition(self, tr: Optional[str]):
@@ -279,6 +444,129 @@ class Page:
         return jp
 
 
+def _read_text_layer(tl, nsmap) -> TextLayer:
+    """Create a TextLayer from its XML element.
+    """
+    layer = TextLayer()
+
+    if "bgcolor" in tl.keys():
+        layer.bgcolor = sys.intern(tl.attrib["bgcolor"])
+
+    # Text Areas
+    for ta in tl.findall("text-area", namespaces=nsmap):
+        text = helpers.tree_to_para(ta, nsmap)
+        pts = helpers.pts_to_vec(ta.attrib["points"])
+        area = TextArea(text, pts)
+        layer.text_areas.append(area)
+
+        if "bgcolor" in ta.keys():
+            area.bgcolor = sys.intern(ta.attrib["bgcolor"])
+
+        if "text-rotation" in ta.keys():
+            rot = int(ta.attrib["text-rotation"])
+            if 0 <= rot <= 360:
+                area.rotation = rot
+            else:
+                raise ValueError("Rotation must be an integer from 0 to 360.")
+
+        if "type" in ta.keys():
+            area.type = consts.TextAreas[ta.attrib["type"]]
+
+        if "inverted" in ta.keys():
+            area.inverted = helpers.strtobool(ta.attrib["inverted"])
+
+        if "transparent" in ta.keys():
+            area.transparent = helpers.strtobool(ta.attrib["transparent"])
+
+    return layer
+
+
+def _load_page(pg, book: ACBFBook, coverpage: bool = False) -> Page:
+    """Create a Page from its XML element. Frames, jumps and text layers are only read when they are first accessed.
+    """
+    nsmap = book._nsmap
+
+    image = pg.find("image", namespaces=nsmap)
+    page = Page(image.attrib["href"] if image is not None else '', book, coverpage)
+    page._element = pg
+
+    if not coverpage:
+        if "bgcolor" in pg.keys():
+            page.bgcolor = sys.intern(pg.attrib["bgcolor"])
+
+        if "transition" in pg.keys():
+            page.transition = consts.PageTransitions[pg.attrib["transition"]]
+
+        for title in pg.findall("title", namespaces=nsmap):
+            lang = '_'
+            if "lang" in title.keys():
+                lang = langtags.standardize_tag(title.attrib["lang"])
+            page.title[lang] = title.text
+
+    return page
+
+
+def _load_indexed_page(entry: IndexedPage, position: int, book: ACBFBook) -> Page:
+    """Create a Page from its entry in the index of the book. Frames, jumps and text layers are read from the whole
+    XML when they are first accessed.
+    """
+    page = Page(entry.href, book)
+    page._element = position
+    page.bgcolor = entry.bgcolor
+    if entry.transition is not None:
+        page.transition = consts.PageTransitions[entry.transition]
+    page.title.update(entry.title)
+    return page
+
+
+class PageList(MutableSequence):
+    """A list of pages that only creates :class:`Page` objects from the XML when they are accessed. It can be used
+    like a regular list of :class:`Page` objects.
+
+    Slicing and :meth:`copy()` return a regular ``list`` of pages.
+    """
+
+    def __init__(self, book: ACBFBook, elements: Iterable = ()):
+        self._book = book
+        self._items: list = list(elements)  # Page objects or XML elements of pages not accessed yet
+
+    def _get(self, index: int) -> Page:
+        item = self._items[index]
+        if not isinstance(item, Page):
+            item = _load_page(item, self._book)
+            self._items[index] = item
+        return item
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Page, List[Page]]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._items)))]
+        return self._get(index)
+
+    def __setitem__(self, index: Union[int, slice], value: Union[Page, Iterable[Page]]):
+        self._items[index] = value
+
+    def __delitem__(self, index: Union[int, slice]):
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Page]:
+        for i in range(len(self._items)):
+            yield self._get(i)
+
+    def __repr__(self):
+        return f"<libacbf.body.PageList pages={len(self._items)}>"
+
+    def insert(self, index: int, value: Page):
+        self._items.insert(index, value)
+
+    def copy(self) -> List[Page]:
+        """Returns a regular list with all the pages.
+        """
+        return self[:]
+
+
 class TextLayer:
     """Defines a text layer drawn on a page.
 
@@ -295,6 +583,8 @@ class TextLayer:
         Defines the background colour of the text areas or inherits from :attr:`Page.bgcolor` if ``None``.
     """
 
+    __slots__ = ("text_areas", "bgcolor")
+
     def __init__(self, *areas: TextArea):
         self.text_areas: List[TextArea] = list(areas)
         self.bgcolor: Optional[str] = None
@@ -341,7 +631,23 @@ class TextLayer:
         return ta
 
 
-class TextArea:
+class _Shape:
+    """Base of the classes that are defined by a list of points. Lists of ``(x, y)`` tuples are converted to
+    :class:`Points <libacbf.points.Points>` when set.
+    """
+
+    __slots__ = ("_points",)
+
+    @property
+    def points(self) -> Points:
+        return self._points
+
+    @points.setter
+    def points(self, val: Iterable[Tuple[int, int]]):
+        self._points = val if isinstance(val, Points) else Points(val)
+
+
+class TextArea(_Shape):
     """Defines an area where text is drawn.
 
     See Also
@@ -350,8 +656,8 @@ class TextArea:
 
     Attributes
     ----------
-    points : List[Tuple[int, int]]
-        A list of tuples as coordinates.
+    points : Points
+        Corners of the text area as :class:`Points <libacbf.points.Points>`. Lists of ``(x, y)`` tuples are converted.
 
     text : str
         A multiline string of what text to show in the are. Can have special tags for formatting.
@@ -393,9 +699,11 @@ class TextArea:
         Whether text is drawn.
     """
 
-    def __init__(self, text: str, points: List[Tuple[int, int]]):
+    __slots__ = ("text", "bgcolor", "rotation", "type", "inverted", "transparent")
+
+    def __init__(self, text: str, points: Iterable[Tuple[int, int]]):
         self.text: str = text
-        self.points: List[Tuple[int, int]] = points
+        self.points = points  # Set property
 
         # --- Optional ---
         self.bgcolor: Optional[str] = None
@@ -415,7 +723,7 @@ class TextArea:
         self.type = consts.TextAreas[ty] if ty is not None else ty
 
 
-class Frame:
+class Frame(_Shape):
     """A subsection of a page.
 
     See Also
@@ -424,20 +732,22 @@ class Frame:
 
     Attributes
     ----------
-    points : List[Tuple[int, int]]
-        A list of tuples as coordinates.
+    points : Points
+        Corners of the frame as :class:`Points <libacbf.points.Points>`. Lists of ``(x, y)`` tuples are converted.
 
     bgcolor : str, optional
         Defines the background colour for the page. Inherits from :attr:`Page.bgcolor <libacbf.body.Page.bgcolor>` if
         ``None``.
     """
 
-    def __init__(self, points: List[Tuple[int, int]]):
-        self.points: List[Tuple[int, int]] = points
+    __slots__ = ("bgcolor",)
+
+    def __init__(self, points: Iterable[Tuple[int, int]]):
+        self.points = points  # Set property
         self.bgcolor: Optional[str] = None
 
 
-class Jump:
+class Jump(_Shape):
     """Clickable area on a page which navigates to another page.
 
     See Also
@@ -449,15 +759,18 @@ class Jump:
     target : int
         The target page index. Cover page is ``0``, first page is ``1``, second page is ``2`` and so on.
 
-    points : List[Tuple[int, int]]
-        A list of tuples as coordinates.
+    points : Points
+        Corners of the clickable area as :class:`Points <libacbf.points.Points>`. Lists of ``(x, y)`` tuples are
+        converted.
     """
 
-    def __init__(self, target: int, points: List[Tuple[int, int]], book: ACBFBook):
+    __slots__ = ("_book", "target")
+
+    def __init__(self, target: int, points: Iterable[Tuple[int, int]], book: ACBFBook):
         self._book = book
 
         self.target = target
-        self.points: List[Tuple[int, int]] = points
+        self.points = points  # Set property
 
     @property
     def page(self) -> Page:
@@ -21,6 +21,8 @@ class BookData:
         The actual file's data.
     """
 
+    __slots__ = ("_base64data", "id", "type", "is_embedded", "data")
+
     def __init__(self, id: str, file_type: str, data: Union[str, bytes]):
         self._base64data: Optional[str] = None
 
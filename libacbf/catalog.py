@@ -0,0 +1,672 @@
+"""An SQLite index of the metadata of many books.
+
+:class:`Catalog` scans directory trees and stores the :class:`BookInfo <libacbf.libacbf.BookInfo>`,
+:class:`PublishInfo <libacbf.libacbf.PublishInfo>` and :class:`DocumentInfo <libacbf.libacbf.DocumentInfo>` of every
+book in a database. Only the metadata section of each book is parsed (see
+:meth:`ACBFBook.read_metadata() <libacbf.ACBFBook.read_metadata>`). Rescans skip files whose size, modification time and
+inode have not changed.
+
+Examples
+--------
+::
+
+    from libacbf.catalog import Catalog
+
+    with Catalog("library.db") as catalog:
+        result = catalog.scan("path/to/comics")
+        print(result.added, result.updated, result.failed)
+
+        for book in catalog.by_series("Craphound"):
+            print(book.path, book.series["Craphound"].sequence)
+
+        books = catalog.by_author("Cory Doctorow")
+        books = catalog.by_genre("science_fiction")
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import libacbf.constants as consts
+import libacbf.metadata as metadata
+
+EXTENSIONS: Tuple[str, ...] = (".acbf", ".cbz", ".cb7", ".cbt", ".cbr", ".zip", ".7z", ".tar", ".rar")
+"""File extensions that :meth:`Catalog.scan` indexes by default."""
+
+_schema_version = 1
+
+_schema = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    coverpage TEXT,
+    publisher TEXT,
+    publish_date TEXT,
+    publish_date_value TEXT,
+    publish_city TEXT,
+    isbn TEXT,
+    license TEXT,
+    creation_date TEXT,
+    creation_date_value TEXT,
+    source TEXT,
+    document_id TEXT,
+    document_version TEXT
+);
+CREATE TABLE IF NOT EXISTS titles (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    lang TEXT NOT NULL,
+    title TEXT
+);
+CREATE TABLE IF NOT EXISTS annotations (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    lang TEXT NOT NULL,
+    annotation TEXT
+);
+CREATE TABLE IF NOT EXISTS authors (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    document INTEGER NOT NULL,
+    first_name TEXT COLLATE NOCASE,
+    middle_name TEXT,
+    last_name TEXT COLLATE NOCASE,
+    nickname TEXT COLLATE NOCASE,
+    activity TEXT,
+    lang TEXT
+);
+CREATE TABLE IF NOT EXISTS genres (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    genre TEXT NOT NULL,
+    match INTEGER
+);
+CREATE TABLE IF NOT EXISTS series (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    title TEXT NOT NULL COLLATE NOCASE,
+    sequence TEXT,
+    volume TEXT
+);
+CREATE TABLE IF NOT EXISTS languages (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    lang TEXT NOT NULL,
+    show INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS characters (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    lang TEXT NOT NULL,
+    keyword TEXT NOT NULL COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS content_ratings (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    type TEXT,
+    rating TEXT
+);
+CREATE TABLE IF NOT EXISTS database_refs (
+    book_id INTEGER NOT NULL REFERENCES books(id) ON DELETE CASCADE,
+    dbname TEXT NOT NULL,
+    reference TEXT,
+    type TEXT
+);
+CREATE TABLE IF NOT EXISTS failures (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS titles_book ON titles(book_id);
+CREATE INDEX IF NOT EXISTS titles_title ON titles(title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS annotations_book ON annotations(book_id);
+CREATE INDEX IF NOT EXISTS authors_book ON authors(book_id);
+CREATE INDEX IF NOT EXISTS authors_last_name ON authors(last_name);
+CREATE INDEX IF NOT EXISTS authors_nickname ON authors(nickname);
+CREATE INDEX IF NOT EXISTS genres_book ON genres(book_id);
+CREATE INDEX IF NOT EXISTS genres_genre ON genres(genre);
+CREATE INDEX IF NOT EXISTS series_book ON series(book_id);
+CREATE INDEX IF NOT EXISTS series_title ON series(title);
+CREATE INDEX IF NOT EXISTS languages_book ON languages(book_id);
+CREATE INDEX IF NOT EXISTS languages_lang ON languages(lang);
+CREATE INDEX IF NOT EXISTS characters_book ON characters(book_id);
+CREATE INDEX IF NOT EXISTS keywords_book ON keywords(book_id);
+CREATE INDEX IF NOT EXISTS keywords_keyword ON keywords(keyword);
+CREATE INDEX IF NOT EXISTS content_ratings_book ON content_ratings(book_id);
+CREATE INDEX IF NOT EXISTS database_refs_book ON database_refs(book_id);
+"""
+
+_child_tables = ("titles", "annotations", "authors", "genres", "series", "languages", "characters", "keywords",
+                 "content_ratings", "database_refs")
+
+
+class AuthorRecord(NamedTuple):
+    """An author in a :class:`BookRecord`. Same as :class:`Author <libacbf.metadata.Author>` with ``activity`` as the
+    name of the :class:`AuthorActivities <libacbf.constants.AuthorActivities>` value.
+    """
+    first_name: Optional[str]
+    middle_name: Optional[str]
+    last_name: Optional[str]
+    nickname: Optional[str]
+    activity: Optional[str]
+    lang: Optional[str]
+
+    @classmethod
+    def from_author(cls, author: metadata.Author) -> AuthorRecord:
+        return cls(author.first_name, author.middle_name, author.last_name, author.nickname,
+                   author.activity.name if author.activity is not None else None, author.lang)
+
+
+class SeriesRecord(NamedTuple):
+    """An entry of :attr:`BookRecord.series`.
+    """
+    sequence: str
+    volume: Optional[str]
+
+
+class DBRefRecord(NamedTuple):
+    """An entry of :attr:`BookRecord.database_ref`.
+    """
+    dbname: str
+    reference: str
+    type: Optional[str]
+
+
+class BookRecord(NamedTuple):
+    """The metadata of a book as plain values. It can be pickled and compared and does not keep the book open.
+
+    Dates are ISO formatted strings. Genres are names of :class:`Genres <libacbf.constants.Genres>` values.
+    """
+    path: str
+
+    # Book Info
+    authors: List[AuthorRecord]
+    book_title: Dict[str, str]
+    genres: Dict[str, Optional[int]]
+    annotations: Dict[str, str]
+    coverpage: Optional[str]
+    languages: List[Tuple[str, bool]]
+    characters: List[str]
+    keywords: Dict[str, List[str]]
+    series: Dict[str, SeriesRecord]
+    content_rating: Dict[str, str]
+    database_ref: List[DBRefRecord]
+
+    # Publish Info
+    publisher: Optional[str]
+    publish_date: Optional[str]
+    publish_date_value: Optional[str]
+    publish_city: Optional[str]
+    isbn: Optional[str]
+    license: Optional[str]
+
+    # Document Info
+    document_authors: List[AuthorRecord]
+    creation_date: Optional[str]
+    creation_date_value: Optional[str]
+    source: Optional[str]
+    document_id: Optional[str]
+    document_version: Optional[str]
+
+    @classmethod
+    def from_book(cls, path: Union[str, Path], book_info, publisher_info, document_info) -> BookRecord:
+        """Make a record from the sections returned by :meth:`ACBFBook.read_metadata()
+        <libacbf.ACBFBook.read_metadata>` or an open book.
+        """
+        return cls(
+            path=str(path),
+            authors=[AuthorRecord.from_author(x) for x in book_info.authors],
+            book_title=dict(book_info.book_title),
+            genres={x.name: y for x, y in book_info.genres.items()},
+            annotations=dict(book_info.annotations),
+            coverpage=book_info.coverpage.image_ref if book_info.coverpage is not None else None,
+            languages=[(x.lang, x.show) for x in book_info.languages],
+            characters=list(book_info.characters),
+            keywords={x: sorted(y) for x, y in book_info.keywords.items()},
+            series={x: SeriesRecord(y.sequence, y.volume) for x, y in book_info.series.items()},
+            content_rating=dict(book_info.content_rating),
+            database_ref=[DBRefRecord(x.dbname, x.reference, x.type) for x in book_info.database_ref],
+            publisher=publisher_info.publisher,
+            publish_date=publisher_info.publish_date,
+            publish_date_value=_isoformat(publisher_info.publish_date_value),
+            publish_city=publisher_info.publish_city,
+            isbn=publisher_info.isbn,
+            license=publisher_info.license,
+            document_authors=[AuthorRecord.from_author(x) for x in document_info.authors],
+            creation_date=document_info.creation_date,
+            creation_date_value=_isoformat(document_info.creation_date_value),
+            source=document_info.source,
+            document_id=document_info.document_id,
+            document_version=document_info.document_version
+            )
+
+
+class ScanResult(NamedTuple):
+    """Returned by :meth:`Catalog.scan`.
+    """
+    added: int
+    updated: int
+    unchanged: int
+    removed: int
+    failed: Dict[str, str]
+    """Paths of books that could not be read and the error messages."""
+
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def read_record(path: Union[str, Path]) -> BookRecord:
+    """Read the metadata of a book into a :class:`BookRecord`.
+    """
+    from libacbf import ACBFBook
+    return BookRecord.from_book(path, *ACBFBook.read_metadata(path))
+
+
+def iter_books(paths: Iterable[Union[str, Path]], extensions: Iterable[str] = EXTENSIONS) -> Iterator[str]:
+    """Yields the absolute paths of the given files and of the books found recursively in the given directories.
+    Directories are searched in sorted order.
+
+    Parameters
+    ----------
+    paths : Iterable[str | pathlib.Path]
+        Files and directories.
+
+    extensions : Iterable[str], default=EXTENSIONS
+        File extensions of books in directories. Case insensitive.
+    """
+    extensions = {x.lower() for x in extensions}
+    for path in paths:
+        path = Path(path).resolve()
+        if path.is_file():
+            yield str(path)
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in extensions:
+                    yield os.path.join(root, name)
+
+
+def _stat(path: str) -> Tuple[int, int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class Catalog:
+    """An SQLite database of book metadata.
+
+    Parameters
+    ----------
+    database : str | pathlib.Path, default=":memory:"
+        Path to the database file. It is created if it does not exist.
+
+    Attributes
+    ----------
+    connection : sqlite3.Connection
+        Connection to the database. Can be used for custom queries. See the ``CREATE TABLE`` statements in the source
+        for the tables. Child tables are linked by ``book_id`` to ``books.id``.
+    """
+
+    def __init__(self, database: Union[str, Path] = ":memory:"):
+        self.connection: sqlite3.Connection = sqlite3.connect(str(database))
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _schema_version):
+            self.connection.close()
+            raise ValueError(f"Catalog database has unsupported version {version}.")
+
+        with self.connection:
+            self.connection.executescript(_schema)
+            self.connection.execute(f"PRAGMA user_version = {_schema_version}")
+
+    def __repr__(self):
+        return f"<libacbf.catalog.Catalog books={len(self)}>"
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def __contains__(self, path: Union[str, Path]):
+        path = str(Path(path).resolve())
+        return self.connection.execute("SELECT 1 FROM books WHERE path = ?", (path,)).fetchone() is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database.
+        """
+        self.connection.close()
+
+    #region Indexing
+
+    def _is_unchanged(self, path: str, stat: Tuple[int, int, int]) -> bool:
+        row = self.connection.execute("SELECT size, mtime_ns, inode FROM books WHERE path = ? UNION ALL "
+                                      "SELECT size, mtime_ns, inode FROM failures WHERE path = ?",
+                                      (path, path)).fetchone()
+        return row is not None and tuple(row) == stat
+
+    def add_record(self, record: BookRecord, stat: Optional[Tuple[int, int, int]] = None) -> bool:
+        """Add or replace the metadata of a book. Returns ``True`` if the book was already in the catalog.
+
+        Parameters
+        ----------
+        record : BookRecord
+            Metadata of the book. ``record.path`` should be an absolute path.
+
+        stat : Tuple[int, int, int], optional
+            ``(size, mtime_ns, inode)`` of the file. Read from the file if not given.
+        """
+        if stat is None:
+            stat = _stat(record.path)
+
+        db = self.connection
+        db.execute("DELETE FROM failures WHERE path = ?", (record.path,))
+        row = db.execute("SELECT id FROM books WHERE path = ?", (record.path,)).fetchone()
+
+        values = (record.path, *stat, record.coverpage, record.publisher, record.publish_date,
+                  record.publish_date_value, record.publish_city, record.isbn, record.license, record.creation_date,
+                  record.creation_date_value, record.source, record.document_id, record.document_version)
+
+        if row is not None:
+            book_id = row[0]
+            for table in _child_tables:
+                db.execute(f"DELETE FROM {table} WHERE book_id = ?", (book_id,))
+            db.execute("UPDATE books SET path = ?, size = ?, mtime_ns = ?, inode = ?, coverpage = ?, publisher = ?, "
+                       "publish_date = ?, publish_date_value = ?, publish_city = ?, isbn = ?, license = ?, "
+                       "creation_date = ?, creation_date_value = ?, source = ?, document_id = ?, document_version = ? "
+                       "WHERE id = ?", (*values, book_id))
+        else:
+            book_id = db.execute("INSERT INTO books (path, size, mtime_ns, inode, coverpage, publisher, publish_date, "
+                                 "publish_date_value, publish_city, isbn, license, creation_date, creation_date_value, "
+                                 "source, document_id, document_version) "
+                                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values).lastrowid
+
+        db.executemany("INSERT INTO titles VALUES (?, ?, ?)",
+                       [(book_id, x, y) for x, y in record.book_title.items()])
+        db.executemany("INSERT INTO annotations VALUES (?, ?, ?)",
+                       [(book_id, x, y) for x, y in record.annotations.items()])
+        authors = [(book_id, 0, *x) for x in record.authors]
+        authors.extend((book_id, 1, *x) for x in record.document_authors)
+        db.executemany("INSERT INTO authors VALUES (?, ?, ?, ?, ?, ?, ?, ?)", authors)
+        db.executemany("INSERT INTO genres VALUES (?, ?, ?)",
+                       [(book_id, x, y) for x, y in record.genres.items()])
+        db.executemany("INSERT INTO series VALUES (?, ?, ?, ?)",
+                       [(book_id, x, *y) for x, y in record.series.items()])
+        db.executemany("INSERT INTO languages VALUES (?, ?, ?)",
+                       [(book_id, x, int(y)) for x, y in record.languages])
+        db.executemany("INSERT INTO characters VALUES (?, ?)",
+                       [(book_id, x) for x in record.characters])
+        db.executemany("INSERT INTO keywords VALUES (?, ?, ?)",
+                       [(book_id, x, k) for x, y in record.keywords.items() for k in y])
+        db.executemany("INSERT INTO content_ratings VALUES (?, ?, ?)",
+                       [(book_id, x, y) for x, y in record.content_rating.items()])
+        db.executemany("INSERT INTO database_refs VALUES (?, ?, ?, ?)",
+                       [(book_id, *x) for x in record.database_ref])
+
+        return row is not None
+
+    def add_failure(self, path: str, error: str, stat: Optional[Tuple[int, int, int]] = None):
+        """Remember that a file could not be read so it is skipped by later scans until it changes.
+        """
+        if stat is None:
+            stat = _stat(path)
+        self.connection.execute("DELETE FROM books WHERE path = ?", (path,))
+        self.connection.execute("INSERT OR REPLACE INTO failures VALUES (?, ?, ?, ?, ?)", (path, *stat, error))
+
+    def remove(self, path: Union[str, Path]):
+        """Remove a book from the catalog.
+        """
+        path = str(Path(path).resolve())
+        with self.connection:
+            self.connection.execute("DELETE FROM books WHERE path = ?", (path,))
+            self.connection.execute("DELETE FROM failures WHERE path = ?", (path,))
+
+    def scan(self, *paths: Union[str, Path], extensions: Iterable[str] = EXTENSIONS, prune: bool = True,
+             progress: Optional[Callable[[int, str], None]] = None, workers: int = 1,
+             commit_every: int = 500) -> ScanResult:
+        """Index books in directories and files. Books that have not changed since the last scan are skipped. So are
+        files that failed to be read before.
+
+        Parameters
+        ----------
+        *paths : str | pathlib.Path
+            Directories to scan recursively or single files.
+
+        extensions : Iterable[str], default=EXTENSIONS
+            File extensions to index in directories. Case insensitive.
+
+        prune : bool, default=True
+            Remove books from the catalog that are inside scanned directories but no longer exist.
+
+        progress : Callable[[int, str], None], optional
+            Called with the number of files processed so far and the path of the file after each file.
+
+        workers : int, default=1
+            Number of processes to read changed books with. See :func:`libacbf.batch.scan`. ``None`` uses
+            ``os.cpu_count()``.
+
+        commit_every : int, default=500
+            Number of books to index between commits.
+
+        Returns
+        -------
+        ScanResult
+            Counts of added, updated, unchanged and removed books and the books that could not be read.
+        """
+        from libacbf.batch import ScanFailure, iter_pool, scan_book
+
+        added = updated = unchanged = 0
+        failed = {}
+        done = 0
+
+        seen = set()
+        changed = {}
+        for path in iter_books(paths, extensions):
+            seen.add(path)
+            try:
+                stat = _stat(path)
+            except OSError as e:
+                failed[path] = f"{type(e).__name__}: {e}"
+                continue
+
+            if self._is_unchanged(path, stat):
+                unchanged += 1
+                done += 1
+                if progress is not None:
+                    progress(done, path)
+            else:
+                changed[path] = stat
+
+        pending = 0
+        try:
+            for item in iter_pool(scan_book, changed, workers, chunksize=16):
+                if isinstance(item, ScanFailure):
+                    failed[item.path] = f"{item.error_type}: {item.error}"
+                    self.add_failure(item.path, failed[item.path], changed[item.path])
+                elif self.add_record(item, changed[item.path]):
+                    updated += 1
+                else:
+                    added += 1
+
+                pending += 1
+                if pending >= commit_every:
+                    self.connection.commit()
+                    pending = 0
+
+                done += 1
+                if progress is not None:
+                    progress(done, item.path)
+
+            removed = self._prune(paths, seen) if prune else 0
+        finally:
+            self.connection.commit()
+
+        return ScanResult(added, updated, unchanged, removed, failed)
+
+    def _prune(self, paths: Iterable[Union[str, Path]], seen: set) -> int:
+        removed = 0
+        for path in paths:
+            path = Path(path).resolve()
+            if path.is_file():
+                continue
+
+            prefix = str(path).rstrip(os.sep) + os.sep
+            pattern = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            for table in ("books", "failures"):
+                rows = self.connection.execute(f"SELECT path FROM {table} WHERE path LIKE ? ESCAPE '\\'",
+                                               (pattern,)).fetchall()
+                gone = [(x,) for x, in rows if x not in seen]
+                self.connection.executemany(f"DELETE FROM {table} WHERE path = ?", gone)
+                if table == "books":
+                    removed += len(gone)
+        return removed
+
+    #endregion
+
+    #region Queries
+
+    def get(self, path: Union[str, Path]) -> Optional[BookRecord]:
+        """Returns the metadata of a book or ``None`` if it is not in the catalog.
+        """
+        path = str(Path(path).resolve())
+        row = self.connection.execute("SELECT id FROM books WHERE path = ?", (path,)).fetchone()
+        return self._load([row[0]])[0] if row is not None else None
+
+    def failures(self) -> Dict[str, str]:
+        """Returns the paths of files that could not be read and the error messages.
+        """
+        return dict(self.connection.execute("SELECT path, error FROM failures ORDER BY path"))
+
+    def by_series(self, title: str) -> List[BookRecord]:
+        """Returns the books of a series ordered by sequence number. Case insensitive.
+        """
+        rows = self.connection.execute("SELECT book_id FROM series WHERE title = ? "
+                                       "ORDER BY CAST(sequence AS REAL), sequence", (title,))
+        return self._load([x for x, in rows])
+
+    def by_author(self, name: str, document: bool = False) -> List[BookRecord]:
+        """Returns the books by an author. ``name`` is matched against the nickname, the last name and the full name
+        (first, optional middle and last name separated by spaces). Case insensitive.
+
+        Parameters
+        ----------
+        name : str
+            Name of the author.
+
+        document : bool, default=False
+            Match the authors of the ACBF document (:attr:`DocumentInfo.authors
+            <libacbf.libacbf.DocumentInfo.authors>`) instead of the authors of the book.
+        """
+        rows = self.connection.execute(
+            "SELECT DISTINCT book_id FROM authors WHERE document = :document AND (nickname = :name "
+            "OR last_name = :name OR first_name || ' ' || last_name = :name COLLATE NOCASE "
+            "OR first_name || ' ' || middle_name || ' ' || last_name = :name COLLATE NOCASE) ORDER BY book_id",
+            {"document": int(document), "name": name})
+        return self._load([x for x, in rows])
+
+    def by_genre(self, genre: Union[str, consts.Genres], min_match: Optional[int] = None) -> List[BookRecord]:
+        """Returns the books of a genre.
+
+        Parameters
+        ----------
+        genre : str | Genres
+            Name or value of :class:`Genres <libacbf.constants.Genres>`.
+
+        min_match : int, optional
+            Only return books where the genre's match percentage is at least this. Books without a match value are
+            excluded if this is set.
+        """
+        if isinstance(genre, consts.Genres):
+            genre = genre.name
+
+        if min_match is None:
+            rows = self.connection.execute("SELECT book_id FROM genres WHERE genre = ? ORDER BY book_id", (genre,))
+        else:
+            rows = self.connection.execute("SELECT book_id FROM genres WHERE genre = ? AND match >= ? "
+                                           "ORDER BY match DESC, book_id", (genre, min_match))
+        return self._load([x for x, in rows])
+
+    def by_title(self, text: str) -> List[BookRecord]:
+        """Returns the books with a title in any language that contains ``text``. Case insensitive for ASCII letters.
+        """
+        pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        rows = self.connection.execute("SELECT DISTINCT book_id FROM titles WHERE title LIKE ? ESCAPE '\\' "
+                                       "ORDER BY book_id", (pattern,))
+        return self._load([x for x, in rows])
+
+    def by_keyword(self, keyword: str) -> List[BookRecord]:
+        """Returns the books with a keyword in any language. Case insensitive.
+        """
+        rows = self.connection.execute("SELECT DISTINCT book_id FROM keywords WHERE keyword = ? ORDER BY book_id",
+                                       (keyword,))
+        return self._load([x for x, in rows])
+
+    def _load(self, ids: List[int]) -> List[BookRecord]:
+        """Build records for book ids in the given order.
+        """
+        records = {}
+        for start in range(0, len(ids), 500):
+            records.update(self._load_chunk(ids[start:start + 500]))
+        return [records[x] for x in ids]
+
+    def _load_chunk(self, ids: List[int]) -> Dict[int, BookRecord]:
+        db = self.connection
+        marks = ", ".join('?' * len(ids))
+
+        def rows(table: str, columns: str):
+            result = {x: [] for x in ids}
+            for book_id, *values in db.execute(f"SELECT book_id, {columns} FROM {table} WHERE book_id IN ({marks}) "
+                                               f"ORDER BY rowid", ids):
+                result[book_id].append(values)
+            return result
+
+        titles = rows("titles", "lang, title")
+        annotations = rows("annotations", "lang, annotation")
+        authors = rows("authors", "document, first_name, middle_name, last_name, nickname, activity, lang")
+        genres = rows("genres", "genre, match")
+        series = rows("series", "title, sequence, volume")
+        languages = rows("languages", "lang, show")
+        characters = rows("characters", "name")
+        keywords = rows("keywords", "lang, keyword")
+        ratings = rows("content_ratings", "type, rating")
+        refs = rows("database_refs", "dbname, reference, type")
+
+        records = {}
+        for book_id, path, coverpage, *values in db.execute(
+                "SELECT id, path, coverpage, publisher, publish_date, publish_date_value, publish_city, isbn, "
+                f"license, creation_date, creation_date_value, source, document_id, document_version FROM books "
+                f"WHERE id IN ({marks})", ids):
+            kwords: Dict[str, List[str]] = {}
+            for lang, keyword in keywords[book_id]:
+                kwords.setdefault(lang, []).append(keyword)
+
+            records[book_id] = BookRecord(
+                path,
+                [AuthorRecord(*x[1:]) for x in authors[book_id] if not x[0]],
+                {x: y for x, y in titles[book_id]},
+                {x: y for x, y in genres[book_id]},
+                {x: y for x, y in annotations[book_id]},
+                coverpage,
+                [(x, bool(y)) for x, y in languages[book_id]],
+                [x for x, in characters[book_id]],
+                kwords,
+                {x: SeriesRecord(y, z) for x, y, z in series[book_id]},
+                {x: y for x, y in ratings[book_id]},
+                [DBRefRecord(*x) for x in refs[book_id]],
+                *values[:6],
+                [AuthorRecord(*x[1:]) for x in authors[book_id] if x[0]],
+                *values[6:]
+                )
+        return records
+
+    #endregion
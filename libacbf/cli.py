@@ -0,0 +1,227 @@
+"""The ``libacbf`` command line tool.
+
+Every subcommand takes books, directories to search recursively for books and glob patterns. Books are processed in
+parallel with ``--jobs`` and a line is written for each book as soon as it is done. With ``--json`` each line is a JSON
+object so the output can be piped into other tools. A summary with the elapsed time is written to stderr at the end.
+
+Examples
+--------
+.. code-block:: sh
+
+    # Check that every book in a directory follows the schema and has all its pages
+    libacbf validate path/to/comics --jobs 8
+
+    # Decompress every file of every book to find damaged archives
+    libacbf verify path/to/comics --jobs 8
+
+    # Convert Rar, 7Zip and Tar books to Zip
+    libacbf convert "path/to/comics/**/*.cbr" --to zip --output-dir path/to/converted
+
+    # Dump the metadata of books as JSON lines
+    libacbf info path/to/comics --json > metadata.jsonl
+
+    # Save the cover images
+    libacbf extract-cover path/to/comics --output-dir path/to/covers
+
+The exit status is ``1`` if any book failed.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import argparse
+import mimetypes
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from libacbf.batch import expand_paths, iter_pool
+from libacbf.catalog import BookRecord
+
+_archive_extensions = {
+    "zip": ".cbz",
+    "7z": ".cb7",
+    "tar": ".cbt"
+    }
+
+_archive_types = {
+    "zip": "Zip",
+    "7z": "SevenZip",
+    "tar": "Tar"
+    }
+
+
+def _jsonable(value):
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        return {x: _jsonable(y) for x, y in value._asdict().items()}
+    elif isinstance(value, (list, tuple)):
+        return [_jsonable(x) for x in value]
+    elif isinstance(value, dict):
+        return {x: _jsonable(y) for x, y in value.items()}
+    return value
+
+
+#region Tasks
+# Tasks run in worker processes. They take a path and return a JSON serializable dictionary with ``"path"``, ``"ok"``
+# and ``"error"`` keys.
+
+def _task(path: str, function: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+    try:
+        result = {"path": path, "ok": True, "error": None}
+        result.update(function(path, *args))
+    except Exception as e:
+        result = {"path": path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    return result
+
+
+def _validate(path: str) -> Dict[str, Any]:
+    from libacbf import ACBFBook
+
+    with ACBFBook(path, use_index=False) as book:
+        missing = book.missing_images()
+        pages = len(book.body.pages)
+
+    if missing:
+        raise FileNotFoundError(f"Missing images: {', '.join(missing)}")
+    return {"pages": pages}
+
+
+def _verify(path: str, threads: int) -> Dict[str, Any]:
+    from libacbf.batch import verify_book
+
+    failures = verify_book(path, threads).failures
+    if not failures:
+        return {"failures": []}
+
+    error = "; ".join(f"{x.name or 'archive'}: {x.error_type}: {x.error}" for x in failures)
+    return {"ok": False, "error": error, "failures": _jsonable(failures)}
+
+
+def _info(path: str) -> Dict[str, Any]:
+    from libacbf import ACBFBook
+
+    record = BookRecord.from_book(path, *ACBFBook.read_metadata(path))
+    return {"metadata": _jsonable(record._asdict())}
+
+
+def _extract_cover(path: str, output_dir: Optional[str], overwrite: bool) -> Dict[str, Any]:
+    from libacbf import get_cover
+
+    cover = get_cover(path)
+    if cover is None:
+        raise ValueError("Book has no cover image.")
+
+    extension = Path(cover.id).suffix or mimetypes.guess_extension(cover.type) or ''
+    directory = Path(output_dir) if output_dir is not None else Path(path).parent
+    output = directory / (Path(path).stem + extension)
+    if output.exists() and not overwrite:
+        raise FileExistsError(str(output))
+
+    os.makedirs(directory, exist_ok=True)
+    with open(output, "wb") as file:
+        file.write(cover.data)
+    return {"output": str(output)}
+
+
+def _convert(path: str, to: str, compression: str, output_dir: Optional[str], overwrite: bool) -> Dict[str, Any]:
+    from libacbf.transcode import convert
+
+    directory = Path(output_dir) if output_dir is not None else Path(path).parent
+    output = directory / (Path(path).stem + _archive_extensions[to])
+    if output == Path(path):
+        raise ValueError("Book is already of this type.")
+    if output.exists() and not overwrite:
+        raise FileExistsError(str(output))
+
+    os.makedirs(directory, exist_ok=True)
+    convert(path, output, _archive_types[to], compression)
+    return {"output": str(output)}
+
+#endregion
+
+
+def _run(task: Callable[..., Dict[str, Any]], paths: List[str], jobs: int, *args) -> Iterator[Dict[str, Any]]:
+    """Yields the results of a task for each path as they finish.
+    """
+    return iter_pool(_task, paths, jobs, (task, *args))
+
+
+def _format(command: str, result: Dict[str, Any]) -> str:
+    if not result["ok"]:
+        return f"FAIL {result['path']}: {result['error']}"
+    elif command == "validate":
+        return f"OK   {result['path']} ({result['pages']} pages)"
+    elif command == "verify":
+        return f"OK   {result['path']}"
+    elif command == "info":
+        metadata = result["metadata"]
+        title = metadata["book_title"].get('_') or next(iter(metadata["book_title"].values()), '')
+        return f"{result['path']}: {title}"
+    else:
+        return f"{result['path']} -> {result['output']}"
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="libacbf", description="Validate, convert and read ACBF comic books.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs='+', metavar="path", help="Books, directories or glob patterns.")
+    common.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of books to process in parallel. 0 uses the number of CPUs. (default: 1)")
+    common.add_argument("--json", action="store_true", help="Write a JSON object per book.")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("-o", "--output-dir", help="Directory to write to. (default: next to each book)")
+    output.add_argument("--overwrite", action="store_true", help="Replace existing files.")
+
+    commands.add_parser("validate", parents=[common], help="Check books against the ACBF schema.")
+    verify = commands.add_parser("verify", parents=[common], help="Decompress every file to find damaged books.")
+    verify.add_argument("--threads", type=int, default=1,
+                        help="Number of threads that check the files of each book. (default: 1)")
+    commands.add_parser("info", parents=[common], help="Print the metadata of books.")
+    commands.add_parser("extract-cover", parents=[common, output], help="Save the cover images of books.")
+    convert = commands.add_parser("convert", parents=[common, output], help="Convert books to another archive type.")
+    convert.add_argument("--to", required=True, choices=sorted(_archive_types), help="Type of archive to write.")
+    convert.add_argument("--compression", default="auto", choices=("auto", "store", "compress"),
+                         help="Compression policy. See libacbf.convert(). (default: auto)")
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the ``libacbf`` command. Returns the exit status.
+    """
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        paths = expand_paths(args.paths)
+    except FileNotFoundError as e:
+        parser.error(f"No such file or directory: {e}")
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    if args.command == "validate":
+        results = _run(_validate, paths, jobs)
+    elif args.command == "verify":
+        results = _run(_verify, paths, jobs, args.threads)
+    elif args.command == "info":
+        results = _run(_info, paths, jobs)
+    elif args.command == "extract-cover":
+        results = _run(_extract_cover, paths, jobs, args.output_dir, args.overwrite)
+    else:
+        results = _run(_convert, paths, jobs, args.to, args.compression, args.output_dir, args.overwrite)
+
+    start = time.perf_counter()
+    failed = 0
+    for result in results:
+        if not result["ok"]:
+            failed += 1
+        print(json.dumps(result, ensure_ascii=False) if args.json else _format(args.command, result), flush=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(paths)} books, {len(paths) - failed} ok, {failed} failed in {elapsed:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
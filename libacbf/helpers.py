@@ -1,6 +1,9 @@
 from __future__ import annotations
 import re
-from typing import TYPE_CHECKING, List, Tuple
+import threading
+from queue import Queue
+from typing import TYPE_CHECKING, Iterator, List, Tuple, TypeVar, Union
+from array import array
 from functools import wraps
 from lxml import etree
 
@@ -9,11 +12,15 @@ if TYPE_CHECKING:
 
 from libacbf.constants import ArchiveTypes
 from libacbf.exceptions import EditRARArchiveError
+from libacbf.points import Points
 
 namespaces = {
     "1.1": "http://www.acbf.info/xml/acbf/1.1"
     }
 
+point_pattern = re.compile(r'\s*[+-]?\d+\s*,\s*[+-]?\d+(?=\s|$)')
+points_pattern = re.compile(r'\s*[+-]?\d+\s*,\s*[+-]?\d+(?:\s+[+-]?\d+\s*,\s*[+-]?\d+)*\s*')
+
 url_pattern = re.compile(r'([\w-]+://)(\w+:?\w*@)?(\S+)(:[0-9]+)?(/|/([\w#!:.?+=&%@\-/]))?', re.IGNORECASE)
 
 
@@ -40,31 +47,159 @@ def check_write(book: ACBFBook):
         raise EditRARArchiveError
 
 
-def pts_to_vec(pts_str: str):
-    """Converts string of number pairs separated by space and comma to a list of 2D vector named tuples.
+T = TypeVar('T')
+
+_end = object()  # Put in the queue of prefetch() after the last item
+
+
+class _Raised:
+    """An exception raised by the iterator of :func:`prefetch` that is passed to the consumer.
     """
-    pts = []
-    pts_l = re.split(" ", pts_str)
-    for pt in pts_l:
-        ls = map(int, re.split(",", pt))
-        pts.append(tuple(ls))
-    return pts
 
+    __slots__ = ("exception",)
 
-def vec_to_pts(points: List[Tuple[int, int]]):
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def prefetch(iterator: Iterator[T], size: int) -> Iterator[T]:
+    """Runs ``iterator`` in a background thread up to ``size`` items ahead of the consumer. The iterator is closed when
+    the returned generator is closed.
+    """
+    queue: Queue = Queue()
+    slots = threading.BoundedSemaphore(size)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            while True:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    queue.put(_end)
+                    return
+                queue.put(item)
+        except BaseException as e:
+            queue.put(_Raised(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = queue.get()
+            if item is _end:
+                break
+            if isinstance(item, _Raised):
+                raise item.exception
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def strtobool(val: str) -> bool:
+    """Converts a string representation of truth to ``True`` or ``False``. Same as the removed
+    ``distutils.util.strtobool()``.
+
+    Raises
+    ------
+    ValueError
+        Raised if the string is not one of ``y, yes, t, true, on, 1`` or ``n, no, f, false, off, 0``.
+    """
+    val = val.lower()
+    if val in ('y', "yes", 't', "true", "on", '1'):
+        return True
+    elif val in ('n', "no", 'f', "false", "off", '0'):
+        return False
+    else:
+        raise ValueError(f"Invalid truth value {val!r}.")
+
+
+def pts_to_vec(pts_str: str) -> Points:
+    """Converts string of number pairs separated by space and comma to a :class:`Points <libacbf.points.Points>`
+    object.
+
+    Raises
+    ------
+    ValueError
+        Raised if the string is not a list of points. The message contains the position of the first invalid point.
+    """
+    if points_pattern.fullmatch(pts_str) is None:
+        pos = 0
+        match = point_pattern.match(pts_str, pos)
+        while match is not None:
+            pos = match.end()
+            match = point_pattern.match(pts_str, pos)
+        _invalid_point(pts_str, pos)
+
+    try:
+        return Points._from_array(array('i', list(map(int, pts_str.replace(',', ' ').split()))))
+    except OverflowError:
+        # Find the first point with a coordinate that does not fit in the array
+        pos = 0
+        match = point_pattern.match(pts_str, pos)
+        while match is not None:
+            try:
+                array('i', map(int, match.group().replace(',', ' ').split()))
+            except OverflowError:
+                break
+            pos = match.end()
+            match = point_pattern.match(pts_str, pos)
+        _invalid_point(pts_str, pos)
+
+
+def _invalid_point(pts_str: str, pos: int):
+    pos += len(pts_str[pos:]) - len(pts_str[pos:].lstrip())
+    raise ValueError(f"Invalid point at position {pos} of points string {pts_str!r}.")
+
+
+def vec_to_pts(points: Union[Points, List[Tuple[int, int]]]) -> str:
     """Reverse of :meth:`pts_to_vec()`.
     """
-    return ' '.join([f"{x},{y}" for x, y in points])
+    if not isinstance(points, Points):
+        points = Points(points)
+    return points.to_str()
+
+
+def _escape_text(text: str) -> str:
+    """Escapes text the same way lxml does when serializing the text of an element.
+    """
+    if '&' in text:
+        text = text.replace('&', "&amp;")
+    if '<' in text:
+        text = text.replace('<', "&lt;")
+    if '>' in text:
+        text = text.replace('>', "&gt;")
+    if '\r' in text:
+        text = text.replace('\r', "&#13;")
+    return text
 
 
 def tree_to_para(p_root, nsmap):
     """Converts an XML tree with multiple 'p' tags to a multiline string.
     """
+    ns = nsmap.get(None)
+    tag = f"{{{ns}}}p" if ns is not None else 'p'
+
     pa = []
-    for p in p_root.findall("p", namespaces=nsmap):
-        p_text = etree.tostring(p, encoding="utf-8").decode("utf-8").strip()
-        text = re.sub(r'</?p[^>]*>', '', p_text)
-        pa.append(text)
+    for p in p_root.iterchildren(tag):
+        if len(p) == 0:
+            # Plain text
+            pa.append(_escape_text(p.text) if p.text is not None else '')
+        else:
+            # Inline markup. Serialize once and drop the outer `p` tags.
+            p_text = etree.tostring(p, encoding=str, with_tail=False)
+            pa.append(p_text[p_text.index('>') + 1:p_text.rindex('<')])
     return '\n'.join(pa)
 
 
@@ -72,11 +207,5 @@ def para_to_tree(paragraph: str, nsmap):
     """Reverse of :meth:`tree_to_para()`.
     """
     ns = nsmap[None]
-    p_elements = []
-    for p in re.split(r'\n', paragraph):
-        p = f"<p>{p}</p>"
-        p_root = etree.fromstring(p)
-        for i in p_root.iter():
-            i.tag = f"{{{ns}}}" + i.tag
-        p_elements.append(p_root)
-    return p_elements
+    p_root = etree.fromstring(f'<p-list xmlns="{ns}"><p>' + "</p><p>".join(paragraph.split('\n')) + "</p></p-list>")
+    return list(p_root)
@@ -0,0 +1,218 @@
+"""Read the pixel size of an image from its header without decoding it.
+
+Supports JPEG, PNG, GIF, WebP and AVIF/HEIF. Only the bytes up to the size information are read so a file object from
+:meth:`ArchiveReader.open() <libacbf.archivereader.ArchiveReader.open>` decompresses just the start of the image.
+
+Examples
+--------
+::
+
+    from libacbf.imagesize import get_image_size
+
+    with open("path/to/image.jpg", "rb") as file:
+        width, height = get_image_size(file)
+"""
+
+from __future__ import annotations
+
+import struct
+from io import BytesIO
+from typing import IO, Optional, Tuple, Union
+
+_png_signature = b"\x89PNG\r\n\x1a\n"
+
+# SOF markers. 0xC4 (DHT), 0xC8 (JPG) and 0xCC (DAC) are not frame headers.
+_jpeg_sof = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Markers without a length field
+_jpeg_standalone = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+_bmff_brands = (b"avif", b"avis", b"heic", b"heix", b"mif1", b"msf1")
+
+
+def _read(file: IO[bytes], size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise EOFError
+    return data
+
+
+def _skip(file: IO[bytes], size: int):
+    if size <= 0:
+        return
+    if file.seekable():
+        file.seek(size, 1)
+    else:
+        while size > 0:
+            chunk = file.read(min(size, 65536))
+            if not chunk:
+                raise EOFError
+            size -= len(chunk)
+
+
+def _jpeg_size(file: IO[bytes]) -> Optional[Tuple[int, int]]:
+    while True:
+        byte = _read(file, 1)
+        if byte != b"\xff":
+            continue
+
+        # Markers can be padded with any number of 0xFF bytes
+        marker = 0xFF
+        while marker == 0xFF:
+            marker = _read(file, 1)[0]
+
+        if marker == 0xD9:
+            return None
+        if marker in _jpeg_standalone or marker == 0x00:
+            continue
+
+        length = struct.unpack(">H", _read(file, 2))[0]
+        if marker in _jpeg_sof:
+            height, width = struct.unpack(">xHH", _read(file, 5))
+            return width, height
+        _skip(file, length - 2)
+
+
+def _webp_size(file: IO[bytes]) -> Optional[Tuple[int, int]]:
+    chunk = _read(file, 4)
+    if chunk == b"VP8 ":
+        header = _read(file, 14)
+        if header[7:10] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", header[10:14])
+        return width & 0x3FFF, height & 0x3FFF
+    elif chunk == b"VP8L":
+        header = _read(file, 9)
+        if header[4] != 0x2F:
+            return None
+        bits = int.from_bytes(header[5:9], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    elif chunk == b"VP8X":
+        header = _read(file, 14)
+        return int.from_bytes(header[8:11], "little") + 1, int.from_bytes(header[11:14], "little") + 1
+    return None
+
+
+def _bmff_boxes(file: IO[bytes], end: Optional[int]):
+    """Yields the type and content size of the ISO base media boxes until ``end`` bytes have been read. The caller
+    must read or skip the content before the next box is read.
+    """
+    read = 0
+    while end is None or read < end:
+        header = file.read(8)
+        if len(header) == 0 and end is None:
+            return
+        if len(header) != 8:
+            raise EOFError
+        size, type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", _read(file, 8))[0]
+            header_size = 16
+        elif size == 0:
+            if end is None:
+                # Box extends to the end of the file
+                yield type, None
+                return
+            size = end - read
+        read += size
+        yield type, size - header_size
+
+
+def _avif_size(file: IO[bytes], ftyp_size: int) -> Optional[Tuple[int, int]]:
+    _skip(file, ftyp_size)
+
+    # meta > iprp > ipco > ispe
+    sizes = []
+    for type, size in _bmff_boxes(file, None):
+        if type != b"meta":
+            if size is None:
+                break
+            _skip(file, size)
+            continue
+
+        _skip(file, 4)
+        for type, size in _bmff_boxes(file, size - 4):
+            if type != b"iprp":
+                _skip(file, size)
+                continue
+            for type, size in _bmff_boxes(file, size):
+                if type != b"ipco":
+                    _skip(file, size)
+                    continue
+                for type, size in _bmff_boxes(file, size):
+                    if type == b"ispe":
+                        sizes.append(struct.unpack(">4xII", _read(file, 12)))
+                        _skip(file, size - 12)
+                    else:
+                        _skip(file, size)
+        break
+
+    # Thumbnails and alpha planes have their own ispe. The largest is the image.
+    return max(sizes, key=lambda x: x[0] * x[1]) if sizes else None
+
+
+def get_image_size(file: Union[bytes, IO[bytes]]) -> Optional[Tuple[int, int]]:
+    """Returns the width and height of an image from its header.
+
+    Parameters
+    ----------
+    file : bytes | IO[bytes]
+        Image data or a binary file object positioned at the start of the image.
+
+    Returns
+    -------
+    Tuple[int, int] | None
+        ``(width, height)`` in pixels or ``None`` if the format is not recognised or the header is incomplete.
+    """
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        file = BytesIO(file)
+
+    try:
+        head = _read(file, 12)
+
+        if head[:2] == b"\xff\xd8":
+            return _jpeg_size(_Prefixed(head[2:], file))
+
+        elif head[:8] == _png_signature:
+            rest = _read(file, 12)
+            if rest[:4] != b"IHDR":
+                return None
+            return struct.unpack(">II", rest[4:12])
+
+        elif head[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", head[6:10])
+
+        elif head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _webp_size(file)
+
+        elif head[4:8] == b"ftyp" and head[8:12] in _bmff_brands:
+            return _avif_size(file, struct.unpack(">I", head[:4])[0] - 12)
+
+    except (EOFError, struct.error):
+        pass
+
+    return None
+
+
+class _Prefixed:
+    """Reads from ``prefix`` and then from ``file``. Used to give back bytes read while detecting the format.
+    """
+
+    __slots__ = ("_prefix", "_file")
+
+    def __init__(self, prefix: bytes, file: IO[bytes]):
+        self._prefix = prefix
+        self._file = file
+
+    def read(self, size: int) -> bytes:
+        if self._prefix:
+            data = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            if len(data) < size:
+                data += self._file.read(size - len(data))
+            return data
+        return self._file.read(size)
+
+    def seekable(self) -> bool:
+        return False
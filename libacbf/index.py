@@ -0,0 +1,205 @@
+"""A small index stored inside archived books so that they can be opened without reading the whole ACBF XML.
+
+Books opened with ``write_index=True`` get an ``.libacbf/index.bin`` file when they are closed. It holds the page count,
+cover page, languages, the title, background colour and transition of each page and the archive member, offset and
+size of its image, together with the CRC32, size and SHA-256 hash of the ACBF file. When a book with a current index is
+opened, only the metadata is parsed and the pages are created from the index. The rest of the XML is read and
+validated the first time the frames, jumps or text layers of a page or the data, styles or references are used. Open
+the book with ``use_index=False`` to validate it when it is opened. The index is ignored if the ACBF file or any
+indexed image was changed without updating it.
+
+Examples
+--------
+::
+
+    from libacbf import ACBFBook
+
+    with ACBFBook("path/to/book.cbz", 'a', write_index=True) as book:
+        pass
+
+    with ACBFBook("path/to/book.cbz") as book:
+        print(book.index.page_count, book.index.pages[0].member)
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+import hashlib
+import tarfile as tar
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from pathlib import Path
+
+import libacbf.constants as consts
+from libacbf.archivereader import ArchiveReader
+
+if TYPE_CHECKING:
+    from libacbf.body import Page
+    from libacbf.libacbf import ACBFBody
+
+INDEX_NAME = ".libacbf/index.bin"
+"""Path of the index in the archive."""
+
+INDEX_VERSION = 2
+"""Version of the index format. Indexes of other versions are ignored."""
+
+_header = b"LACBFIDX" + INDEX_VERSION.to_bytes(2, "little")
+
+
+class IndexedPage(NamedTuple):
+    """A page in a :class:`BookIndex`.
+    """
+    href: str
+    """Image reference of the page."""
+    member: Optional[str]
+    """Name of the image in the archive or ``None`` if the image is not in the book's archive."""
+    offset: Optional[int]
+    """See :attr:`MemberInfo.offset <libacbf.archivereader.MemberInfo.offset>`."""
+    size: Optional[int]
+    """Uncompressed size of the image."""
+    crc: Optional[int]
+    title: Dict[str, str]
+    """See :attr:`Page.title <libacbf.body.Page.title>`."""
+    bgcolor: Optional[str]
+    transition: Optional[str]
+    """Name of the :class:`PageTransitions <libacbf.constants.PageTransitions>` member or ``None``."""
+
+
+class BookIndex(NamedTuple):
+    """The contents of an index. Returned by :attr:`ACBFBook.index <libacbf.ACBFBook.index>`.
+    """
+    page_count: int
+    coverpage: Optional[str]
+    """Image reference of the cover page."""
+    languages: List[Tuple[str, bool]]
+    """Languages of the text layers and whether they are shown."""
+    pages: List[IndexedPage]
+    acbf_sha256: str
+    bgcolor: Optional[str]
+    """Background colour of the body."""
+
+
+def _page_entry(page: Page, members: dict) -> IndexedPage:
+    member = None
+    if page.ref_type == consts.ImageRefType.SelfArchived:
+        member = members.get(page._file_path.as_posix())
+    transition = page.transition.name if page.transition is not None else None
+    if member is None:
+        return IndexedPage(page.image_ref, None, None, None, None, page.title, page.bgcolor, transition)
+    return IndexedPage(page.image_ref, member.name, member.offset, member.size, member.crc, page.title, page.bgcolor,
+                       transition)
+
+
+def make_index(archive: ArchiveReader, acbf_file: str, acbf: bytes, coverpage: Optional[Page], body: ACBFBody,
+               languages: Iterable[Tuple[str, bool]]) -> bytes:
+    """Returns the contents of the index of a book.
+
+    Parameters
+    ----------
+    archive : ArchiveReader
+        The finished archive of the book in read mode.
+
+    acbf_file : str
+        Name of the ACBF file in the archive.
+
+    acbf : bytes
+        Contents of the ACBF file.
+
+    coverpage, body, languages
+        Sections of the book that the index describes.
+    """
+    members = {x.name: x for x in archive.list_members()}
+    pages = [_page_entry(x, members) for x in body.pages]
+    state = {
+        "acbf": [acbf_file, len(acbf), zlib.crc32(acbf), hashlib.sha256(acbf).hexdigest()],
+        "coverpage": coverpage.image_ref if coverpage is not None else None,
+        "languages": [list(x) for x in languages],
+        "bgcolor": body.bgcolor,
+        "pages": [list(x) for x in pages]
+        }
+    return _header + zlib.compress(json.dumps(state, separators=(',', ':')).encode("utf-8"))
+
+
+def _load_state(archive: ArchiveReader) -> Optional[dict]:
+    """Returns the decoded contents of the index or ``None`` if it is too large or of another version.
+    """
+    if archive.get_member(INDEX_NAME).size > 16 * 2 ** 20:
+        return None
+    data = archive.read(INDEX_NAME)
+    if not data.startswith(_header):
+        return None
+    return json.loads(zlib.decompress(data[len(_header):]))
+
+
+def _is_current(archive: ArchiveReader, acbf_file: str, acbf: list, pages: List[IndexedPage]) -> bool:
+    """Whether the ACBF file and the indexed images are the ones the index was written for.
+    """
+    acbf_member = archive.get_member(acbf_file)
+    name, size, crc, sha256 = acbf
+    if name != acbf_file or size != acbf_member.size:
+        return False
+    if acbf_member.crc is not None:
+        if crc != acbf_member.crc:
+            return False
+    elif hashlib.sha256(archive.read(acbf_file)).hexdigest() != sha256:
+        return False
+
+    # Images replaced without updating the index
+    for page in pages:
+        if page.member is not None:
+            try:
+                current = archive.get_member(page.member)
+            except KeyError:
+                return False
+            if (current.size, current.crc, current.offset) != (page.size, page.crc, page.offset):
+                return False
+    return True
+
+
+def read_index(archive: ArchiveReader, acbf_file: str) -> Optional[BookIndex]:
+    """Reads the index of a book and checks that it is current. The ACBF file is only read to check its hash if the
+    archive does not store its CRC32.
+
+    Returns
+    -------
+    BookIndex | None
+        The index or ``None`` if the book has no index or it does not match the book.
+    """
+    try:
+        state = _load_state(archive)
+        if state is None:
+            return None
+        pages = [IndexedPage(*x) for x in state["pages"]]
+        languages = [(x, y) for x, y in state["languages"]]
+        if not _is_current(archive, acbf_file, state["acbf"], pages):
+            return None
+    except (ValueError, TypeError, KeyError, zlib.error):
+        return None
+
+    return BookIndex(len(pages), state["coverpage"], languages, pages, state["acbf"][3], state["bgcolor"])
+
+
+def append_index(file: Union[str, Path, BinaryIO], type: consts.ArchiveTypes, index: bytes):
+    """Adds an index to the end of a finished archive so that the offsets of the other files do not change.
+    """
+    if hasattr(file, "seek"):
+        file.seek(0)
+
+    if type == consts.ArchiveTypes.Zip:
+        with ZipFile(file, 'a', ZIP_DEFLATED) as arc:
+            arc.writestr(INDEX_NAME, index)
+    elif type == consts.ArchiveTypes.SevenZip:
+        from py7zr import SevenZipFile
+        with SevenZipFile(file, 'a') as arc:
+            arc.writestr(index, INDEX_NAME)
+    elif type == consts.ArchiveTypes.Tar:
+        info = tar.TarInfo(INDEX_NAME)
+        info.size = len(index)
+        if isinstance(file, (str, Path)):
+            arc = tar.open(file, 'a')
+        else:
+            arc = tar.open(fileobj=file, mode='a')
+        with arc:
+            arc.addfile(info, BytesIO(index))
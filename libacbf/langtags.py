@@ -0,0 +1,94 @@
+"""Normalization of language tags.
+
+Every ``lang`` attribute read from or written to a book goes through :func:`standardize_tag`. By default it uses
+``langcodes.standardize_tag()`` and remembers the results in a bounded cache that is shared by all books, since a
+book usually repeats the same few tags on every page.
+
+The backend can be replaced or turned off with :func:`set_backend`. ::
+
+    from libacbf import langtags
+
+    langtags.set_backend(str.lower)  # Custom normalization
+    langtags.set_backend(None)  # Keep tags as they are written in the book
+    langtags.set_backend(langtags.default_backend)  # Restore default
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+def default_backend(tag: str) -> str:
+    """Default normalization backend. Wraps ``langcodes.standardize_tag()``.
+    """
+    import langcodes
+    return langcodes.standardize_tag(tag)
+
+
+def _make_cache(backend: Optional[Callable[[str], str]], maxsize: Optional[int]):
+    if backend is None:
+        return lru_cache(maxsize)(sys.intern)
+
+    @lru_cache(maxsize)
+    def cached(tag: str) -> str:
+        return sys.intern(backend(tag))
+
+    return cached
+
+
+_backend: Optional[Callable[[str], str]] = default_backend
+_cached = _make_cache(_backend, 1024)
+
+
+def standardize_tag(tag: str) -> str:
+    """Returns the normalized form of a language tag using the current backend. Results are cached and interned.
+
+    Parameters
+    ----------
+    tag : str
+        A language tag such as ``"en"``, ``"eng"`` or ``"en_US"``.
+
+    Returns
+    -------
+    str
+        Normalized language tag. It is the same as ``tag`` if the backend is turned off.
+    """
+    return _cached(tag)
+
+
+def set_backend(backend: Optional[Callable[[str], str]], maxsize: Optional[int] = 1024):
+    """Replaces the function used to normalize language tags and clears the cache. Books that are already open keep
+    the tags they have already read.
+
+    Parameters
+    ----------
+    backend : Callable[[str], str] | None
+        A function that takes a language tag and returns its normalized form. Pass ``None`` to turn normalization
+        off and :func:`default_backend` to restore the default.
+
+    maxsize : int | None, default=1024
+        Maximum number of tags to cache. ``None`` means the cache is unbounded and ``0`` disables caching.
+    """
+    global _backend, _cached
+    _backend = backend
+    _cached = _make_cache(backend, maxsize)
+
+
+def get_backend() -> Optional[Callable[[str], str]]:
+    """Returns the current normalization backend or ``None`` if normalization is turned off.
+    """
+    return _backend
+
+
+def cache_info():
+    """Returns hit and miss statistics of the tag cache as returned by ``functools.lru_cache``.
+    """
+    return _cached.cache_info()
+
+
+def cache_clear():
+    """Empties the tag cache.
+    """
+    _cached.cache_clear()
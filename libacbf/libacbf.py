@@ -1,39 +1,42 @@
+from __future__ import annotations
 import re
+import hashlib
 import warnings
-import magic
-import distutils.util
-import dateutil.parser
-import langcodes
 from io import UnsupportedOperation
 from pathlib import Path
+from functools import lru_cache, cached_property
+from contextlib import contextmanager
 from datetime import date
-from typing import List, Dict, Optional, Set, Union, Literal, IO
+from typing import List, Dict, Optional, Set, Union, Literal, Iterable, Iterator, IO, Tuple
 from base64 import b64encode
 from lxml import etree
 from zipfile import ZipFile
-from py7zr import SevenZipFile
 import tarfile as tar
 
 import libacbf.helpers as helpers
 import libacbf.constants as consts
+import libacbf.langtags as langtags
 import libacbf.metadata as metadata
 import libacbf.body
 from libacbf.bookdata import BookData
 from libacbf.archivereader import ArchiveReader, get_archive_type
+from libacbf.index import INDEX_NAME, BookIndex, append_index, make_index, read_index
 from libacbf.exceptions import InvalidBook, EditRARArchiveError, UnsupportedArchive
 
 
-def _validate_acbf(tree, ns: str):
-    """Validate XML tree with XSD.
+@lru_cache(maxsize=None)
+def _get_schema(version: str) -> etree.XMLSchema:
+    """Get the XSD schema for an ACBF version. Schemas are only compiled once.
     """
-    version = re.split(r'/', ns)[-1]
     xsd_path = Path(__file__).parent / f"schema/acbf-{version}.xsd"
+    return etree.XMLSchema(etree.parse(str(xsd_path)))
 
-    with open(xsd_path, encoding="utf-8") as file:
-        acbf_root = etree.fromstring(bytes(file.read(), encoding="utf-8"))
 
-    acbf_tree = acbf_root.getroottree()
-    acbf_schema = etree.XMLSchema(acbf_tree)
+def _validate_acbf(tree, ns: str):
+    """Validate XML tree with XSD.
+    """
+    version = re.split(r'/', ns)[-1]
+    acbf_schema = _get_schema(version)
 
     if version == "1.0":
         try:
@@ -47,6 +50,77 @@ def _validate_acbf(tree, ns: str):
         acbf_schema.assertValid(tree)
 
 
+def _parse_acbf(source: Union[bytes, str, Path, IO]):
+    """Parse ACBF XML from bytes, a file path or a file object and return the root element.
+
+    The XML is handed to lxml as is so the encoding declared by the document is used and large books are not copied
+    through intermediate strings.
+    """
+    parser = etree.XMLParser(huge_tree=True)
+
+    if isinstance(source, bytes):
+        return etree.fromstring(source, parser)
+
+    if isinstance(source, Path):
+        source = str(source)
+
+    return etree.parse(source, parser).getroot()
+
+
+@contextmanager
+def _open_source(source: Union[str, Path, IO]) -> Iterator[IO]:
+    """Yields a file object for a path, which is closed afterwards, or the given file object.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as file:
+            yield file
+    else:
+        yield source
+
+
+def _parse_acbf_metadata(source: Union[str, Path, IO]):
+    """Parse ACBF XML from a file path or a file object up to the end of the ``meta-data`` section and return the root
+    element. The rest of the document is not read.
+
+    Raises
+    ------
+    InvalidBook
+        Raised if the document has no ``meta-data`` section.
+    """
+    with _open_source(source) as file:
+        context = etree.iterparse(file, events=("end",), tag="{*}meta-data", huge_tree=True)
+        try:
+            for _, element in context:
+                return element.getparent()
+        except etree.XMLSyntaxError as e:
+            raise InvalidBook from e
+        finally:
+            del context  # Stop parsing before the file is closed
+
+    raise InvalidBook
+
+
+def _find_binary(source: Union[str, Path, IO], id: str) -> Optional[BookData]:
+    """Stream the ``binary`` elements of ACBF XML and decode only the one with the given id. Returns ``None`` if it is
+    not found.
+    """
+    with _open_source(source) as file:
+        context = etree.iterparse(file, events=("end",), tag="{*}binary", huge_tree=True)
+        try:
+            for _, element in context:
+                if element.get("id") == id:
+                    return BookData(id, element.get("content-type"), element.text)
+
+                # Free the data of skipped binaries
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        finally:
+            del context
+
+    return None
+
+
 def _update_authors(author_items, nsmap) -> List[metadata.Author]:
     """Takes a list of etree elements and returns a list of Author objects.
     """
@@ -96,59 +170,11 @@ def _edit_date(section, attr_s: str, attr_d: str, dt: Union[str, date], include_
     if include_date:
         date_val = dt
         if isinstance(dt, str):
+            import dateutil.parser
             date_val = dateutil.parser.parse(dt, fuzzy=True).date()
     setattr(section, attr_d, date_val)
 
 
-def _fill_page(pg, page, nsmap, book):
-    """Fill Page data from XML tree.
-    """
-    for fr in pg.findall("frame", namespaces=nsmap):
-        frame = libacbf.body.Frame(helpers.pts_to_vec(fr.attrib["points"]))
-        if "bgcolor" in fr.keys():
-            frame.bgcolor = fr.attrib["bgcolor"]
-        page.frames.append(frame)
-
-    for jp in pg.findall("jump", namespaces=nsmap):
-        jump = libacbf.body.Jump(helpers.pts_to_vec(jp.attrib["points"]), int(jp.attrib["page"]), book)
-        page.jumps.append(jump)
-
-    # Text Layers
-    for tl in pg.findall("text-layer", namespaces=nsmap):
-        lang = langcodes.standardize_tag(tl.attrib["lang"])
-        layer = libacbf.body.TextLayer()
-        page.text_layers[lang] = layer
-
-        if "bgcolor" in tl.keys():
-            layer.bgcolor = tl.attrib["bgcolor"]
-
-        # Text Areas
-        for ta in tl.findall("text-area", namespaces=nsmap):
-            text = helpers.tree_to_para(ta, nsmap)
-            pts = helpers.pts_to_vec(ta.attrib["points"])
-            area = libacbf.body.TextArea(text, pts)
-            layer.text_areas.append(area)
-
-            if "bgcolor" in ta.keys():
-                area.bgcolor = ta.attrib["bgcolor"]
-
-            if "text-rotation" in ta.keys():
-                rot = int(ta.attrib["text-rotation"])
-                if 0 <= rot <= 360:
-                    area.rotation = rot
-                else:
-                    raise ValueError("Rotation must be an integer from 0 to 360.")
-
-            if "type" in ta.keys():
-                area.type = consts.TextAreas[ta.attrib["type"]]
-
-            if "inverted" in ta.keys():
-                area.inverted = bool(distutils.util.strtobool(ta.attrib["inverted"]))
-
-            if "transparent" in ta.keys():
-                area.transparent = bool(distutils.util.strtobool(ta.attrib["transparent"]))
-
-
 def _get_root_template(nsmap: Dict):
     """Get the lxml root tree for a basic ACBF book.
 
@@ -175,6 +201,56 @@ def _get_root_template(nsmap: Dict):
     return root
 
 
+def get_cover(file: Union[str, Path, IO]) -> Optional[BookData]:
+    """Get the cover image of a book without opening the whole book. The cover page is found with a streaming parse of
+    the metadata. Embedded covers are read by decoding only the matching ``binary`` element of the data section.
+
+    Examples
+    --------
+    ::
+
+        from libacbf import get_cover
+
+        cover = get_cover("path/to/book.cbz")
+        # cover.data is the image file, cover.type is its mime type
+
+    Parameters
+    ----------
+    file : str | pathlib.Path | IO
+        Book to read.
+
+    Returns
+    -------
+    BookData | None
+        A :class:`BookData <libacbf.bookdata.BookData>` object or ``None`` if the cover page has no image.
+
+    Raises
+    ------
+    KeyError
+        Raised if the cover is embedded but the book does not contain it.
+    """
+    with ACBFBook(file, metadata_only=True) as book:
+        cover = book.book_info.coverpage
+        if not cover.image_ref:
+            return None
+
+        if cover.ref_type != consts.ImageRefType.Embedded:
+            return cover.image
+
+        if book.archive is not None:
+            with book.archive.open(book.archive._get_acbf_file()) as acbf:
+                image = _find_binary(acbf, cover._file_id)
+        elif book.book_path is not None:
+            image = _find_binary(book.book_path, cover._file_id)
+        else:
+            file.seek(0)
+            image = _find_binary(file, cover._file_id)
+
+    if image is None:
+        raise KeyError(cover._file_id)
+    return image
+
+
 def get_book_template(ns: str = None) -> str:
     """Get the bare minimum XML required to create an ACBF book.
 
@@ -223,6 +299,27 @@ class ACBFBook:
         You do not have to specify the type of archive unless you are creating a new one. The correct type will be
         determined regardless of this parameter's value. Use this when you want to create a new book.
 
+    languages : Iterable[str] | None, default=None
+        Only load text layers of these languages into :attr:`Page.text_layers <libacbf.body.Page.text_layers>`. Text
+        layers of other languages are skipped but can still be listed and loaded later. See
+        :meth:`Page.list_text_layers() <libacbf.body.Page.list_text_layers>`. Loads all text layers if ``None``. Can
+        only be used in read mode.
+
+    metadata_only : bool, default=False
+        Only read the ``meta-data`` section of the book. The XML is parsed as a stream that stops at the end of
+        ``meta-data`` so opening the book does not depend on the number of pages or the size of embedded data. Only
+        :attr:`book_info`, :attr:`publisher_info` and :attr:`document_info` are available and the book is not
+        validated. Can only be used in read mode. See also :meth:`read_metadata()`.
+
+    write_index : bool, default=False
+        Store an index of the pages in the archive when the book is closed so that it opens faster. See
+        :mod:`libacbf.index`. Cannot be used in read mode or with plain ACBF files.
+
+    use_index : bool, default=True
+        Open the book with its index if it has a current one. The whole XML is then only parsed and validated when a
+        section that is not in the index is used. Pass ``False`` to parse and validate the whole XML when the book is
+        opened.
+
     Raises
     ------
     EditRARArchiveError
@@ -269,55 +366,40 @@ class ACBFBook:
         with ACBFBook(file, 'w') as book:
             # Write data to book
 
+    The sections of the book (:attr:`book_info`, :attr:`publisher_info`, :attr:`document_info`, :attr:`body`,
+    :attr:`data`, :attr:`references` and :attr:`styles`) are only read from the XML when they are first accessed.
+
     Attributes
     ----------
-    book_info : BookInfo
-        See :class:`BookInfo` for more information.
-
-    publisher_info : PublishInfo
-        See :class:`PublishInfo` for more information.
-
-    document_info : DocumentInfo
-        See :class:`DocumentInfo` for more information.
-
-    body : ACBFBody
-        See :class:`ACBFBody` for more information.
-
-    data : ACBFData
-        See :class:`ACBFData` for more information.
-
-    references : dict
-        A dictionary that contains a list of particular references that occur inside the
-        main document body. Keys are unique reference ids and values are dictionaries that contain
-        a ``'_'`` key with text. ::
-
-            {
-                "ref_id_001": {
-                    "_": "This is a reference."
-                }
-                "ref_id_002": {
-                    "_": "This is another reference."
-                }
-            }
-
-        ``'_'`` can contain special tags for formatting. For more information and a full list,
-        see :attr:`TextArea.text <libacbf.body.TextArea.text>`.
-
-    styles : Styles
-        See :class:`Styles` for more information.
-
     archive : ArchiveReader | None
         Can be used to read archive directly if file is not plain ACBF. Use this if you want to read exactly what
         files the book contains but try to avoid directly writing files through ``ArchiveReader``.
     """
 
     def __init__(self, file: Union[str, Path, IO], mode: Literal['r', 'w', 'a', 'x'] = 'r',
-                 archive_type: Optional[str] = "Zip"):
+                 archive_type: Optional[str] = "Zip", languages: Optional[Iterable[str]] = None,
+                 metadata_only: bool = False, write_index: bool = False, use_index: bool = True):
+        if languages is not None and mode != 'r':
+            raise ValueError("`languages` can only be used in read mode.")
+        if metadata_only and mode != 'r':
+            raise ValueError("`metadata_only` can only be used in read mode.")
+        if write_index and mode == 'r':
+            raise ValueError("`write_index` cannot be used in read mode.")
+
         self._source = file
+        self._metadata_only: bool = metadata_only
+        self._index: Optional[BookIndex] = None
+        self._partial: bool = False  # The whole XML was not parsed because the book has an index or a snapshot
+        self._page_elements: Optional[List[etree._Element]] = None
+        self.write_index: bool = write_index
+        self._languages: Optional[Set[str]] = None
+        if languages is not None:
+            self._languages = {langtags.standardize_tag(x) for x in languages}
         self.book_path: Path = None
         self.archive: Optional[ArchiveReader] = None
         self.mode: Literal['r', 'w', 'a', 'x'] = mode
         self.is_open: bool = True
+        self._image_sizes: Dict[str, Optional[Tuple[int, int]]] = {}  # Cache of `Page.image_size` by file
 
         if isinstance(file, str):
             self.book_path = Path(file).resolve()
@@ -337,6 +419,8 @@ class ACBFBook:
 
         if archive_type == consts.ArchiveTypes.Rar and mode != 'r':
             raise EditRARArchiveError
+        if write_index and is_text:
+            raise ValueError("`write_index` cannot be used with plain ACBF files.")
 
         def create_file():
             if not is_text:
@@ -344,6 +428,7 @@ class ACBFBook:
                     with ZipFile(file, 'w') as _:
                         pass
                 elif archive_type == consts.ArchiveTypes.SevenZip:
+                    from py7zr import SevenZipFile
                     with SevenZipFile(file, 'w') as _:
                         pass
                 elif archive_type == consts.ArchiveTypes.Tar:
@@ -393,39 +478,290 @@ class ACBFBook:
             acbf_file = self.archive._get_acbf_file()
             if acbf_file is None:
                 raise InvalidBook
-            contents = self.archive.read(acbf_file)
+            if mode == 'r' and not metadata_only and use_index:
+                self._index = read_index(self.archive, acbf_file)
+                self._partial = self._index is not None
+
+            if metadata_only or self._partial:
+                with self.archive.open(acbf_file) as acbf:
+                    self._root = _parse_acbf_metadata(acbf)
+            else:
+                self._root = _parse_acbf(self.archive.read(acbf_file))
         else:
+            source = self.book_path
             if self.book_path is None:
-                contents = file.read()
-            else:
-                with open(file, 'r') as book:
-                    contents = book.read()
+                if hasattr(file, "seek"):
+                    file.seek(0)
+                source = file
 
-        if isinstance(contents, bytes):
-            contents = contents.decode("utf-8")
+            if metadata_only:
+                self._root = _parse_acbf_metadata(source)
+            else:
+                self._root = _parse_acbf(source)
 
-        self._root = etree.fromstring(bytes(contents, "utf-8"))
         self._nsmap: str = self._root.nsmap
 
-        if mode in ('r', 'a'):
+        # A current index means that the XML was valid when the index was written
+        if mode in ('r', 'a') and not metadata_only and not self._partial:
             _validate_acbf(self._root.getroottree(), self._nsmap[None])
 
-        self.styles: Styles = Styles(self)
-        self.book_info: BookInfo = BookInfo(self)
-        self.publisher_info: PublishInfo = PublishInfo(self)
-        self.document_info: DocumentInfo = DocumentInfo(self)
-        self.body: ACBFBody = ACBFBody(self)
-        self.data: ACBFData = ACBFData(self)
-        self.references: Dict[str, Dict[str, str]] = {}
-
-        # References
-        if self._root.find("references", namespaces=self._nsmap) is not None:
-            for ref in self._root.findall("references/reference", namespaces=self._nsmap):
-                pa = []
-                for p in ref.findall("p", namespaces=self._nsmap):
-                    text = re.sub(r'</?p[^>]*>', '', etree.tostring(p, encoding="utf-8").decode("utf-8").strip())
-                    pa.append(text)
-                self.references[ref.attrib["id"]] = {'_': '\n'.join(pa)}
+    @classmethod
+    def _restore(cls, file: Union[str, Path], nsmap: Dict, archive: Optional[ArchiveReader]) -> ACBFBook:
+        """Creates a book in read mode without parsing the XML. The sections are filled by :mod:`libacbf.snapshot`
+        and the XML is only parsed if a section that was not filled is used.
+        """
+        book = cls.__new__(cls)
+        book._source = file
+        book._metadata_only = False
+        book._index = None
+        book._partial = True
+        book._page_elements = None
+        book.write_index = False
+        book._languages = None
+        book.book_path = Path(file).resolve()
+        book.archive = archive
+        book.mode = 'r'
+        book.is_open = True
+        book._image_sizes = {}
+        book._root = None
+        book._nsmap = nsmap
+        return book
+
+    @classmethod
+    def read_metadata(cls, file: Union[str, Path, IO]) -> Tuple[BookInfo, PublishInfo, DocumentInfo]:
+        """Read only the metadata of a book. Same as opening the book with ``metadata_only=True`` and reading
+        :attr:`book_info`, :attr:`publisher_info` and :attr:`document_info`. The book is closed before returning so
+        images cannot be read from the returned objects.
+
+        Examples
+        --------
+        ::
+
+            from libacbf import ACBFBook
+
+            book_info, publisher_info, document_info = ACBFBook.read_metadata("path/to/book.cbz")
+
+        Parameters
+        ----------
+        file : str | pathlib.Path | IO
+            Book to read.
+
+        Returns
+        -------
+        Tuple[BookInfo, PublishInfo, DocumentInfo]
+            Metadata sections of the book.
+        """
+        with cls(file, metadata_only=True) as book:
+            return book.book_info, book.publisher_info, book.document_info
+
+    def iter_page_images(self, order: Literal["reading", "archive"] = "reading", prefetch: int = 0
+                         ) -> Iterator[Tuple[libacbf.body.Page, BookData]]:
+        """Read the image of every page without keeping it in the page. Unlike
+        :attr:`Page.image <libacbf.body.Page.image>`, the images are not cached so memory use does not grow with the
+        size of the book.
+
+        Examples
+        --------
+        ::
+
+            from libacbf import ACBFBook
+
+            with ACBFBook("path/to/book.cb7") as book:
+                for page, image in book.iter_page_images("archive", prefetch=2):
+                    # Process image.data
+
+        Parameters
+        ----------
+        order : "reading" | "archive", default="reading"
+            ``"reading"`` yields pages in the order of the book. ``"archive"`` yields pages whose images are in the
+            book's archive in the order the images are stored, followed by the other pages in reading order. This is
+            much faster for 7Zip and compressed Tar archives. See
+            :meth:`ArchiveReader.iter_read() <libacbf.archivereader.ArchiveReader.iter_read>`.
+
+        prefetch : int, default=0
+            Number of images to read ahead in a background thread while the current one is processed. At most
+            ``prefetch + 1`` images are in memory at once, except for 7Zip archives read in ``"archive"`` order. Their
+            decompression thread holds up to two more files, so up to ``prefetch + 3`` files are in memory. See
+            :meth:`ArchiveReader.iter_read() <libacbf.archivereader.ArchiveReader.iter_read>`.
+
+        Returns
+        -------
+        Iterator[Tuple[Page, BookData]]
+            Pages and their images.
+        """
+        if order not in ("reading", "archive"):
+            raise ValueError("`order` must be 'reading' or 'archive'.")
+
+        images = self._iter_page_images(order)
+        if prefetch > 0:
+            images = helpers.prefetch(images, prefetch)
+
+        try:
+            yield from images
+        finally:
+            images.close()
+
+    def _iter_page_images(self, order: Literal["reading", "archive"]) -> Iterator[Tuple[libacbf.body.Page, BookData]]:
+        pages = list(self.body.pages)
+
+        if order == "reading" or self.archive is None:
+            for page in pages:
+                yield page, page._image if page._image is not None else page._read_image()
+            return
+
+        archived: Dict[str, List[libacbf.body.Page]] = {}
+        others = []
+        for page in pages:
+            if page.ref_type == consts.ImageRefType.SelfArchived and page._image is None:
+                archived.setdefault(str(page._file_path), []).append(page)
+            else:
+                others.append(page)
+
+        for name, contents in self.archive.iter_read(archived):
+            for page in archived[name]:
+                yield page, page._read_image(contents)
+
+        for page in others:
+            yield page, page._image if page._image is not None else page._read_image()
+
+    def _check_full(self):
+        """Raises exception if only the metadata of the book was read. Parses and validates the whole XML if the book
+        was opened with an index or from a snapshot.
+        """
+        if self._metadata_only:
+            raise ValueError("Only metadata was read from this book.")
+        if self._partial:
+            self._partial = False
+            if self.archive is not None:
+                self._root = _parse_acbf(self.archive.read(self.archive._get_acbf_file()))
+            else:
+                self._root = _parse_acbf(self.book_path)
+            self._nsmap = self._root.nsmap
+            _validate_acbf(self._root.getroottree(), self._nsmap[None])
+
+    def _page_element(self, position: int) -> etree._Element:
+        """Returns the XML element of a page that was created from the index. Reads the whole XML the first time.
+        """
+        self._check_full()
+        if self._page_elements is None:
+            body = self._root.find("body", namespaces=self._nsmap)
+            self._page_elements = body.findall("page", namespaces=self._nsmap)
+        return self._page_elements[position]
+
+    @property
+    def index(self) -> Optional[BookIndex]:
+        """The :class:`BookIndex <libacbf.index.BookIndex>` stored in the archive if it matches the book. ``None`` if
+        the book has no current index. See :mod:`libacbf.index`.
+        """
+        return self._index
+
+    def fingerprint(self) -> str:
+        """Returns an ID of the contents of the book. It combines the SHA-256 hash of the ACBF file with
+        :meth:`ArchiveReader.fingerprint() <libacbf.archivereader.ArchiveReader.fingerprint>` of the other files, so
+        only the ACBF file is read. The index written with ``write_index`` is left out.
+
+        Raises
+        ------
+        io.UnsupportedOperation
+            Raised if the book is not in read mode.
+        """
+        if self.mode != 'r' or not self.is_open:
+            raise UnsupportedOperation("Fingerprint is only available for open books in read mode.")
+
+        if self.archive is None:
+            if self.book_path is not None:
+                contents = self.book_path.read_bytes()
+            else:
+                self._source.seek(0)
+                contents = self._source.read()
+            return hashlib.sha256(contents).hexdigest()
+
+        acbf_file = self.archive._get_acbf_file()
+        fingerprint = hashlib.sha256(hashlib.sha256(self.archive.read(acbf_file)).digest())
+        fingerprint.update(self.archive.fingerprint((acbf_file, INDEX_NAME)).encode("ascii"))
+        return fingerprint.hexdigest()
+
+    def missing_images(self) -> List[str]:
+        """Returns the image references of the cover and pages whose image is neither in the book's archive nor
+        embedded in the ACBF file. Images referenced by URL or by a path outside the book are not checked.
+        """
+        self._check_full()
+        files = self.archive.list_files() if self.archive is not None else set()
+        embedded = {x.attrib["id"] for x in self._root.findall("data/binary", namespaces=self._nsmap)}
+
+        missing = []
+        for page in [self.book_info.coverpage, *self.body.pages]:
+            if page.ref_type == consts.ImageRefType.SelfArchived:
+                if page._file_path.as_posix() not in files:
+                    missing.append(page.image_ref)
+            elif page.ref_type == consts.ImageRefType.Embedded:
+                if page._file_id not in embedded:
+                    missing.append(page.image_ref)
+        return missing
+
+    @cached_property
+    def book_info(self) -> BookInfo:
+        """See :class:`BookInfo` for more information.
+        """
+        return BookInfo(self)
+
+    @cached_property
+    def publisher_info(self) -> PublishInfo:
+        """See :class:`PublishInfo` for more information.
+        """
+        return PublishInfo(self)
+
+    @cached_property
+    def document_info(self) -> DocumentInfo:
+        """See :class:`DocumentInfo` for more information.
+        """
+        return DocumentInfo(self)
+
+    @cached_property
+    def body(self) -> ACBFBody:
+        """See :class:`ACBFBody` for more information.
+        """
+        if self._partial:
+            return ACBFBody._from_index(self, self._index)
+        self._check_full()
+        return ACBFBody(self)
+
+    @cached_property
+    def data(self) -> ACBFData:
+        """See :class:`ACBFData` for more information.
+        """
+        self._check_full()
+        return ACBFData(self)
+
+    @cached_property
+    def styles(self) -> Styles:
+        """See :class:`Styles` for more information.
+        """
+        self._check_full()
+        return Styles(self)
+
+    @cached_property
+    def references(self) -> Dict[str, Dict[str, str]]:
+        """A dictionary that contains a list of particular references that occur inside the main document body. Keys
+        are unique reference ids and values are dictionaries that contain a ``'_'`` key with text. ::
+
+            {
+                "ref_id_001": {
+                    "_": "This is a reference."
+                }
+                "ref_id_002": {
+                    "_": "This is another reference."
+                }
+            }
+
+        ``'_'`` can contain special tags for formatting. For more information and a full list,
+        see :attr:`TextArea.text <libacbf.body.TextArea.text>`.
+        """
+        self._check_full()
+        references = {}
+        for ref in self._root.findall("references/reference", namespaces=self._nsmap):
+            references[ref.attrib["id"]] = {'_': helpers.tree_to_para(ref, self._nsmap)}
+        return references
 
     def _get_acbf_tree(self):
         """Converts the XML tree to a string with any modifications.
@@ -686,12 +1022,9 @@ class ACBFBook:
             for id, reference in self.references.items():
                 reference = reference['_']
                 ref = etree.SubElement(refs, f"{ns}reference", id=id, nsmap=self._nsmap)
-                for r in reference.splitlines():
-                    p = f"<p>{r}</p>"
-                    p_element = etree.fromstring(bytes(p, encoding="utf-8"))
-                    for i in list(p_element.iter()):
-                        i.tag = '{' + self._nsmap[None] + '}' + i.tag
-                    ref.append(p_element)
+                lines = reference.splitlines()
+                if len(lines) > 0:
+                    ref.extend(helpers.para_to_tree('\n'.join(lines), self._nsmap))
 
         #endregion
 
@@ -746,6 +1079,7 @@ class ACBFBook:
             with ZipFile(self._source, 'w') as _:
                 pass
         elif archive_type == consts.ArchiveTypes.SevenZip:
+            from py7zr import SevenZipFile
             with SevenZipFile(self._source, 'w') as _:
                 pass
         elif archive_type == consts.ArchiveTypes.Tar:
@@ -761,23 +1095,39 @@ class ACBFBook:
         Use ``ACBFBook.is_open`` to check if file is open.
         """
         if self.mode != 'r':
-            _validate_acbf(self._get_acbf_tree(), self._nsmap[None])
+            tree = self._get_acbf_tree()
+            _validate_acbf(tree, self._nsmap[None])
+            contents = etree.tostring(tree, encoding="utf-8", xml_declaration=True, pretty_print=True)
 
             if self.archive is None:
                 if self.book_path is not None:
-                    with open(self._source, 'w') as book:
-                        book.write(self.get_acbf_xml())
+                    with open(self._source, 'wb') as book:
+                        book.write(contents)
                 else:
-                    self._source.write(self.get_acbf_xml())
+                    self._source.seek(0)
+                    self._source.truncate()
+                    self._source.write(contents)
             else:
-                self.archive.write(self.get_acbf_xml().encode("utf-8"), self.archive._get_acbf_file())
+                # Written again after the archive is packed if requested
+                if INDEX_NAME in self.archive.list_files():
+                    self.archive.delete(INDEX_NAME)
+                acbf_file = self.archive._get_acbf_file()
+                self.archive.write(contents, acbf_file)
 
+        write_index = self.mode != 'r' and self.write_index and self.archive is not None
         self.mode = 'r'
         self.is_open = False
+        self._index = None
 
         if self.archive is not None:
             self.archive.close()
 
+        if write_index:
+            languages = [(x.lang, x.show) for x in self.book_info.languages]
+            with ArchiveReader(self._source) as archive:
+                index = make_index(archive, str(acbf_file), contents, self.book_info.coverpage, self.body, languages)
+            append_index(self._source, self.archive.type, index)
+
     def __repr__(self):
         if self.is_open:
             return object.__repr__(self).replace("libacbf.libacbf.ACBFBook", "libacbf.ACBFBook")
@@ -906,7 +1256,7 @@ class BookInfo:
         for title in info.findall("book-title", namespaces=nsmap):
             lang = '_'
             if "lang" in title.keys():
-                lang = langcodes.standardize_tag(title.attrib["lang"])
+                lang = langtags.standardize_tag(title.attrib["lang"])
 
             self.book_title[lang] = title.text
 
@@ -926,17 +1276,15 @@ class BookInfo:
 
             lang = '_'
             if "lang" in an.keys():
-                lang = langcodes.standardize_tag(an.attrib["lang"])
+                lang = langtags.standardize_tag(an.attrib["lang"])
             self.annotations[lang] = p
 
         # Cover Page
         cpage = info.find("coverpage", namespaces=nsmap)
-        image_ref = ''
         if cpage is not None:
-            image_ref = cpage.find("image", namespaces=nsmap).attrib["href"]
-        self.coverpage = libacbf.body.Page(image_ref, book, coverpage=True)
-        if cpage is not None:
-            _fill_page(cpage, self.coverpage, nsmap, self._book)
+            self.coverpage = libacbf.body._load_page(cpage, book, coverpage=True)
+        else:
+            self.coverpage = libacbf.body.Page('', book, coverpage=True)
 
         # --- Optional ---
 
@@ -944,8 +1292,8 @@ class BookInfo:
         if info.find("languages", namespaces=nsmap) is not None:
             text_layers = info.findall("languages/text-layer", namespaces=nsmap)
             for layer in text_layers:
-                lang = langcodes.standardize_tag(layer.attrib["lang"])
-                show = bool(distutils.util.strtobool(layer.attrib["show"]))
+                lang = langtags.standardize_tag(layer.attrib["lang"])
+                show = helpers.strtobool(layer.attrib["show"])
                 self.languages.append(metadata.LanguageLayer(lang, show))
 
         # Characters
@@ -958,7 +1306,7 @@ class BookInfo:
             if k.text is not None:
                 lang = '_'
                 if "lang" in k.keys():
-                    lang = langcodes.standardize_tag(k.attrib["lang"])
+                    lang = langtags.standardize_tag(k.attrib["lang"])
                 self.keywords[lang] = {x.lower() for x in re.split(", |,", k.text)}
 
         # Series
@@ -1256,8 +1604,10 @@ class ACBFBody:
 
     Attributes
     ----------
-    pages : List[Page]
-        A list of :class:`Page <libacbf.body.Page>` objects in the order they should be displayed in.
+    pages : PageList
+        A list of :class:`Page <libacbf.body.Page>` objects in the order they should be displayed in. Pages and their
+        frames, jumps and text layers are only read from the XML when they are accessed. See
+        :class:`PageList <libacbf.body.PageList>`.
 
     bgcolor : str, optional
         Defines a background colour for the whole book. Can be overridden by ``bgcolor`` in pages,
@@ -1269,7 +1619,7 @@ class ACBFBody:
         nsmap = book._nsmap
         body = book._root.find("body", namespaces=nsmap)
 
-        self.pages: List[libacbf.body.Page] = []
+        self.pages: libacbf.body.PageList = libacbf.body.PageList(book, body.findall("page", namespaces=nsmap))
 
         # --- Optional ---
         self.bgcolor: Optional[str] = None
@@ -1280,28 +1630,28 @@ class ACBFBody:
         if "bgcolor" in body.keys():
             self.bgcolor = body.attrib["bgcolor"]
 
-        # Pages
-        for pg in body.findall("page", namespaces=nsmap):
-            img_ref = pg.find("image", namespaces=nsmap).attrib["href"]
-            page = libacbf.body.Page(img_ref, book)
-
-            if "bgcolor" in pg.keys():
-                page.bgcolor = pg.attrib["bgcolor"]
-
-            if "transition" in pg.keys():
-                page.transition = consts.PageTransitions[pg.attrib["transition"]]
-
-            for title in pg.findall("title", namespaces=nsmap):
-                lang = '_'
-                if "lang" in title.keys():
-                    lang = langcodes.standardize_tag(title.attrib["lang"])
-                page.title[lang] = title.text
+        #endregion
 
-            _fill_page(pg, page, nsmap, self._book)
+    @classmethod
+    def _from_index(cls, book: ACBFBook, index: BookIndex) -> ACBFBody:
+        """Creates the body of a book opened with a current index without reading the XML.
+        """
+        body = cls.__new__(cls)
+        body._book = book
+        body.pages = libacbf.body.PageList(book, [libacbf.body._load_indexed_page(x, i, book)
+                                                  for i, x in enumerate(index.pages)])
+        body.bgcolor = index.bgcolor
+        return body
 
-            self.pages.append(page)
+    def image_sizes(self) -> List[Optional[Tuple[int, int]]]:
+        """Returns the :attr:`image_size <libacbf.body.Page.image_size>` of every page in order.
 
-        #endregion
+        Returns
+        -------
+        List[Tuple[int, int] | None]
+            ``(width, height)`` of each page or ``None`` if the image format of the page is not recognised.
+        """
+        return [x.image_size for x in self.pages]
 
     @helpers.check_book
     def insert_page(self, index: int, image_ref: str) -> libacbf.body.Page:
@@ -1425,12 +1775,14 @@ class ACBFData:
             else:
                 with open(target, 'rb') as file:
                     contents = file.read()
+            import magic
             type = magic.from_buffer(contents, True)
             data = b64encode(contents).decode("utf-8")
 
             self._files[name] = BookData(name, type, data)
         else:
             self._book.archive.write(target, name)
+        self._book._image_sizes.clear()
 
     @helpers.check_book
     def remove_data(self, target: Union[str, Path], embed: bool = False):
@@ -1456,6 +1808,7 @@ class ACBFData:
             if isinstance(target, str):
                 target = Path(target)
             self._book.archive.delete(target)
+        self._book._image_sizes.clear()
 
     def __len__(self):
         return len(self._files.keys())
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import langcodes
 from typing import Optional, Union
 
 import libacbf.constants as constants
+import libacbf.langtags as langtags
 
 
 class Author:
@@ -58,6 +58,8 @@ class Author:
         Author's email address.
     """
 
+    __slots__ = ("_first_name", "_last_name", "_nickname", "_activity", "_lang", "middle_name", "home_page", "email")
+
     def __init__(self, *names: str, first_name=None, last_name=None, nickname=None):
         self._first_name: Optional[str] = None
         self._last_name: Optional[str] = None
@@ -158,7 +160,7 @@ class Author:
     @lang.setter
     def lang(self, val: Optional[str]):
         if val is not None:
-            val = langcodes.standardize_tag(val)
+            val = langtags.standardize_tag(val)
         self._lang = val
 
     def copy(self):
@@ -189,6 +191,8 @@ class LanguageLayer:
         Whether the layer is drawn.
     """
 
+    __slots__ = ("_lang", "show")
+
     def __init__(self, lang: str, show: bool):
         self.lang: str = lang
         self.show: bool = show
@@ -202,7 +206,7 @@ class LanguageLayer:
 
     @lang.setter
     def lang(self, val: str):
-        self._lang = langcodes.standardize_tag(val)
+        self._lang = langtags.standardize_tag(val)
 
 
 class Series:
@@ -221,6 +225,8 @@ class Series:
         The volume that the book belongs to.
     """
 
+    __slots__ = ("sequence", "volume")
+
     def __init__(self, sequence: str, volume: Optional[str] = None):
         self.sequence: str = sequence
         self.volume: Optional[str] = volume
@@ -248,6 +254,8 @@ class DBRef:
         Type of the given reference such as URL, ID etc.
     """
 
+    __slots__ = ("dbname", "reference", "type")
+
     def __init__(self, dbname: str, ref: str, type: Optional[str] = None):
         self.dbname: str = dbname
         self.reference: str = ref
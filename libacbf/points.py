@@ -0,0 +1,204 @@
+from __future__ import annotations
+from array import array
+from collections.abc import MutableSequence
+from itertools import cycle
+from operator import add, mul
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class Points(MutableSequence):
+    """A compact list of 2D integer coordinates. Used by :attr:`Frame.points <libacbf.body.Frame.points>`,
+    :attr:`Jump.points <libacbf.body.Jump.points>` and :attr:`TextArea.points <libacbf.body.TextArea.points>`.
+
+    The coordinates are stored in a flat ``array('i')`` (``x1, y1, x2, y2, ...``) instead of a list of tuples but it
+    can be used like a ``List[Tuple[int, int]]``. Indexing and iterating returns ``(x, y)`` tuples and slicing returns
+    a new ``Points`` object. Geometry methods like :meth:`bbox()` work on the whole array at once.
+
+    Examples
+    --------
+    ::
+
+        from libacbf.points import Points
+
+        pts = Points([(0, 0), (0, 10), (10, 10)])
+        pts.append((10, 0))
+        x, y = pts[1]  # x == 0, y == 10
+
+        pts.bbox()  # (0, 0, 10, 10)
+        pts.area()  # 100.0
+        pts.translate(5, 5)  # Points([(5, 5), (5, 15), (15, 15), (15, 5)])
+
+    Parameters
+    ----------
+    points : Iterable[Tuple[int, int]], optional
+        Coordinates to fill the list with.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, points: Iterable[Tuple[int, int]] = ()):
+        if isinstance(points, Points):
+            self._data: array = array('i', points._data)
+        else:
+            self._data: array = array('i')
+            for x, y in points:
+                self._data.append(x)
+                self._data.append(y)
+
+    @classmethod
+    def _from_array(cls, data: array) -> Points:
+        """Wrap a flat array of coordinates without copying it.
+        """
+        if len(data) % 2 != 0:
+            raise ValueError("Points must have an even number of coordinates.")
+        pts = cls.__new__(cls)
+        pts._data = data
+        return pts
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, int], Points]:
+        if isinstance(index, slice):
+            return Points(self[i] for i in range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Points index out of range.")
+        return self._data[2 * index], self._data[2 * index + 1]
+
+    def __setitem__(self, index: Union[int, slice], value):
+        if isinstance(index, slice):
+            pts = list(self)
+            pts[index] = value
+            self._data = Points(pts)._data
+            return
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Points assignment index out of range.")
+        x, y = value
+        self._data[2 * index] = x
+        self._data[2 * index + 1] = y
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            pts = list(self)
+            del pts[index]
+            self._data = Points(pts)._data
+            return
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Points assignment index out of range.")
+        del self._data[2 * index:2 * index + 2]
+
+    def __len__(self) -> int:
+        return len(self._data) // 2
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        it = iter(self._data)
+        return zip(it, it)
+
+    def __eq__(self, other):
+        if isinstance(other, Points):
+            return self._data == other._data
+        try:
+            return list(self) == [tuple(x) for x in other]
+        except TypeError:
+            return NotImplemented
+
+    def __add__(self, other: Iterable[Tuple[int, int]]) -> Points:
+        pts = Points(self)
+        pts.extend(other)
+        return pts
+
+    def __repr__(self):
+        return f"Points({list(self)})"
+
+    def insert(self, index: int, value: Tuple[int, int]):
+        x, y = value
+        if index < 0:
+            index = max(index + len(self), 0)
+        index = min(index, len(self))
+        self._data[2 * index:2 * index] = array('i', (x, y))
+
+    def copy(self) -> Points:
+        """Returns a copy of the points.
+        """
+        return Points(self)
+
+    def to_list(self) -> List[Tuple[int, int]]:
+        """Returns the points as a list of tuples.
+        """
+        return list(self)
+
+    @property
+    def xs(self) -> array:
+        """All x coordinates as an ``array('i')``.
+        """
+        return self._data[0::2]
+
+    @property
+    def ys(self) -> array:
+        """All y coordinates as an ``array('i')``.
+        """
+        return self._data[1::2]
+
+    def bbox(self) -> Tuple[int, int, int, int]:
+        """Bounding box of the points.
+
+        Returns
+        -------
+        Tuple[int, int, int, int]
+            ``(x_min, y_min, x_max, y_max)``
+
+        Raises
+        ------
+        ValueError
+            Raised if there are no points.
+        """
+        if len(self._data) == 0:
+            raise ValueError("Cannot get bounding box of empty points.")
+        xs = self.xs
+        ys = self.ys
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def area(self) -> float:
+        """Area of the polygon defined by the points using the shoelace formula.
+        """
+        if len(self._data) < 6:
+            return 0.0
+        xs = self.xs
+        ys = self.ys
+        xs_next = xs[1:] + xs[:1]
+        ys_next = ys[1:] + ys[:1]
+        return abs(sum(map(mul, xs, ys_next)) - sum(map(mul, ys, xs_next))) / 2
+
+    def translate(self, dx: int, dy: int) -> Points:
+        """Returns a copy of the points moved by ``(dx, dy)``.
+        """
+        return Points._from_array(array('i', map(add, self._data, cycle((dx, dy)))))
+
+    def scale(self, sx: float, sy: Optional[float] = None) -> Points:
+        """Returns a copy of the points with coordinates multiplied by ``sx`` and ``sy`` and rounded to integers. Can
+        be used to map coordinates to a differently sized image.
+
+        Parameters
+        ----------
+        sx : float
+            Factor for x coordinates.
+
+        sy : float, optional
+            Factor for y coordinates. Defaults to ``sx``.
+        """
+        if sy is None:
+            sy = sx
+        return Points._from_array(array('i', map(round, map(mul, self._data, cycle((sx, sy))))))
+
+    def to_str(self) -> str:
+        """Returns the points formatted as in the ``points`` attribute of the ACBF XML. ::
+
+            "x1,y1 x2,y2 x3,y3"
+        """
+        return ' '.join(["%d,%d"] * len(self)) % tuple(self._data)
@@ -0,0 +1,248 @@
+"""A disk cache of parsed books for fast reopening.
+
+Opening a book detects the archive type, parses and validates the XML and builds pages, text layers and points when
+they are read. :class:`SnapshotCache` saves the result as a binary snapshot keyed by the path, size and modification
+time of the book. Opening the book again maps the snapshot into memory and unpickles the metadata, references, styles
+and pages instead, and the archive index is restored from the snapshot so no member list has to be read. Embedded
+binaries are not stored; the ACBF XML is only parsed again if :attr:`ACBFBook.data <libacbf.ACBFBook.data>` is used.
+
+Books opened from a snapshot are in read mode and have every text layer loaded. Snapshots are pickles, so only use a
+cache directory that other users cannot write to.
+
+Examples
+--------
+::
+
+    from libacbf.snapshot import SnapshotCache
+
+    cache = SnapshotCache("path/to/cache")
+
+    with cache.open("path/to/book.cbz") as book:  # Saves a snapshot
+        ...
+
+    with cache.open("path/to/book.cbz") as book:  # Loads the snapshot
+        ...
+"""
+
+from __future__ import annotations
+
+import os
+import mmap
+import pickle
+import hashlib
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, Optional, Union
+
+import libacbf.constants as consts
+from libacbf.archivereader import ArchiveReader, MemberInfo
+from libacbf.body import Frame, Jump, Page, PageList, TextArea, TextLayer, _read_text_layer
+from libacbf.libacbf import ACBFBook, ACBFBody, BookInfo, DocumentInfo, PublishInfo, Styles
+from libacbf.points import Points
+
+SNAPSHOT_VERSION = 2
+"""Version of the snapshot format. Snapshots of other versions are ignored and replaced."""
+
+_magic = b"LACBFSNP"
+_header = _magic + SNAPSHOT_VERSION.to_bytes(4, "little")
+
+# Cached properties of a book that are stored without their reference to the book
+_sections = (("book_info", BookInfo), ("publisher_info", PublishInfo), ("document_info", DocumentInfo),
+             ("styles", Styles))
+
+
+#region Serialization
+
+def _dump_layer(layer: TextLayer) -> tuple:
+    areas = [(x.text, x.points._data, x.bgcolor, x.rotation, x.type.name if x.type is not None else None, x.inverted,
+              x.transparent) for x in layer.text_areas]
+    return layer.bgcolor, areas
+
+
+def _load_layer(state: tuple) -> TextLayer:
+    bgcolor, areas = state
+    layer = TextLayer()
+    layer.bgcolor = bgcolor
+    for text, points, bg, rotation, type, inverted, transparent in areas:
+        area = TextArea(text, Points._from_array(points))
+        area.bgcolor = bg
+        area.rotation = rotation
+        area.type = consts.TextAreas[type] if type is not None else None
+        area.inverted = inverted
+        area.transparent = transparent
+        layer.text_areas.append(area)
+    return layer
+
+
+def _dump_page(page: Page, nsmap: Dict) -> tuple:
+    page._load()
+    layers = {x: _dump_layer(y) for x, y in page._text_layers.items()}
+    for lang, element in page._unloaded_layers.items():
+        layers[lang] = _dump_layer(_read_text_layer(element, nsmap))
+
+    attributes = None
+    if not page.is_coverpage:
+        attributes = page.bgcolor, page.transition.name if page.transition is not None else None, page.title
+
+    return (page.image_ref, attributes, [(x.points._data, x.bgcolor) for x in page._frames],
+            [(x.target, x.points._data) for x in page._jumps], layers)
+
+
+def _load_page(state: tuple, book: ACBFBook, coverpage: bool = False) -> Page:
+    image_ref, attributes, frames, jumps, layers = state
+    page = Page(image_ref, book, coverpage)
+    if not coverpage:
+        page.bgcolor, transition, page.title = attributes
+        page.transition = consts.PageTransitions[transition] if transition is not None else None
+
+    for points, bg in frames:
+        frame = Frame(Points._from_array(points))
+        frame.bgcolor = bg
+        page._frames.append(frame)
+    page._jumps = [Jump(x, Points._from_array(y), book) for x, y in jumps]
+    page._text_layers = {x: _load_layer(y) for x, y in layers.items()}
+    return page
+
+
+def _dump_section(section) -> Dict[str, Any]:
+    state = {x: y for x, y in vars(section).items() if x != "_book"}
+    if isinstance(section, BookInfo):
+        state["coverpage"] = _dump_page(section.coverpage, section._book._nsmap)
+    return state
+
+
+def _load_section(cls: type, state: Dict[str, Any], book: ACBFBook):
+    section = cls.__new__(cls)
+    section.__dict__.update(state)
+    section._book = book
+    if cls is BookInfo:
+        section.coverpage = _load_page(state["coverpage"], book, coverpage=True)
+    return section
+
+#endregion
+
+
+class SnapshotCache:
+    """A directory of book snapshots.
+
+    Parameters
+    ----------
+    directory : str | pathlib.Path
+        Directory to store snapshots in. It is created if it does not exist.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory: Path = Path(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f'<libacbf.snapshot.SnapshotCache directory="{self.directory}">'
+
+    @staticmethod
+    def key(file: Union[str, Path]) -> str:
+        """Returns the key of the current version of a book. It changes when the book is modified.
+        """
+        path = Path(file).resolve(True)
+        stat = path.stat()
+        source = f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_ino}"
+        return hashlib.sha1(source.encode("utf-8", "surrogateescape")).hexdigest()
+
+    def path(self, file: Union[str, Path]) -> Path:
+        """Returns the path of the snapshot of the current version of a book.
+        """
+        key = self.key(file)
+        return self.directory / key[:2] / f"{key}.snap"
+
+    def save(self, book: ACBFBook) -> Path:
+        """Saves a snapshot of a book. The whole XML is parsed if it was not, and pages and text layers that were not
+        read yet are read.
+
+        Parameters
+        ----------
+        book : ACBFBook
+            A book opened from a path in read mode without ``metadata_only``.
+
+        Returns
+        -------
+        pathlib.Path
+            Path to the snapshot.
+        """
+        if book.mode != 'r' or book._metadata_only or book.book_path is None:
+            raise ValueError("Only books opened from a path in read mode can be saved.")
+        book._check_full()
+
+        archive = book.archive
+        state = {
+            "nsmap": book._nsmap,
+            "archive": archive is not None,
+            "members": [tuple(x) for x in archive.list_members()] if archive is not None else None,
+            "sections": {x: _dump_section(getattr(book, x)) for x, _ in _sections},
+            "references": book.references,
+            "bgcolor": book.body.bgcolor,
+            "pages": [_dump_page(x, book._nsmap) for x in book.body.pages],
+            "image_sizes": dict(book._image_sizes)
+            }
+
+        path = self.path(book.book_path)
+        os.makedirs(path.parent, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as file:
+            file.write(_header)
+            pickle.dump(state, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, path)
+        return path
+
+    def load(self, file: Union[str, Path]) -> Optional[ACBFBook]:
+        """Opens a book from its snapshot.
+
+        Returns
+        -------
+        ACBFBook | None
+            The book in read mode or ``None`` if there is no snapshot of the current version of the book.
+        """
+        path = self.path(file)
+        try:
+            with open(path, "rb") as snapshot:
+                with mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if data[:len(_header)] != _header:
+                        return None
+                    with memoryview(data) as view:
+                        state: Dict[str, Any] = pickle.loads(view[len(_header):])
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return _restore(Path(file), state)
+
+    def open(self, file: Union[str, Path]) -> ACBFBook:
+        """Opens a book from its snapshot or opens it normally and saves a snapshot.
+        """
+        book = self.load(file)
+        if book is None:
+            book = ACBFBook(file)
+            try:
+                self.save(book)
+            except BaseException:
+                book.close()
+                raise
+        return book
+
+
+def _restore(file: Path, state: Dict[str, Any]) -> ACBFBook:
+    archive = None
+    if state["archive"]:
+        archive = ArchiveReader(file)
+        archive._members = {x[0]: MemberInfo(*x) for x in state["members"]}
+
+    book = ACBFBook._restore(file, state["nsmap"], archive)
+    book._image_sizes.update(state["image_sizes"])
+
+    # Fill the cached properties
+    for name, cls in _sections:
+        book.__dict__[name] = _load_section(cls, state["sections"][name], book)
+    book.__dict__["references"] = state["references"]
+
+    body = ACBFBody.__new__(ACBFBody)
+    body._book = book
+    body.bgcolor = state["bgcolor"]
+    body.pages = PageList(book, [_load_page(x, book) for x in state["pages"]])
+    book.__dict__["body"] = body
+    return book
@@ -0,0 +1,265 @@
+"""Thumbnails of covers and pages. Requires Pillow which can be installed with ``pip install libacbf[thumbnails]``.
+
+Thumbnails are stored in a content-addressed disk cache. Images stored in an archive are identified by the CRC32 and
+size recorded in the archive's index so a cached thumbnail can be found without reading the image. Other images are
+identified by the SHA-256 hash of their data. The same image in different books shares a thumbnail.
+
+Examples
+--------
+::
+
+    from libacbf import ACBFBook
+    from libacbf.thumbnails import ThumbnailCache, generate_thumbnails
+
+    cache = ThumbnailCache("path/to/cache")
+
+    with ACBFBook("path/to/book.cbz") as book:
+        path = cache.get(book.book_info.coverpage, "small")
+        path = cache.get(book.body.pages[3], (200, 300))
+
+    # Thumbnails of every page using 4 processes
+    paths = generate_thumbnails("path/to/book.cbz", "path/to/cache", "medium", workers=4)
+"""
+
+from __future__ import annotations
+
+import os
+import hashlib
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from tempfile import NamedTemporaryFile
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+try:
+    from PIL import Image
+except ImportError as e:
+    raise ImportError("Thumbnails require Pillow. Install it with `pip install libacbf[thumbnails]`.") from e
+
+import libacbf.constants as consts
+from libacbf.body import Page
+
+SIZES: Dict[str, Tuple[int, int]] = {
+    "small": (160, 240),
+    "medium": (320, 480),
+    "large": (640, 960)
+    }
+"""Size presets. Thumbnails fit inside the size and keep the aspect ratio of the image."""
+
+_extensions = {
+    "JPEG": "jpg",
+    "WEBP": "webp"
+    }
+
+
+def _get_size(size: Union[str, Tuple[int, int]]) -> Tuple[str, Tuple[int, int]]:
+    """Returns the label used in cache file names and the dimensions of a size preset or tuple.
+    """
+    if isinstance(size, str):
+        return size, SIZES[size]
+    width, height = size
+    return f"{width}x{height}", (width, height)
+
+
+def make_thumbnail(data: bytes, size: Union[str, Tuple[int, int]] = "medium",
+                   format: Literal["JPEG", "WEBP"] = "JPEG", quality: int = 85) -> bytes:
+    """Make a thumbnail of an image. JPEG images are decoded at a reduced scale (draft mode) when the thumbnail is
+    much smaller than the image.
+
+    Parameters
+    ----------
+    data : bytes
+        Image file.
+
+    size : str | Tuple[int, int], default="medium"
+        Name of a preset in :data:`SIZES` or ``(width, height)``.
+
+    format : "JPEG" | "WEBP", default="JPEG"
+        Format of the thumbnail.
+
+    quality : int, default=85
+        Encoder quality of the thumbnail.
+
+    Returns
+    -------
+    bytes
+        Thumbnail file.
+    """
+    _, dimensions = _get_size(size)
+
+    with Image.open(BytesIO(data)) as image:
+        if image.format == "JPEG":
+            image.draft("RGB", dimensions)
+        image.thumbnail(dimensions)
+
+        if format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif format == "WEBP" and image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        thumbnail = BytesIO()
+        image.save(thumbnail, format, quality=quality)
+
+    return thumbnail.getvalue()
+
+
+class ThumbnailCache:
+    """A directory of thumbnails named after the content of the source images.
+
+    Parameters
+    ----------
+    directory : str | pathlib.Path
+        Directory to store thumbnails in. It is created if it does not exist.
+
+    format : "JPEG" | "WEBP", default="JPEG"
+        Format of the thumbnails.
+
+    quality : int, default=85
+        Encoder quality of the thumbnails.
+    """
+
+    def __init__(self, directory: Union[str, Path], format: Literal["JPEG", "WEBP"] = "JPEG", quality: int = 85):
+        if format not in _extensions:
+            raise ValueError(f"Unsupported thumbnail format {format!r}.")
+
+        self.directory: Path = Path(directory)
+        self.format: Literal["JPEG", "WEBP"] = format
+        self.quality: int = quality
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f'<libacbf.thumbnails.ThumbnailCache directory="{self.directory}" format="{self.format}">'
+
+    @staticmethod
+    def source_key(page: Page) -> str:
+        """Returns the key that identifies the image of a page. Uses the CRC32 and size of the file in the archive if
+        they are available. Otherwise hashes the image data.
+        """
+        if page.ref_type == consts.ImageRefType.SelfArchived and page._book.archive is not None:
+            try:
+                member = page._book.archive.get_member(str(page._file_path))
+            except KeyError:
+                member = None
+            if member is not None and member.crc is not None:
+                return f"crc32-{member.crc:08x}-{member.size}"
+
+        return "sha256-" + hashlib.sha256(page.image.data).hexdigest()
+
+    def path(self, key: str, size: Union[str, Tuple[int, int]] = "medium") -> Path:
+        """Returns the path a thumbnail is cached at.
+
+        Parameters
+        ----------
+        key : str
+            Source key from :meth:`source_key()`.
+
+        size : str | Tuple[int, int], default="medium"
+            Name of a preset in :data:`SIZES` or ``(width, height)``.
+        """
+        label, _ = _get_size(size)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}-{label}-q{self.quality}.{_extensions[self.format]}"
+
+    def get(self, page: Page, size: Union[str, Tuple[int, int]] = "medium") -> Path:
+        """Returns the path to the thumbnail of a page or cover page. The thumbnail is made if it is not cached.
+
+        Parameters
+        ----------
+        page : Page
+            Page or :attr:`coverpage <libacbf.libacbf.BookInfo.coverpage>` of an open book.
+
+        size : str | Tuple[int, int], default="medium"
+            Name of a preset in :data:`SIZES` or ``(width, height)``.
+        """
+        path = self.path(self.source_key(page), size)
+        if not path.is_file():
+            self.put(path, make_thumbnail(page.image.data, size, self.format, self.quality))
+        return path
+
+    @staticmethod
+    def put(path: Path, thumbnail: bytes):
+        """Writes a thumbnail to the cache. The file is renamed into place so other processes never read a partly
+        written thumbnail.
+        """
+        os.makedirs(path.parent, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as file:
+            file.write(thumbnail)
+        os.replace(file.name, path)
+
+
+def _thumbnail_chunk(book: str, pages: List[Optional[int]], directory: str, size: Union[str, Tuple[int, int]],
+                     format: Literal["JPEG", "WEBP"], quality: int) -> List[Tuple[Optional[int], str]]:
+    """Make thumbnails of some pages of a book. Runs in a worker process. ``None`` means the cover page.
+    """
+    from libacbf import ACBFBook
+
+    cache = ThumbnailCache(directory, format, quality)
+    paths = []
+    with ACBFBook(book) as bk:
+        for i in pages:
+            page = bk.book_info.coverpage if i is None else bk.body.pages[i]
+            paths.append((i, str(cache.get(page, size))))
+    return paths
+
+
+def generate_thumbnails(book: Union[str, Path], directory: Union[str, Path],
+                        size: Union[str, Tuple[int, int]] = "medium", workers: Optional[int] = None,
+                        format: Literal["JPEG", "WEBP"] = "JPEG", quality: int = 85,
+                        cover: bool = True) -> Dict[Optional[int], Path]:
+    """Make thumbnails of all the pages of a book using a process pool. Thumbnails that are already cached are not made
+    again.
+
+    Parameters
+    ----------
+    book : str | pathlib.Path
+        Path to the book. Each worker opens the book itself.
+
+    directory : str | pathlib.Path
+        Cache directory. See :class:`ThumbnailCache`.
+
+    size : str | Tuple[int, int], default="medium"
+        Name of a preset in :data:`SIZES` or ``(width, height)``.
+
+    workers : int | None, default=None
+        Number of processes. Uses ``os.cpu_count()`` if ``None``. Runs in the current process if ``1``.
+
+    format : "JPEG" | "WEBP", default="JPEG"
+        Format of the thumbnails.
+
+    quality : int, default=85
+        Encoder quality of the thumbnails.
+
+    cover : bool, default=True
+        Whether to make a thumbnail of the cover page.
+
+    Returns
+    -------
+    Dict[int | None, pathlib.Path]
+        Paths to the thumbnails. Keys are page indexes and ``None`` for the cover page.
+    """
+    from libacbf import ACBFBook
+
+    book = str(Path(book).resolve(True))
+    directory = str(directory)
+    ThumbnailCache(directory, format, quality)
+
+    with ACBFBook(book) as bk:
+        pages: List[Optional[int]] = list(range(len(bk.body.pages)))
+    if cover:
+        pages.insert(0, None)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(pages)))
+
+    if workers == 1:
+        results = _thumbnail_chunk(book, pages, directory, size, format, quality)
+    else:
+        chunks = [pages[i::workers] for i in range(workers)]
+        results = []
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_thumbnail_chunk, book, x, directory, size, format, quality) for x in chunks]
+            for future in futures:
+                results.extend(future.result())
+
+    return {i: Path(x) for i, x in sorted(results, key=lambda x: -1 if x[0] is None else x[0])}
@@ -0,0 +1,211 @@
+"""Convert books between archive types without extracting them.
+
+Opening a book with :class:`ACBFBook <libacbf.ACBFBook>` in write mode extracts the whole archive to a temporary
+directory and packs it again on close. :func:`convert` instead copies the files of the source archive straight into a
+new archive. Files are read in the order they are stored in the source archive by a background thread while the
+previous file is compressed, so decompression and compression run at the same time and only a few files are kept in
+memory.
+
+Examples
+--------
+::
+
+    from libacbf import convert
+
+    convert("path/to/book.cbr", "path/to/book.cbz")
+    convert("path/to/book.cbz", "path/to/book.cb7", "SevenZip", compression_policy="store")
+"""
+
+from __future__ import annotations
+
+import os
+import itertools
+import time
+import tarfile as tar
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
+
+import libacbf.constants as consts
+from libacbf import helpers
+from libacbf.archivereader import ArchiveReader
+from libacbf.index import INDEX_NAME
+from libacbf.exceptions import EditRARArchiveError, InvalidBook, UnsupportedArchive
+
+COMPRESSED_EXTENSIONS = frozenset({
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".heic", ".heif", ".jxl", ".jp2",
+    ".mp3", ".ogg", ".opus", ".mp4", ".webm",
+    ".woff", ".woff2", ".zip", ".7z", ".gz", ".bz2", ".xz", ".rar"
+    })
+"""Extensions of files that are already compressed. The ``"auto"`` compression policy does not compress them again."""
+
+# The "auto" policy stores a 7Zip archive without compression if this share of its bytes is already compressed. 7Zip
+# compresses the whole archive as one stream so the policy cannot be chosen for each file.
+_7z_store_ratio = 0.9
+
+_policies = ("auto", "store", "compress")
+
+
+def _is_compressed(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in COMPRESSED_EXTENSIONS
+
+
+def _write_zip(dst: Path, policy: str, members: List[Tuple[str, int]], files: Iterator[Tuple[str, bytes]]):
+    with ZipFile(dst, 'w', ZIP_DEFLATED) as arc:
+        for name, contents in files:
+            if policy == "store" or (policy == "auto" and _is_compressed(name)):
+                arc.writestr(name, contents, ZIP_STORED)
+            else:
+                arc.writestr(name, contents, ZIP_DEFLATED)
+
+
+def _write_7z(dst: Path, policy: str, members: List[Tuple[str, int]], files: Iterator[Tuple[str, bytes]]):
+    import py7zr
+
+    filters = None
+    if policy == "auto":
+        total = sum(x[1] for x in members)
+        compressed = sum(x[1] for x in members if _is_compressed(x[0]))
+        if total > 0 and compressed / total >= _7z_store_ratio:
+            policy = "store"
+    if policy == "store":
+        filters = [{"id": py7zr.FILTER_COPY}]
+
+    with py7zr.SevenZipFile(dst, 'w', filters=filters) as arc:
+        for name, contents in files:
+            arc.writef(BytesIO(contents), name)
+
+
+def _write_tar(dst: Path, policy: str, members: List[Tuple[str, int]], files: Iterator[Tuple[str, bytes]]):
+    mtime = time.time()
+    with tar.open(dst, "w:gz" if policy == "compress" else 'w') as arc:
+        for name, contents in files:
+            info = tar.TarInfo(name)
+            info.size = len(contents)
+            info.mtime = mtime
+            arc.addfile(info, BytesIO(contents))
+
+
+_writers: Dict[consts.ArchiveTypes, Callable] = {
+    consts.ArchiveTypes.Zip: _write_zip,
+    consts.ArchiveTypes.SevenZip: _write_7z,
+    consts.ArchiveTypes.Tar: _write_tar
+    }
+
+
+def _read_source(src: Path, source: Optional[ArchiveReader], acbf: Optional[bytes], prefetch: int
+                 ) -> Tuple[List[Tuple[str, int]], bytes, Iterator[Tuple[str, bytes]]]:
+    """Returns the names and sizes of the files to copy with the ACBF file first, the contents of the ACBF file and an
+    iterator of the contents of the other files in the order of the source archive.
+    """
+    if source is None:
+        if acbf is None:
+            acbf = src.read_bytes()
+        return [(src.stem + ".acbf", len(acbf))], acbf, iter(())
+
+    acbf_file = source._get_acbf_file()
+    if acbf_file is None:
+        raise InvalidBook
+    if acbf is None:
+        acbf = source.read(acbf_file)
+
+    members = [(acbf_file, len(acbf))]
+    # The index of the source describes offsets in the source archive
+    members += [(x.name, x.size) for x in source.list_members() if x.name not in (acbf_file, INDEX_NAME)]
+    files = source.iter_read(x[0] for x in members[1:])
+    if prefetch > 0:
+        files = helpers.prefetch(files, prefetch)
+    return members, acbf, files
+
+
+def _write_atomic(dst: Path, writer: Callable, policy: str, members: List[Tuple[str, int]],
+                  files: Iterator[Tuple[str, bytes]]):
+    """Writes the archive under a temporary name and renames it to ``dst`` when it is complete.
+    """
+    temp = dst.with_name(dst.name + ".part")
+    try:
+        writer(temp, policy, members, files)
+        os.replace(temp, dst)
+    finally:
+        if temp.exists():
+            os.remove(temp)
+
+
+def convert(src: Union[str, Path], dst: Union[str, Path], archive_type: str = "Zip",
+            compression_policy: Literal["auto", "store", "compress"] = "auto", acbf: Optional[bytes] = None,
+            prefetch: int = 2):
+    """Copy the files of a book into a new archive of another type. The ACBF file is written first so that it can be
+    read without reading the rest of the new archive. Other files keep the order of the source archive.
+
+    Parameters
+    ----------
+    src : str | pathlib.Path
+        Book to convert. Can be any archive type including Rar or a plain ACBF file. A plain ACBF file becomes the only
+        file of the new archive.
+
+    dst : str | pathlib.Path
+        Path of the new book. It is written under a temporary name and renamed when complete. An existing file is
+        replaced.
+
+    archive_type : str, default="Zip"
+        The type of archive to create. Allowed values are listed at
+        :class:`ArchiveTypes <libacbf.constants.ArchiveTypes>` except ``"Rar"``.
+
+    compression_policy : "auto" | "store" | "compress", default="auto"
+        ``"store"`` writes files without compression. ``"compress"`` compresses every file with Deflate for Zip, LZMA2
+        for 7Zip and gzip for Tar. ``"auto"`` only compresses files that are not already compressed (see
+        :data:`COMPRESSED_EXTENSIONS`). Tar archives are not compressed and 7Zip archives are stored if nearly all of
+        the data is already compressed.
+
+    acbf : bytes, optional
+        Contents to write as the ACBF file instead of the one in the source book. No other file is changed.
+
+    prefetch : int, default=2
+        Number of files to read ahead of the writer in a background thread. ``0`` reads and writes in turn.
+
+    Raises
+    ------
+    EditRARArchiveError
+        Raised if ``archive_type`` is ``"Rar"``.
+
+    InvalidBook
+        Raised if the source archive does not contain an ACBF file.
+
+    ValueError
+        Raised if ``compression_policy`` is not valid or ``src`` and ``dst`` are the same file.
+
+    Notes
+    -----
+    Only reading and decompressing run at the same time as compression. Files are compressed one at a time by the
+    thread that writes the archive. zlib releases the GIL so Zip members could be compressed by several threads, but
+    ``zipfile`` cannot write data that is already compressed, so this is not done.
+    """
+    archive_type = consts.ArchiveTypes[archive_type]
+    if archive_type == consts.ArchiveTypes.Rar:
+        raise EditRARArchiveError
+    if compression_policy not in _policies:
+        raise ValueError(f"`compression_policy` must be one of {', '.join(_policies)}.")
+
+    src = Path(src).resolve(True)
+    dst = Path(dst).resolve()
+    if src == dst:
+        raise ValueError("`src` and `dst` must be different files.")
+
+    try:
+        source = ArchiveReader(src)
+    except UnsupportedArchive:
+        source = None
+
+    try:
+        members, acbf, files = _read_source(src, source, acbf, prefetch)
+        try:
+            _write_atomic(dst, _writers[archive_type], compression_policy, members,
+                          itertools.chain([(members[0][0], acbf)], files))
+        finally:
+            close = getattr(files, "close", None)
+            if close is not None:
+                close()
+    finally:
+        if source is not None:
+            source.close()
@@ -49,6 +49,13 @@ setup(name="libacbf",
           "langcodes",
           "python-dateutil"
           ],
+      extras_require={
+          "thumbnails": ["Pillow"],
+          "aio": ["aiohttp"]
+          },
+      entry_points={
+          "console_scripts": ["libacbf = libacbf.cli:main"]
+          },
       classifiers=[
           "Development Status :: 5 - Production/Stable",
           "License :: OSI Approved :: BSD License",
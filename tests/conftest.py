@@ -2,6 +2,7 @@ import os
 import pytest
 from pathlib import Path
 from zipfile import ZipFile, ZIP_DEFLATED
+from libacbf import ACBFBook
 
 
 def pytest_runtest_logreport(report):
@@ -14,6 +15,42 @@ def samples():
     return Path(__file__).parent / "samples"
 
 
+@pytest.fixture(scope="session")
+def make_book(samples):
+    """Returns a function that writes a book of sample images and returns its path.
+
+    ``pages`` are the image references of the pages and ``cover`` is the image reference of the cover page or ``None``.
+    Images with references starting with ``'#'`` are embedded and the others are added to the archive. Other keyword
+    arguments are passed to :class:`ACBFBook <libacbf.ACBFBook>`.
+    """
+    def make(path, pages=("cover.jpg", "page1.jpg", "page2.jpg"), cover="cover.jpg", type="Zip", title=None,
+             **kwargs):
+        images = pages if cover is None else (cover, *pages)
+        with ACBFBook(path, 'w', type, **kwargs) as book:
+            if title is not None:
+                book.book_info.book_title['_'] = title
+            for image in dict.fromkeys(images):
+                book.data.add_data(samples / image.lstrip('#'), embed=image.startswith('#'))
+            for image in pages:
+                book.body.append_page(image)
+            if cover is not None:
+                book.book_info.coverpage.image_ref = cover
+            book._create_placeholders()
+        return path
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def archives(make_book, tmp_path_factory):
+    """Directory with a ``book.cbz``, ``book.cb7`` and ``book.cbt`` of three pages each. The title is the archive type.
+    """
+    path = tmp_path_factory.mktemp("archives")
+    for ext, type in (("cbz", "Zip"), ("cb7", "SevenZip"), ("cbt", "Tar")):
+        make_book(path / f"book.{ext}", type=type, title=type)
+    return path
+
+
 @pytest.fixture(scope="session")
 def results():
     res = Path(__file__).parent / "results"
@@ -85,7 +122,7 @@ def results_data(results):
 
 
 def get_au_op(i):
-    new_op = i.__dict__.copy()
+    new_op = {x: getattr(i, x) for x in i.__slots__}
     new_op["activity"] = new_op["_activity"].name if new_op["_activity"] is not None else None
     new_op.pop("_activity")
     new_op["lang"] = new_op["_lang"]
@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from libacbf.aio import AsyncACBFBook
+
+
+@pytest.fixture(scope="module")
+def book_path(make_book, tmp_path_factory):
+    return make_book(tmp_path_factory.mktemp("aio") / "book.cbz", ("cover.jpg", "page1.jpg", "page2.jpg", "page3.jpg"))
+
+
+def test_pages(book_path, samples):
+    async def read():
+        with ThreadPoolExecutor(4) as executor:
+            async with await AsyncACBFBook.open(book_path, executor=executor) as book:
+                cover = await book.coverpage.aimage()
+                pages = [x async for x in book]
+                images = await asyncio.gather(*(x.aimage() for x in pages))
+                return cover, [x.image_ref for x in pages], images, book.book
+    cover, refs, images, book = asyncio.run(read())
+
+    assert cover.data == (samples / "cover.jpg").read_bytes()
+    assert refs == ["cover.jpg", "page1.jpg", "page2.jpg", "page3.jpg"]
+    assert [x.data for x in images] == [(samples / x).read_bytes() for x in refs]
+    assert not book.is_open
+
+
+def test_embedded(samples):
+    async def read():
+        async with await AsyncACBFBook.open(samples / "Doctorow, Cory - Craphound-1.1.acbf") as book:
+            page = (await book.pages())[0]
+            return await page.aimage(), page.image
+
+    image, cached = asyncio.run(read())
+    assert image is cached
+
+
+def test_url(samples):
+    web = pytest.importorskip("aiohttp.web")
+    data = (samples / "page1.jpg").read_bytes()
+
+    async def handler(_):
+        return web.Response(body=data, content_type="image/jpeg")
+
+    async def read():
+        app = web.Application()
+        app.router.add_get("/page.jpg", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with await AsyncACBFBook.open(samples / "Doctorow, Cory - Craphound-1.1.acbf") as book:
+                page = (await book.pages())[0]
+                page.page.image_ref = f"http://127.0.0.1:{port}/page.jpg"
+                return await page.aimage()
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(read()).data == data
@@ -0,0 +1,145 @@
+import zlib
+import pytest
+from libacbf import ACBFBook
+from libacbf.archivereader import ArchiveReader, MemberFailure
+from libacbf.constants import ArchiveTypes
+
+
+@pytest.mark.parametrize("ext", ("cbz", "cb7", "cbt"))
+def test_read(ext, archives, samples):
+    with ArchiveReader(archives / f"book.{ext}") as archive:
+        cover = (samples / "cover.jpg").read_bytes()
+        assert archive.read("cover.jpg") == cover
+        with archive.open("cover.jpg") as file:
+            assert file.read() == cover
+
+    book_info, _, _ = ACBFBook.read_metadata(archives / f"book.{ext}")
+    assert book_info.coverpage.image_ref == "cover.jpg"
+
+
+@pytest.mark.parametrize("ext", ("cbz", "cb7", "cbt"))
+def test_members(ext, archives):
+    with ArchiveReader(archives / f"book.{ext}") as archive:
+        members = archive.list_members()
+        assert {x.name for x in members} == archive.list_files()
+
+        member = archive.get_member("cover.jpg")
+        data = archive.read("cover.jpg")
+        assert member.size == len(data)
+        if ext != "cbt":
+            assert member.crc == zlib.crc32(data)
+
+        with pytest.raises(KeyError):
+            archive.get_member("missing.jpg")
+
+
+@pytest.mark.parametrize("ext", ("cbz", "cb7", "cbt"))
+@pytest.mark.parametrize("fileobj", (False, True))
+def test_threads(ext, fileobj, archives, samples):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cover = (samples / "cover.jpg").read_bytes()
+    with open(archives / f"book.{ext}", "rb") as file:
+        with ArchiveReader(file if fileobj else archives / f"book.{ext}") as archive:
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(lambda _: archive.read("cover.jpg"), range(16)))
+                files = list(executor.map(lambda _: archive.open("cover.jpg"), range(16)))
+            assert results == [cover] * 16
+            for i in files:
+                with i:
+                    assert i.read() == cover
+            if not fileobj and ext != "cbz":
+                assert len(archive._handles) > 0
+        assert len(archive._handles) == 0
+
+
+@pytest.mark.parametrize("ext", ("cb7", "cbt"))
+def test_thread_handles(ext, archives, samples):
+    import gc
+    import threading
+
+    with ArchiveReader(archives / f"book.{ext}") as archive:
+        results = []
+        thread = threading.Thread(target=lambda: results.append(archive.read("cover.jpg")))
+        thread.start()
+        thread.join()
+        assert results == [(samples / "cover.jpg").read_bytes()]
+        assert len(archive._handles) == 1
+        instance = next(iter(archive._handles.values()))[0]
+
+        # The instance of a thread is closed once the thread is gone
+        del thread
+        gc.collect()
+        assert len(archive._handles) == 0
+        if ext == "cbt":
+            assert instance.closed
+
+        # Other threads list files from their own instance
+        thread = threading.Thread(target=lambda: results.append(archive.list_files()))
+        thread.start()
+        thread.join()
+        assert results[-1] == archive.list_files()
+
+
+def damage(path, offset):
+    data = bytearray(path.read_bytes())
+    for i in range(offset, offset + 64):
+        data[i] ^= 0xff
+    path.write_bytes(data)
+
+
+@pytest.mark.parametrize("ext", ("cbz", "cb7"))
+@pytest.mark.parametrize("workers", (1, 4))
+def test_verify(ext, workers, archives, tmp_path):
+    with ArchiveReader(archives / f"book.{ext}") as archive:
+        assert archive.verify(workers) == []
+        offset = archive.get_member("cover.jpg").offset
+
+    path = tmp_path / f"book.{ext}"
+    path.write_bytes((archives / f"book.{ext}").read_bytes())
+    # 7Zip archives are one compressed stream so any damage is found in the first file after it
+    damage(path, offset + 256 if offset is not None else path.stat().st_size // 2)
+    with ArchiveReader(path) as archive:
+        failures = archive.verify(workers, chunk_size=1024)
+    if ext == "cbz":
+        assert [x.name for x in failures] == ["cover.jpg"]
+    else:
+        assert len(failures) == 1
+
+
+@pytest.mark.parametrize("stream", (True, False))
+def test_iter_read(stream, archives, samples, monkeypatch):
+    if not stream:
+        # py7zr versions that do not close extracted files read one file at a time
+        monkeypatch.setattr("libacbf.archivereader._7z_can_stream", lambda: False)
+
+    with ArchiveReader(archives / "book.cb7") as archive:
+        files = dict(archive.iter_read(["cover.jpg", "book.acbf"]))
+    assert files["cover.jpg"] == (samples / "cover.jpg").read_bytes()
+    assert set(files) == {"cover.jpg", "book.acbf"}
+
+
+def test_fingerprint(archives):
+    # The archives only differ in the title in their ACBF files
+    with ArchiveReader(archives / "book.cbz") as zip, ArchiveReader(archives / "book.cb7") as seven:
+        assert zip.fingerprint(["book.acbf"]) == seven.fingerprint(["book.acbf"])
+        assert zip.fingerprint() != seven.fingerprint()
+        assert zip.fingerprint(["page1.jpg"]) != zip.fingerprint()
+
+    # Tar archives only match themselves
+    with ArchiveReader(archives / "book.cbt") as first, ArchiveReader(archives / "book.cbt") as second:
+        assert first.fingerprint() == second.fingerprint()
+
+
+def test_verify_rar(archives):
+    class FakeRar:
+        def testrar(self):
+            raise ValueError("Damaged file")
+
+    with ArchiveReader(archives / "book.cbt") as archive:
+        tar_archive = archive.archive
+        archive.type, archive.archive = ArchiveTypes.Rar, FakeRar()
+        try:
+            assert archive.verify(4) == [MemberFailure(None, "ValueError", "Damaged file")]
+        finally:
+            archive.type, archive.archive = ArchiveTypes.Tar, tar_archive
@@ -0,0 +1,66 @@
+import shutil
+import pytest
+from libacbf import batch
+from libacbf.catalog import Catalog, read_record
+
+
+@pytest.fixture
+def library(samples, tmp_path):
+    for i in range(3):
+        shutil.copy(samples / "Doctorow, Cory - Craphound-1.1.acbf", tmp_path / f"craphound-{i}.acbf")
+    (tmp_path / "broken.cbz").write_bytes(b"Not a book")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan(library, workers):
+    calls = []
+    result = batch.scan([library], workers=workers, chunksize=1, progress=lambda *x: calls.append(x))
+
+    assert [x.path for x in result.records] == [str(library / f"craphound-{i}.acbf") for i in range(3)]
+    assert result.records[0] == read_record(library / "craphound-0.acbf")
+    assert [(x.path, x.error_type) for x in result.failures] == [(str(library / "broken.cbz"), "InvalidBook")]
+    assert calls == [(i, 4) for i in range(1, 5)]
+
+
+def test_expand_paths(library):
+    paths = batch.expand_paths([library / "*.cbz", library / "craphound-1.acbf", library])
+    names = ["broken.cbz", "craphound-1.acbf", "craphound-0.acbf", "craphound-2.acbf"]
+    assert paths == [str(library / x) for x in names]
+    with pytest.raises(FileNotFoundError):
+        batch.expand_paths([library / "*.cbr"])
+
+
+def test_fields(library):
+    record = batch.scan([library / "craphound-0.acbf"], fields=["book_title"]).records[0]
+    assert record.book_title == read_record(library / "craphound-0.acbf").book_title
+    assert record.authors is None
+
+    with pytest.raises(ValueError):
+        batch.scan([library], fields=["nope"])
+
+
+def test_catalog_workers(library):
+    with Catalog() as catalog:
+        result = catalog.scan(library, workers=2)
+        assert (result.added, len(result.failed)) == (3, 1)
+        assert len(catalog) == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_verify(library, make_book, workers):
+    make_book(library / "book.cbz", ("cover.jpg",))
+
+    results = batch.verify([library], workers=workers)
+    assert [x.path for x in results] == batch.expand_paths([library])
+    failures = {x.path: x.failures for x in results if x.failures}
+    assert list(failures) == [str(library / "broken.cbz")]
+    assert failures[str(library / "broken.cbz")][0].name is None
+
+
+@pytest.mark.parametrize("workers, chunksize", [(1, 1), (2, 1), (2, 3)])
+def test_iter_pool(library, workers, chunksize):
+    paths = batch.expand_paths([library])
+    results = list(batch.iter_pool(batch.verify_book, paths, workers, (1,), chunksize))
+    assert sorted(x.path for x in results) == sorted(paths)
+    assert [x.path for x in results if x.failures] == [str(library / "broken.cbz")]
@@ -1,6 +1,8 @@
 import json
+import pytest
 from pathlib import Path
 from libacbf import ACBFBook
+from libacbf.body import Page
 
 
 def test_pages(results_body):
@@ -22,6 +24,31 @@ def test_pages(results_body):
         book.body.pages[0].title["en"] = "First Page"
 
 
+def test_lazy_pages(samples):
+    with ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf") as book:
+        pages = book.body.pages
+        assert len(pages) == 23
+        assert not any(isinstance(x, Page) for x in pages._items)
+
+        page = pages[4]
+        assert page._element is not None
+        assert len(page.frames) > 0 and set(page.text_layers) == {"en", "sk"}
+        assert page._element is None
+        assert sum(isinstance(x, Page) for x in pages._items) == 1
+
+
+def test_language_filter(samples):
+    with ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf", languages=["sk"]) as book:
+        page = book.body.pages[4]
+        assert set(page.text_layers) == {"sk"}
+        assert page.list_text_layers() == {"en", "sk"}
+        assert set(page.load_text_layers("en")) == {"en", "sk"}
+        assert len(page.text_layers["en"].text_areas) > 0
+
+    with pytest.raises(ValueError):
+        ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf", 'a', languages=["sk"])
+
+
 def test_images(results_body, results, samples):
     with ACBFBook(results_body / "test_images.cbz", 'w') as book:
         book.book_info.book_title['_'] = "Test Image Ref"
@@ -1,5 +1,6 @@
+import io
 import pytest
-from libacbf import ACBFBook
+from libacbf import ACBFBook, convert, get_cover
 from libacbf.exceptions import InvalidBook
 
 
@@ -9,6 +10,83 @@ def test_no_acbf(results):
             pass
 
 
+def test_read_sources(samples):
+    path = samples / "Doctorow, Cory - Craphound-1.1.acbf"
+    with open(path, "rb") as file:
+        contents = file.read()
+
+    utf16 = contents.replace(b"encoding='utf-8'", b"encoding='utf-16'").decode("utf-8").encode("utf-16")
+
+    titles = []
+    for source in (path, str(path), io.BytesIO(contents), io.BytesIO(utf16)):
+        with ACBFBook(source) as book:
+            titles.append(book.book_info.book_title)
+
+    assert all(x == {"sk": "Craphound (Zberač)", "en": "Craphound"} for x in titles)
+
+
+def test_lazy_sections(samples):
+    with ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf") as book:
+        assert book.book_info.book_title["en"] == "Craphound"
+        assert not any(x in vars(book) for x in ("body", "data", "references"))
+        assert len(book.body.pages) == 23
+
+
+def test_metadata_only(samples):
+    path = samples / "Doctorow, Cory - Craphound-1.1.acbf"
+    with open(path, "rb") as file:
+        # Anything after the metadata is never read
+        contents = file.read().replace(b"</meta-data>", b"</meta-data><broken", 1)
+
+    book_info, publisher_info, document_info = ACBFBook.read_metadata(io.BytesIO(contents))
+
+    with ACBFBook(path) as book:
+        assert book_info.book_title == book.book_info.book_title
+        assert book_info.languages[1].lang == book.book_info.languages[1].lang
+        assert publisher_info.publisher == book.publisher_info.publisher
+        assert document_info.creation_date == book.document_info.creation_date
+
+    with ACBFBook(path, metadata_only=True) as book:
+        with pytest.raises(ValueError):
+            book.body
+
+    with pytest.raises(InvalidBook):
+        ACBFBook.read_metadata(io.BytesIO(b"<ACBF></ACBF>"))
+
+
+def test_cover(samples, make_book, tmp_path):
+    cover = (samples / "cover.jpg").read_bytes()
+    assert get_cover(samples / "Doctorow, Cory - Craphound-1.1.acbf").data == cover
+
+    path = make_book(tmp_path / "embedded.cbz", ("#page1.jpg", "#page2.jpg"), "#cover.jpg")
+    image = get_cover(path)
+    assert image.is_embedded and image.type == "image/jpeg" and image.data == cover
+
+
+@pytest.mark.parametrize("ext, type", (("cbz", "Zip"), ("cb7", "SevenZip"), ("cbt", "Tar")))
+def test_iter_page_images(ext, type, samples, make_book, tmp_path):
+    pages = [f"page{i}.jpg" for i in range(1, 6)] + ["#page6.jpg"]
+    path = make_book(tmp_path / f"book.{ext}", pages, None, type)
+
+    with ACBFBook(path) as book:
+        refs = [x.image_ref for x in book.body.pages]
+        for order, prefetch in (("reading", 0), ("archive", 0), ("archive", 2)):
+            seen = []
+            for page, image in book.iter_page_images(order, prefetch):
+                assert image.data == (samples / page.image_ref.lstrip('#')).read_bytes()
+                seen.append(page.image_ref)
+            assert seen == refs if order == "reading" else sorted(seen) == sorted(refs)
+            assert seen[-1] == "#page6.jpg"
+
+        images = book.iter_page_images("archive", 2)
+        next(images)
+        images.close()
+        assert all(x._image is None for x in book.body.pages)
+
+        with pytest.raises(ValueError):
+            next(book.iter_page_images("random"))
+
+
 def test_references(results_book):
     with ACBFBook(results_book / "test_references.acbf", 'w', archive_type=None) as book:
         book.book_info.book_title['_'] = "Test Edit references"
@@ -62,3 +140,17 @@ def test_styles(results_book, samples):
         book.styles.remove_style("REMOVE_ME.css", embedded=True)
 
         book._create_placeholders()
+
+
+def test_fingerprint(archives, tmp_path):
+    convert(archives / "book.cbz", tmp_path / "book.cb7", "SevenZip")
+    convert(archives / "book.cbz", tmp_path / "copy.cbz", "Zip", "store")
+
+    with ACBFBook(archives / "book.cbz") as book, ACBFBook(tmp_path / "book.cb7") as seven, \
+            ACBFBook(tmp_path / "copy.cbz") as copy:
+        assert book.fingerprint() == seven.fingerprint() == copy.fingerprint()
+
+    with ACBFBook(tmp_path / "copy.cbz", 'a') as book:
+        book.book_info.book_title['_'] = "Changed"
+    with ACBFBook(tmp_path / "copy.cbz") as changed, ACBFBook(archives / "book.cbz") as book:
+        assert changed.fingerprint() != book.fingerprint()
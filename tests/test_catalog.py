@@ -0,0 +1,51 @@
+import shutil
+import pytest
+from libacbf.catalog import Catalog, read_record
+
+
+@pytest.fixture
+def library(samples, tmp_path):
+    shutil.copy(samples / "Doctorow, Cory - Craphound-1.1.acbf", tmp_path / "craphound.acbf")
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "broken.cbz").write_bytes(b"Not a book")
+    (tmp_path / "notes.txt").write_text("Not indexed")
+    return tmp_path
+
+
+def test_scan(library, tmp_path):
+    book = str(library / "craphound.acbf")
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        result = catalog.scan(library)
+        assert (result.added, result.updated, result.unchanged, result.removed) == (1, 0, 0, 0)
+        assert list(result.failed) == [str(library / "broken" / "broken.cbz")]
+        assert catalog.get(book) == read_record(book)
+
+        # Unchanged files and known failures are skipped
+        result = catalog.scan(library)
+        assert (result.added, result.unchanged, result.failed) == (0, 2, {})
+
+        (library / "broken" / "broken.cbz").unlink()
+        assert catalog.scan(library).removed == 0
+        assert catalog.failures() == {}
+
+    with Catalog(tmp_path / "catalog.db") as catalog:
+        assert len(catalog) == 1
+        (library / "craphound.acbf").unlink()
+        assert catalog.scan(library).removed == 1
+        assert book not in catalog
+
+
+def test_queries(library):
+    with Catalog() as catalog:
+        catalog.scan(library)
+        series = "Cory Doctorow's Futuristic Tales of the Here and Now"
+
+        books = catalog.by_series(series.lower())
+        assert [x.series[series].sequence for x in books] == ['3']
+        assert len(catalog.by_author("Cory Doctorow")) == 1
+        assert len(catalog.by_author("DOCTOROW")) == 1
+        assert catalog.by_author("Cory Doctorow", document=True) == []
+        assert len(catalog.by_genre("science_fiction", min_match=90)) == 1
+        assert len(catalog.by_title("Zberač")) == 1
+        assert len(catalog.by_keyword("Craphound")) == 1
+        assert catalog.by_genre("manga") == []
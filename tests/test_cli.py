@@ -0,0 +1,57 @@
+import json
+import pytest
+from libacbf.archivereader import ArchiveReader
+from libacbf.cli import main
+
+
+@pytest.fixture
+def library(make_book, tmp_path):
+    make_book(tmp_path / "book.cbt", ("cover.jpg",), type="Tar", title="Tar Book")
+    (tmp_path / "broken.cbz").write_bytes(b"Not a book")
+    return tmp_path
+
+
+def run(capsys, *args):
+    status = main([str(x) for x in args])
+    out, err = capsys.readouterr()
+    return status, [json.loads(x) for x in out.splitlines()], err
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate(library, capsys, jobs):
+    status, results, err = run(capsys, "validate", library, "--json", "--jobs", jobs)
+    assert status == 1
+    expected = {str(library / "book.cbt"): True, str(library / "broken.cbz"): False}
+    assert {x["path"]: x["ok"] for x in results} == expected
+    assert "2 books, 1 ok, 1 failed" in err
+
+
+def test_info(library, capsys):
+    status, results, _ = run(capsys, "info", library / "*.cbt", "--json")
+    assert status == 0
+    assert results[0]["metadata"]["book_title"] == {'_': "Tar Book"}
+
+
+def test_convert(library, capsys, tmp_path):
+    status, results, _ = run(capsys, "convert", library / "book.cbt", "--to", "zip", "-o", tmp_path / "out", "--json")
+    assert status == 0
+    with ArchiveReader(results[0]["output"]) as archive:
+        assert archive.list_files() == {"book.acbf", "cover.jpg"}
+
+    status, _, _ = run(capsys, "convert", library / "book.cbt", "--to", "zip", "-o", tmp_path / "out", "--json")
+    assert status == 1
+
+
+def test_extract_cover(library, capsys, samples):
+    status, results, _ = run(capsys, "extract-cover", library / "book.cbt", "--json")
+    assert status == 0
+    assert results[0]["output"] == str(library / "book.jpg")
+    assert (library / "book.jpg").read_bytes() == (samples / "cover.jpg").read_bytes()
+
+
+def test_verify(library, capsys):
+    status, results, err = run(capsys, "verify", library, "--json", "--threads", 2)
+    assert status == 1
+    results = {x["path"]: x for x in results}
+    assert results[str(library / "book.cbt")]["ok"]
+    assert results[str(library / "broken.cbz")]["failures"][0]["name"] is None
@@ -0,0 +1,88 @@
+import re
+import pytest
+from lxml import etree
+from libacbf import helpers
+
+
+def legacy_tree_to_para(p_root, nsmap):
+    pa = []
+    for p in p_root.findall("p", namespaces=nsmap):
+        p_text = etree.tostring(p, encoding="utf-8").decode("utf-8").strip()
+        text = re.sub(r'</?p[^>]*>', '', p_text)
+        pa.append(text)
+    return '\n'.join(pa)
+
+
+def legacy_para_to_tree(paragraph, nsmap):
+    ns = nsmap[None]
+    p_elements = []
+    for p in re.split(r'\n', paragraph):
+        p = f"<p>{p}</p>"
+        p_root = etree.fromstring(p)
+        for i in p_root.iter():
+            i.tag = f"{{{ns}}}" + i.tag
+        p_elements.append(p_root)
+    return p_elements
+
+
+@pytest.fixture(scope="module")
+def text_areas(samples):
+    root = etree.parse(str(samples / "Doctorow, Cory - Craphound-1.1.acbf")).getroot()
+    return root.nsmap, list(root.iter(f"{{{root.nsmap[None]}}}text-area"))
+
+
+def serialize(p_elements, nsmap):
+    area = etree.Element(f"{{{nsmap[None]}}}text-area", nsmap=nsmap)
+    area.extend(p_elements)
+    return etree.tostring(area, encoding="utf-8")
+
+
+def test_para_codec(text_areas):
+    nsmap, areas = text_areas
+    for ta in areas:
+        text = helpers.tree_to_para(ta, nsmap)
+        assert text == legacy_tree_to_para(ta, nsmap)
+        assert serialize(helpers.para_to_tree(text, nsmap), nsmap) == \
+               serialize(legacy_para_to_tree(text, nsmap), nsmap)
+
+
+def test_para_codec_markup():
+    nsmap = {None: helpers.namespaces["1.1"]}
+    text = "Plain & <strong>strong</strong>\n\n<emphasis>a <sub>b</sub></emphasis> c\n" \
+           '<a href="ref_001">link</a> 1 &lt; 2'
+    area = etree.Element(f"{{{nsmap[None]}}}text-area", nsmap=nsmap)
+    area.extend(helpers.para_to_tree(text.replace(" & ", " &amp; "), nsmap))
+    assert helpers.tree_to_para(area, nsmap) == legacy_tree_to_para(area, nsmap)
+    assert helpers.tree_to_para(area, nsmap) == text.replace(" & ", " &amp; ")
+
+
+def test_strtobool():
+    assert helpers.strtobool("True") is True
+    assert helpers.strtobool("off") is False
+    with pytest.raises(ValueError):
+        helpers.strtobool("maybe")
+
+
+def test_prefetch():
+    consumed = 0
+    ahead = []
+
+    def numbers():
+        for i in range(10):
+            ahead.append(i - consumed)
+            yield i
+
+    result = []
+    for item in helpers.prefetch(numbers(), 2):
+        result.append(item)
+        consumed += 1
+    assert result == list(range(10))
+    # Each item is only produced after the consumer takes the item `size` places before it
+    assert max(ahead) <= 2
+
+    def broken():
+        yield 1
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        list(helpers.prefetch(broken(), 1))
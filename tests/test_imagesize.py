@@ -0,0 +1,34 @@
+import io
+import pytest
+from libacbf import ACBFBook
+from libacbf.imagesize import get_image_size
+
+
+@pytest.mark.parametrize("format, options", (("JPEG", {}), ("JPEG", {"progressive": True}), ("PNG", {}),
+                                             ("GIF", {}), ("WEBP", {}), ("WEBP", {"lossless": True}),
+                                             ("WEBP", {"exif": b"Exif\x00\x00"}), ("AVIF", {})))
+def test_formats(format, options):
+    Image = pytest.importorskip("PIL.Image")
+    file = io.BytesIO()
+    try:
+        Image.new("RGB", (333, 217)).save(file, format, **options)
+    except KeyError:
+        pytest.skip(f"Pillow cannot write {format}")
+
+    assert get_image_size(file.getvalue()) == (333, 217)
+    file.seek(0)
+    assert get_image_size(file) == (333, 217)
+
+
+def test_invalid():
+    assert get_image_size(b"Not an image") is None
+    assert get_image_size(b"\xff\xd8\xff\xe0\x00\x10JFIF") is None
+
+
+def test_page_size(make_book, tmp_path):
+    path = make_book(tmp_path / "book.cbz", ("page1.jpg", "#page20.jpg", "page1.jpg"))
+
+    with ACBFBook(path) as book:
+        assert book.body.image_sizes() == [(1000, 1537), (994, 1528), (1000, 1537)]
+        assert book.book_info.coverpage.image_size == (994, 1528)
+        assert len(book._image_sizes) == 3
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from pathlib import Path
+
+root = Path(__file__).parent.parent
+
+backends = ("py7zr", "rarfile", "magic", "requests", "langcodes", "dateutil", "distutils")
+
+
+def loaded_modules(code):
+    proc = subprocess.run([sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+                          cwd=root, capture_output=True, text=True, check=True)
+    return set(proc.stdout.split())
+
+
+def test_lazy_backends(samples):
+    modules = loaded_modules("import libacbf")
+    assert modules.isdisjoint(backends)
+
+    # Reading a plain ACBF file or a Zip archive does not need any archive backend
+    modules = loaded_modules(f"import libacbf\n"
+                             f"with libacbf.ACBFBook({str(samples / 'Doctorow, Cory - Craphound-1.1.acbf')!r}) as b:\n"
+                             f"    b.body.pages[0].text_layers\n"
+                             f"    b.book_info.languages")
+    assert "py7zr" not in modules
+    assert "rarfile" not in modules
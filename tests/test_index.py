@@ -0,0 +1,83 @@
+import pytest
+from libacbf import ACBFBook
+from libacbf.archivereader import ArchiveReader
+from libacbf.body import Frame
+from libacbf.index import INDEX_NAME
+
+
+def make_indexed(make_book, path, type):
+    make_book(path, type=type, title=type)
+    with ACBFBook(path, 'a', type, write_index=True) as book:
+        book.body.bgcolor = "#000000"
+        book.body.pages[2].title['_'] = "Last"
+        book.body.pages[2].frames.append(Frame([(0, 0), (1, 0), (1, 1)]))
+
+
+@pytest.mark.parametrize("ext, type", (("cbz", "Zip"), ("cb7", "SevenZip"), ("cbt", "Tar")))
+def test_index(ext, type, samples, make_book, tmp_path):
+    path = tmp_path / f"book.{ext}"
+    make_indexed(make_book, path, type)
+
+    with ArchiveReader(path) as arc:
+        assert INDEX_NAME in arc.list_files()
+
+    with ACBFBook(path) as book:
+        index = book.index
+        assert index is not None
+        assert book._partial
+        assert index.page_count == 3
+        assert index.coverpage == "cover.jpg"
+        assert [x.href for x in index.pages] == ["cover.jpg", "page1.jpg", "page2.jpg"]
+        assert all(x.member is not None for x in index.pages)
+        assert book.book_info.book_title['_'] == type
+        assert book._partial
+        assert [x.image_ref for x in book.body.pages] == ["cover.jpg", "page1.jpg", "page2.jpg"]
+        assert book.body.pages[1].image.data == (samples / "page1.jpg").read_bytes()
+        assert book.body.pages[2].title['_'] == "Last"
+        assert book.body.bgcolor == "#000000"
+        assert book._partial
+        assert len(book.body.pages[2].frames) == 1
+        assert not book._partial
+
+    # Modified without writing the index again
+    with ACBFBook(path, 'a', type) as book:
+        book.body.pages[0].title['_'] = "Cover"
+    with ACBFBook(path) as book:
+        assert book.index is None
+        assert book.body.pages[0].title['_'] == "Cover"
+
+
+def test_stale(samples, make_book, tmp_path):
+    path = tmp_path / "book.cbz"
+    make_indexed(make_book, path, "Zip")
+
+    with ArchiveReader(path, 'w') as arc:
+        arc.write((samples / "page2.jpg").read_bytes(), "page1.jpg")
+    with ArchiveReader(path) as arc:
+        assert INDEX_NAME in arc.list_files()
+    with ACBFBook(path) as book:
+        assert book.index is None
+        assert len(book.body.pages) == 3
+
+
+def test_validation(make_book, tmp_path, monkeypatch):
+    path = tmp_path / "book.cbz"
+    make_indexed(make_book, path, "Zip")
+
+    validated = []
+    monkeypatch.setattr("libacbf.libacbf._validate_acbf", lambda tree, ns: validated.append(ns))
+    with ACBFBook(path) as book:
+        assert validated == []
+        book.body.pages[2].frames
+        assert len(validated) == 1
+
+    with ACBFBook(path, use_index=False) as book:
+        assert book.index is None and not book._partial
+        assert len(validated) == 2
+
+
+def test_read_mode(samples, tmp_path):
+    with pytest.raises(ValueError):
+        ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf", write_index=True)
+    with pytest.raises(ValueError):
+        ACBFBook(tmp_path / "book.acbf", 'w', None, write_index=True)
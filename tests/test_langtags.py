@@ -0,0 +1,24 @@
+from libacbf import ACBFBook, langtags
+
+
+def test_cache():
+    langtags.cache_clear()
+    assert langtags.standardize_tag("eng") == "en"
+    assert langtags.standardize_tag("eng") is langtags.standardize_tag("en")
+    info = langtags.cache_info()
+    assert info.hits == 1 and info.misses == 2
+
+
+def test_backend(samples):
+    try:
+        langtags.set_backend(None)
+        assert langtags.get_backend() is None
+        assert langtags.standardize_tag("eng") == "eng"
+
+        langtags.set_backend(str.upper)
+        with ACBFBook(samples / "Doctorow, Cory - Craphound-1.1.acbf") as book:
+            assert set(book.body.pages[0].text_layers) <= {"EN", "SK", "IT", "RU", "DE"}
+            assert all(x.lang.isupper() for x in book.book_info.languages)
+    finally:
+        langtags.set_backend(langtags.default_backend)
+    assert langtags.standardize_tag("eng") == "en"
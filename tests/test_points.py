@@ -0,0 +1,50 @@
+import pytest
+from libacbf.helpers import pts_to_vec, vec_to_pts
+from libacbf.points import Points
+
+
+def test_pts_to_vec():
+    pts = pts_to_vec("0,0 10,-5  +3,7")
+    assert isinstance(pts, Points)
+    assert pts == [(0, 0), (10, -5), (3, 7)]
+    assert pts[-1] == (3, 7)
+    assert vec_to_pts(pts) == "0,0 10,-5 3,7"
+
+
+@pytest.mark.parametrize("pts_str, pos", (
+    ('', 0), ("1,2 3", 4), ("1,2 x,3", 4), ("1,2,3 4,5", 0), ("1,2  4;5", 5), ("1,2 99999999999,1", 4),
+    ("1,-99999999999", 0)
+    ))
+def test_pts_to_vec_invalid(pts_str, pos):
+    with pytest.raises(ValueError, match=f"position {pos} "):
+        pts_to_vec(pts_str)
+
+
+def test_points_list():
+    pts = Points([(0, 0), (0, 1)])
+    pts.append((1, 1))
+    pts.insert(0, (5, 5))
+    pts[1] = (2, 2)
+    del pts[0]
+    assert pts == [(2, 2), (0, 1), (1, 1)]
+    assert pts[1:] == Points([(0, 1), (1, 1)])
+    assert pts.pop() == (1, 1)
+    assert list(pts) == [(2, 2), (0, 1)]
+
+
+def test_points_geometry():
+    pts = Points([(0, 0), (0, 10), (10, 10), (10, 0)])
+    assert pts.bbox() == (0, 0, 10, 10)
+    assert pts.area() == 100
+    assert pts.translate(5, -5) == [(5, -5), (5, 5), (15, 5), (15, -5)]
+    assert pts.scale(0.5, 2) == [(0, 0), (0, 20), (5, 20), (5, 0)]
+    assert pts.to_str() == "0,0 0,10 10,10 10,0"
+
+
+def test_points_coerced():
+    from libacbf.body import Frame, TextArea
+
+    fr = Frame([(0, 0), (1, 1)])
+    ta = TextArea("Text", [(2, 2)])
+    assert isinstance(fr.points, Points) and isinstance(ta.points, Points)
+    assert vec_to_pts(fr.points) == vec_to_pts([(0, 0), (1, 1)]) == "0,0 1,1"
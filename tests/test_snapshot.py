@@ -0,0 +1,89 @@
+import os
+import shutil
+import pytest
+from libacbf import ACBFBook
+from libacbf.body import Frame
+from libacbf.snapshot import SnapshotCache
+
+
+def contents(book):
+    pages = []
+    for page in book.body.pages:
+        layers = {x: [(a.text, list(a.points), a.type, a.inverted) for a in y.text_areas]
+                  for x, y in page.text_layers.items()}
+        pages.append((page.image_ref, page.ref_type, page.title, page.transition, layers,
+                      [list(x.points) for x in page.frames], [(x.target, list(x.points)) for x in page.jumps]))
+    return book.book_info.book_title, book.body.bgcolor, pages
+
+
+@pytest.fixture
+def book_path(samples, tmp_path):
+    path = tmp_path / "book.acbf"
+    shutil.copy(samples / "Doctorow, Cory - Craphound-1.1.acbf", path)
+    return path
+
+
+def test_snapshot(book_path, tmp_path):
+    cache = SnapshotCache(tmp_path / "cache")
+    assert cache.load(book_path) is None
+
+    with cache.open(book_path) as book:
+        expected = contents(book)
+    assert cache.path(book_path).is_file()
+
+    book = cache.load(book_path)
+    assert book is not None
+    with book:
+        assert book.mode == 'r'
+        assert contents(book) == expected
+
+    # Modified books do not use the old snapshot
+    stat = book_path.stat()
+    os.utime(book_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.load(book_path) is None
+
+
+def test_archive(samples, make_book, tmp_path):
+    path = make_book(tmp_path / "book.cbz", ("page1.jpg",), None)
+
+    cache = SnapshotCache(tmp_path / "cache")
+    with ACBFBook(path) as book:
+        cache.save(book)
+    with cache.load(path) as book:
+        assert book.archive._members is not None
+        assert book.body.pages[0].image.data == (samples / "page1.jpg").read_bytes()
+
+
+def test_indexed(make_book, tmp_path):
+    path = make_book(tmp_path / "book.cbz", ("page1.jpg",), None)
+    with ACBFBook(path, 'a', write_index=True) as book:
+        book.data.add_data(b"p { color: red; }", "style.css", embed=True)
+        book.styles.edit_style(b"p { color: blue; }", "_")
+        book.references["ref"] = {'_': "A reference."}
+        book.body.pages[0].frames.append(Frame([(0, 0), (1, 0), (1, 1)]))
+
+    cache = SnapshotCache(tmp_path / "cache")
+    with ACBFBook(path) as book:
+        assert book._partial
+        expected = contents(book)
+        cache.save(book)
+
+    with cache.load(path) as book:
+        assert book._root is None
+        assert contents(book) == expected
+        assert book.references == {"ref": {'_': "A reference."}}
+        assert book.styles['_'] == b"p { color: blue; }"
+        assert book._root is None
+        assert book.data["style.css"].data == b"p { color: red; }"
+
+
+def test_invalid(book_path, tmp_path):
+    cache = SnapshotCache(tmp_path / "cache")
+    os.makedirs(cache.path(book_path).parent)
+    cache.path(book_path).write_bytes(b"LACBFSNP\x00\x00\x00\x00garbage")
+    assert cache.load(book_path) is None
+    cache.path(book_path).write_bytes(b"LACBFSNP\x01\x00\x00\x00garbage")
+    assert cache.load(book_path) is None
+
+    with ACBFBook(book_path, metadata_only=True) as book, pytest.raises(ValueError):
+        cache.save(book)
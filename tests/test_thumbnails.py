@@ -0,0 +1,38 @@
+import pytest
+from libacbf import ACBFBook
+
+Image = pytest.importorskip("PIL.Image")
+thumbnails = pytest.importorskip("libacbf.thumbnails")
+
+
+@pytest.fixture(scope="module")
+def book(make_book, tmp_path_factory):
+    pages = [f"page{i}.jpg" for i in range(1, 5)] + ["#page5.jpg"]
+    return make_book(tmp_path_factory.mktemp("thumbnails") / "book.cbz", pages)
+
+
+def test_cache(book, tmp_path):
+    cache = thumbnails.ThumbnailCache(tmp_path, "WEBP")
+    with ACBFBook(book) as bk:
+        assert thumbnails.ThumbnailCache.source_key(bk.body.pages[0]).startswith("crc32-")
+        assert thumbnails.ThumbnailCache.source_key(bk.body.pages[4]).startswith("sha256-")
+
+        path = cache.get(bk.book_info.coverpage, "small")
+        mtime = path.stat().st_mtime_ns
+        assert cache.get(bk.book_info.coverpage, "small") == path
+        assert path.stat().st_mtime_ns == mtime
+
+        with Image.open(path) as image:
+            assert image.format == "WEBP"
+            assert image.width <= 160 and image.height <= 240
+
+        assert cache.get(bk.body.pages[4], (50, 50)) != cache.get(bk.body.pages[4], "small")
+
+
+def test_generate(book, tmp_path):
+    paths = thumbnails.generate_thumbnails(book, tmp_path, "small", workers=2)
+    assert list(paths) == [None, 0, 1, 2, 3, 4]
+    assert paths == thumbnails.generate_thumbnails(book, tmp_path, "small", workers=1)
+    for path in paths.values():
+        with Image.open(path) as image:
+            assert image.format == "JPEG"
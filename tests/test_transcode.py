@@ -0,0 +1,52 @@
+import pytest
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+from libacbf import ACBFBook, convert
+from libacbf.archivereader import ArchiveReader
+from libacbf.exceptions import EditRARArchiveError
+
+
+@pytest.mark.parametrize("src", ("cbz", "cb7", "cbt"))
+@pytest.mark.parametrize("dst, type", (("cbz", "Zip"), ("cb7", "SevenZip"), ("cbt", "Tar")))
+def test_convert(src, dst, type, archives, tmp_path):
+    convert(archives / f"book.{src}", tmp_path / f"book.{dst}", type)
+
+    with ArchiveReader(archives / f"book.{src}") as source, ArchiveReader(tmp_path / f"book.{dst}") as result:
+        assert result.type.name == type
+        assert result.list_members()[0].name == "book.acbf"
+        assert result.list_files() == source.list_files()
+        for i in source.list_files():
+            assert result.read(i) == source.read(i)
+
+    with ACBFBook(tmp_path / f"book.{dst}") as book:
+        assert book.book_info.book_title['_'] == {"cbz": "Zip", "cb7": "SevenZip", "cbt": "Tar"}[src]
+        assert len(book.body.pages) == 3
+
+
+def test_policy(archives, tmp_path):
+    convert(archives / "book.cbt", tmp_path / "auto.cbz")
+    with ZipFile(tmp_path / "auto.cbz") as arc:
+        assert {x.filename: x.compress_type for x in arc.infolist()} == {
+            "book.acbf": ZIP_DEFLATED, "cover.jpg": ZIP_STORED, "page1.jpg": ZIP_STORED, "page2.jpg": ZIP_STORED
+            }
+
+    convert(archives / "book.cbt", tmp_path / "store.cbz", compression_policy="store")
+    with ZipFile(tmp_path / "store.cbz") as arc:
+        assert {x.compress_type for x in arc.infolist()} == {ZIP_STORED}
+
+    with pytest.raises(ValueError):
+        convert(archives / "book.cbt", tmp_path / "fail.cbz", compression_policy="lzma")
+    with pytest.raises(EditRARArchiveError):
+        convert(archives / "book.cbt", tmp_path / "fail.cbr", "Rar")
+
+
+def test_acbf(samples, archives, tmp_path):
+    acbf = (samples / "Doctorow, Cory - Craphound-1.1.acbf").read_bytes()
+    convert(archives / "book.cbz", tmp_path / "book.cbt", "Tar", acbf=acbf)
+    with ArchiveReader(tmp_path / "book.cbt") as arc:
+        assert arc.read("book.acbf") == acbf
+        assert arc.read("page1.jpg") == (samples / "page1.jpg").read_bytes()
+
+    convert(samples / "Doctorow, Cory - Craphound-1.1.acbf", tmp_path / "plain.cbz")
+    with ACBFBook(tmp_path / "plain.cbz") as book:
+        assert book.archive.list_files() == {"Doctorow, Cory - Craphound-1.1.acbf"}
+        assert len(book.body.pages) == 23